@@ -0,0 +1,442 @@
+"""In-process stand-ins for Bedrock, AgentCore Memory, the Gateway and Cognito.
+
+Every fake sleeps for a tunable latency and records the time it spent under a stage
+name, so a benchmark run can break request latency down per backend.
+"""
+
+import asyncio
+import base64
+import contextvars
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage
+from mcp.types import Tool as MCPTool
+from strands.models.model import Model
+from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
+
+from agentcore_agents.agent import clear_memory_ids
+from agentcore_agents.gateway.routing import clear_gateway_routers
+from agentcore_agents.memory.recall import clear_recall_indexes
+from agentcore_agents.memory.session import clear_sessions
+from agentcore_agents.models import clear_models
+from agentcore_agents.tools.resilience import clear_tool_resilience
+
+TOOL_SCHEMA_PATH = Path(__file__).parent.parent / "src/agentcore_agents/lambda/tool_schema.json"
+GATEWAY_TARGET_PREFIX = "AgentTools___"
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Mean latency in seconds per fake backend call, with uniform +/- jitter."""
+
+    model: float = 0.400
+    memory_control: float = 0.080
+    memory_read: float = 0.060
+    memory_write: float = 0.040
+    # Creating a boto3 session and client, and its first TLS handshake
+    memory_client: float = 0.030
+    gateway_control: float = 0.100
+    gateway_connect: float = 0.120
+    list_tools: float = 0.050
+    tool_call: float = 0.150
+    cognito: float = 0.100
+    jitter: float = 0.2
+
+    def sample(self, stage: str) -> float:
+        mean = getattr(self, stage)
+        return max(0.0, mean * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+@dataclass
+class StageSample:
+    """Per-request stage timings, in seconds."""
+
+    durations: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    counts: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self.lock:
+            self.durations[stage] += seconds
+            self.counts[stage] += 1
+
+
+_current_sample: contextvars.ContextVar[StageSample | None] = contextvars.ContextVar(
+    "benchmark_stage_sample", default=None
+)
+
+
+@contextmanager
+def collect_stages() -> Iterator[StageSample]:
+    sample = StageSample()
+    token = _current_sample.set(sample)
+    try:
+        yield sample
+    finally:
+        _current_sample.reset(token)
+
+
+def _record(stage: str, seconds: float) -> None:
+    sample = _current_sample.get()
+    if sample is not None:
+        sample.add(stage, seconds)
+
+
+def _sleep(profile: LatencyProfile, stage: str) -> None:
+    delay = profile.sample(stage)
+    time.sleep(delay)
+    _record(stage, delay)
+
+
+async def _sleep_async(profile: LatencyProfile, stage: str) -> None:
+    delay = profile.sample(stage)
+    await asyncio.sleep(delay)
+    _record(stage, delay)
+
+
+def make_access_token(actor_id: str, username: str | None = None) -> str:
+    def encode(data: dict[str, Any]) -> str:
+        raw = base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("utf-8")
+        return raw.rstrip("=")
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": actor_id, "username": username or actor_id})
+    return f"{header}.{payload}.signature"
+
+
+class FakeCognito:
+    def __init__(self, profile: LatencyProfile) -> None:
+        self.profile = profile
+
+    def get_user_token(self, actor_id: str) -> dict[str, str]:
+        _sleep(self.profile, "cognito")
+        access_token = make_access_token(actor_id)
+        return {"access_token": access_token, "id_token": access_token, "token_type": "Bearer"}
+
+
+class FakeMemoryStore:
+    """Shared event store backing every fake memory session."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.events: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        self.next_event_id = 0
+
+    def append(
+        self,
+        actor_id: str,
+        session_id: str,
+        payload: list[dict[str, Any]],
+        metadata: dict[str, Any] | None = None,
+    ) -> str:
+        with self.lock:
+            self.next_event_id += 1
+            event_id = f"event-{self.next_event_id}"
+            self.events[(actor_id, session_id)].append(
+                {
+                    "eventId": event_id,
+                    "eventTimestamp": datetime.now(UTC),
+                    "payload": payload,
+                    "metadata": metadata or {},
+                }
+            )
+            return event_id
+
+    def list_events(
+        self, actor_id: str, session_id: str, metadata: dict[str, str], max_results: int
+    ) -> list[dict[str, Any]]:
+        # Newest first, like ListEvents
+        with self.lock:
+            events = [
+                event
+                for event in reversed(self.events.get((actor_id, session_id), []))
+                if all(
+                    event["metadata"].get(key, {}).get("stringValue") == value
+                    for key, value in metadata.items()
+                )
+            ]
+        return events[:max_results]
+
+    def delete_event(self, actor_id: str, session_id: str, event_id: str) -> None:
+        with self.lock:
+            events = self.events[(actor_id, session_id)]
+            events[:] = [event for event in events if event["eventId"] != event_id]
+
+    def last_k_turns(self, actor_id: str, session_id: str, k: int) -> list[list[dict[str, Any]]]:
+        with self.lock:
+            events = list(self.events.get((actor_id, session_id), []))
+
+        turns: list[list[dict[str, Any]]] = []
+        for event in events:
+            for item in event["payload"]:
+                if "conversational" not in item:
+                    continue
+                message = item["conversational"]
+                if message["role"] == "USER" or not turns:
+                    turns.append([])
+                turns[-1].append(message)
+        return turns[-k:]
+
+
+class FakeMemorySession:
+    def __init__(
+        self, store: FakeMemoryStore, profile: LatencyProfile, actor_id: str, session_id: str
+    ) -> None:
+        self.store = store
+        self.profile = profile
+        self.actor_id = actor_id
+        self.session_id = session_id
+
+    def get_last_k_turns(self, k: int = 5, **kwargs: Any) -> list[list[dict[str, Any]]]:
+        _sleep(self.profile, "memory_read")
+        return self.store.last_k_turns(self.actor_id, self.session_id, k)
+
+    def list_events(
+        self,
+        eventMetadata: list[dict[str, Any]] | None = None,  # noqa: N803
+        max_results: int = 100,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        _sleep(self.profile, "memory_read")
+        metadata = {
+            f["left"]["metadataKey"]: f["right"]["metadataValue"]["stringValue"]
+            for f in eventMetadata or []
+        }
+        return self.store.list_events(self.actor_id, self.session_id, metadata, max_results)
+
+    def add_turns(
+        self,
+        messages: list[ConversationalMessage | BlobMessage],
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        _sleep(self.profile, "memory_write")
+        payload = [
+            {"blob": m.data}
+            if isinstance(m, BlobMessage)
+            else {"conversational": {"role": m.role.value, "content": {"text": m.text}}}
+            for m in messages
+        ]
+        event_id = self.store.append(self.actor_id, self.session_id, payload, metadata)
+        return {"eventId": event_id}
+
+    def delete_event(self, event_id: str) -> None:
+        _sleep(self.profile, "memory_write")
+        self.store.delete_event(self.actor_id, self.session_id, event_id)
+
+
+@dataclass
+class FakeMemory:
+    id: str
+
+
+class FakeMemoryManager:
+    def __init__(self, profile: LatencyProfile, region: str = "eu-central-1") -> None:
+        self.profile = profile
+        self.region = region
+
+    def get_or_create_memory(
+        self, name: str, description: str = "", event_expiry_days: int = 30
+    ) -> object:
+        _sleep(self.profile, "memory_control")
+        return FakeMemory(id=f"{name}-fake")
+
+
+class FakeSessionManager:
+    def __init__(
+        self,
+        store: FakeMemoryStore,
+        profile: LatencyProfile,
+        memory_id: str,
+        region_name: str = "eu-central-1",
+    ) -> None:
+        _sleep(profile, "memory_client")
+        self.store = store
+        self.profile = profile
+        self.memory_id = memory_id
+        self.region_name = region_name
+
+    def create_memory_session(self, actor_id: str, session_id: str) -> FakeMemorySession:
+        return FakeMemorySession(self.store, self.profile, actor_id, session_id)
+
+
+def _tool_result_text(name: str, arguments: dict[str, Any]) -> str:
+    if name == "calculator":
+        return "84"
+    if name == "get_current_time":
+        return time.strftime("%Y-%m-%d %H:%M:%S")
+    if name == "read_s3_document":
+        key = arguments.get("key") or ""
+        if not key:
+            return "Files in s3://fake-bucket/root:\n- report.txt (2048 bytes)"
+        return f"Contents of {key}: " + "lorem ipsum " * 64
+    return f"Unknown tool: {name}"
+
+
+class FakeMCPClient:
+    """Stands in for `MCPClient`, serving the Lambda tool schema through the Gateway."""
+
+    def __init__(self, profile: LatencyProfile, transport_callable: Any = None) -> None:
+        self.profile = profile
+        self.transport_callable = transport_callable
+
+    def __enter__(self) -> "FakeMCPClient":
+        _sleep(self.profile, "gateway_connect")
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+    def list_tools_sync(self, *args: Any, **kwargs: Any) -> list[MCPAgentTool]:
+        _sleep(self.profile, "list_tools")
+        with TOOL_SCHEMA_PATH.open() as f:
+            schema = json.load(f)
+        return [
+            MCPAgentTool(
+                MCPTool(
+                    name=f"{GATEWAY_TARGET_PREFIX}{tool['name']}",
+                    description=tool["description"],
+                    inputSchema=tool["inputSchema"],
+                ),
+                self,  # type: ignore[arg-type]
+            )
+            for tool in schema["tools"]
+        ]
+
+    async def call_tool_async(
+        self, tool_use_id: str, name: str, arguments: dict[str, Any] | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        await _sleep_async(self.profile, "tool_call")
+        tool_name = name.removeprefix(GATEWAY_TARGET_PREFIX)
+        return {
+            "status": "success",
+            "toolUseId": tool_use_id,
+            "content": [{"text": _tool_result_text(tool_name, arguments or {})}],
+        }
+
+
+class FakeGatewaySetup:
+    def __init__(self, profile: LatencyProfile, region: str | None = None) -> None:
+        self.profile = profile
+        self.region = region or "eu-central-1"
+
+    def get_gateway_info(self, gateway_name: str | None = None) -> dict:
+        _sleep(self.profile, "gateway_control")
+        return {
+            "gateway_id": "fake-gateway",
+            "gateway_url": "https://fake-gateway.local/mcp",
+            "gateway_name": gateway_name or "AgentGateway",
+            "region": self.region,
+        }
+
+
+def plan_tool_calls(prompt: str) -> list[tuple[str, dict[str, Any]]]:
+    """Decide which tools the fake model calls for a prompt, by keyword."""
+    text = prompt.lower()
+    if "three documents" in text:
+        return [("read_s3_document", {"key": f"doc-{i}.txt"}) for i in range(3)]
+    if "calculate" in text:
+        return [("calculator", {"expression": "12 * 7"})]
+    if "time" in text:
+        return [("get_current_time", {})]
+    if "document" in text:
+        return [("read_s3_document", {"key": "report.txt"})]
+    return []
+
+
+class FakeBedrockModel(Model):
+    """Scripted model: calls the tools a prompt asks for, then answers in plain text."""
+
+    def __init__(self, profile: LatencyProfile, **model_config: Any) -> None:
+        self.profile = profile
+        self.config = dict(model_config)
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        return self.config
+
+    def structured_output(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError("FakeBedrockModel does not support structured output")
+
+    async def stream(
+        self,
+        messages: Any,
+        tool_specs: list[Any] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        await _sleep_async(self.profile, "model")
+
+        last_message = messages[-1] if messages else {"content": []}
+        answered_tools = any("toolResult" in block for block in last_message["content"])
+        prompt = " ".join(block.get("text", "") for block in last_message["content"])
+        calls = [] if answered_tools else plan_tool_calls(prompt)
+        spec_names = [spec["name"] for spec in tool_specs or []]
+
+        yield {"messageStart": {"role": "assistant"}}
+        for index, (tool_name, arguments) in enumerate(calls):
+            name = next((n for n in spec_names if n.endswith(tool_name)), tool_name)
+            start = {"toolUse": {"toolUseId": f"tooluse-{index}", "name": name}}
+            yield {"contentBlockStart": {"start": start}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(arguments)}}}}
+            yield {"contentBlockStop": {}}
+
+        if not calls:
+            yield {"contentBlockDelta": {"delta": {"text": "Here is the answer you asked for."}}}
+            yield {"contentBlockStop": {}}
+
+        yield {"messageStop": {"stopReason": "tool_use" if calls else "end_turn"}}
+        yield {
+            "metadata": {
+                "usage": {"inputTokens": 400, "outputTokens": 40, "totalTokens": 440},
+                "metrics": {"latencyMs": 0},
+            }
+        }
+
+
+def install_fakes(stack: ExitStack, profile: LatencyProfile) -> FakeMemoryStore:
+    """Patch every remote backend used by `runtime_handler.invoke` with an in-process fake."""
+    store = FakeMemoryStore()
+
+    patches = {
+        "agentcore_agents.models.BedrockModel": lambda **kwargs: FakeBedrockModel(
+            profile, **kwargs
+        ),
+        "agentcore_agents.agent.AgentMemoryManager": lambda **kwargs: FakeMemoryManager(
+            profile, **kwargs
+        ),
+        "agentcore_agents.memory.session.MemorySessionManager": lambda **kwargs: (
+            FakeSessionManager(store, profile, **kwargs)
+        ),
+        "agentcore_agents.gateway.connection.MCPClient": lambda transport: FakeMCPClient(
+            profile, transport
+        ),
+        "runtime_handler.GatewaySetup": lambda **kwargs: FakeGatewaySetup(profile, **kwargs),
+    }
+    for target, replacement in patches.items():
+        stack.enter_context(mock.patch(target, replacement))
+    # Shared models and the memory id outlive an agent; never mix real and fake ones
+    for clear in (
+        clear_models,
+        clear_memory_ids,
+        clear_recall_indexes,
+        clear_sessions,
+        clear_gateway_routers,
+        clear_tool_resilience,
+    ):
+        clear()
+        stack.callback(clear)
+    return store
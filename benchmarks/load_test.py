@@ -0,0 +1,316 @@
+"""Load test for `runtime_handler.invoke` against in-process fake backends.
+
+Example:
+    uv run benchmarks/load_test.py --requests 200 --concurrency 16 \
+        --mix chat=0.4,calculator=0.2,time=0.1,document=0.2,multi_document=0.1
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).parent.parent
+os.environ.setdefault("TRACING__RETURN_TIMINGS", "true")
+os.environ.setdefault("TRACING__LOG_TIMINGS", "false")
+# Backends are patched after runtime_handler is imported; pre-warming would hit real ones
+os.environ.setdefault("RUNTIME__PREWARM_ON_START", "false")
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from fakes import (  # noqa: E402
+    FakeCognito,
+    LatencyProfile,
+    StageSample,
+    collect_stages,
+    install_fakes,
+)
+from loguru import logger  # noqa: E402
+
+PROMPTS = {
+    "chat": "Hello, what can you help me with?",
+    "calculator": "Can you calculate 12 times 7?",
+    "time": "What time is it right now?",
+    "document": "Can you read the report document in the S3 bucket?",
+    "multi_document": "Please read three documents from the S3 bucket and compare them.",
+}
+
+DEFAULT_MIX = "chat=0.4,calculator=0.2,time=0.1,document=0.2,multi_document=0.1"
+
+
+@dataclass
+class RequestResult:
+    kind: str
+    latency: float
+    ok: bool
+    stages: dict[str, float] = field(default_factory=dict)
+    stage_counts: dict[str, int] = field(default_factory=dict)
+    spans: dict[str, float] = field(default_factory=dict)
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights: dict[str, float] = {}
+    for item in mix.split(","):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in PROMPTS:
+            raise ValueError(f"Unknown request kind '{kind}'. Choose from: {', '.join(PROMPTS)}")
+        weights[kind] = float(weight or 1)
+    return weights
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def latency_stats(values: list[float]) -> dict[str, float]:
+    return {
+        "mean_ms": statistics.fmean(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": max(values, default=0.0) * 1000,
+    }
+
+
+def build_result(
+    kind: str, latency: float, response: dict[str, Any], sample: StageSample
+) -> RequestResult:
+    spans = response.get("timings", {}).get("stages", {})
+    return RequestResult(
+        kind=kind,
+        latency=latency,
+        ok="error" not in response,
+        stages=dict(sample.durations),
+        stage_counts=dict(sample.counts),
+        spans={name: stats["total_ms"] / 1000 for name, stats in spans.items()},
+    )
+
+
+def run_request(invoke: Any, kind: str, token: str, session_id: str) -> RequestResult:
+    payload = {"prompt": PROMPTS[kind], "session_id": session_id, "bearer_token": token}
+    with collect_stages() as sample:
+        start = time.perf_counter()
+        response = invoke(payload, None)
+        latency = time.perf_counter() - start
+    return build_result(kind, latency, response, sample)
+
+
+def run_threaded(
+    invoke: Any, jobs: list[tuple[str, str, str]], concurrency: int
+) -> list[RequestResult]:
+    results: list[RequestResult] = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(run_request, invoke, *job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+
+async def run_event_loop(
+    invoke_async: Any, jobs: list[tuple[str, str, str]], concurrency: int
+) -> list[RequestResult]:
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def run_one(kind: str, token: str, session_id: str) -> RequestResult:
+        payload = {"prompt": PROMPTS[kind], "session_id": session_id, "bearer_token": token}
+        async with limiter:
+            with collect_stages() as sample:
+                start = time.perf_counter()
+                response = await invoke_async(payload, None)
+                latency = time.perf_counter() - start
+        return build_result(kind, latency, response, sample)
+
+    return list(await asyncio.gather(*(run_one(*job) for job in jobs)))
+
+
+def summarize(results: list[RequestResult], wall_time: float) -> dict[str, Any]:
+    latencies = [r.latency for r in results if r.ok]
+    stage_names = sorted({stage for r in results for stage in r.stages})
+
+    by_kind = {
+        kind: latency_stats([r.latency for r in results if r.ok and r.kind == kind])
+        for kind in sorted({r.kind for r in results})
+    }
+    stages = {
+        stage: {
+            **latency_stats([r.stages.get(stage, 0.0) for r in results if r.ok]),
+            "calls_per_request": statistics.fmean(r.stage_counts.get(stage, 0) for r in results),
+        }
+        for stage in stage_names
+    }
+    span_names = sorted({name for r in results for name in r.spans})
+    spans = {
+        name: latency_stats([r.spans.get(name, 0.0) for r in results if r.ok])
+        for name in span_names
+    }
+
+    return {
+        "requests": len(results),
+        "errors": sum(1 for r in results if not r.ok),
+        "wall_time_s": wall_time,
+        "requests_per_second": len(results) / wall_time if wall_time else 0.0,
+        "latency": latency_stats(latencies),
+        "latency_by_kind": by_kind,
+        "stages": stages,
+        "spans": spans,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(summary: dict[str, Any], baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text())["summary"]
+    logger.info(f"Comparison against {baseline_path}:")
+    for metric in ("p50_ms", "p95_ms", "p99_ms"):
+        before = baseline["latency"][metric]
+        after = summary["latency"][metric]
+        change = (after - before) / before * 100 if before else 0.0
+        logger.info(f"  {metric}: {before:.1f} -> {after:.1f} ({change:+.1f}%)")
+    before_rps = baseline["requests_per_second"]
+    after_rps = summary["requests_per_second"]
+    logger.info(f"  requests/s: {before_rps:.2f} -> {after_rps:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test runtime_handler.invoke with fakes")
+    parser.add_argument("--requests", type=int, default=100, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent in-flight requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Request mix as kind=weight pairs")
+    parser.add_argument("--actors", type=int, default=10, help="Distinct actors (Cognito users)")
+    parser.add_argument("--sessions", type=int, default=20, help="Distinct sessions")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Drive invoke_async on one event loop instead of invoke from a thread pool",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for mix and jitter")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Scale all fake latency")
+    parser.add_argument("--model-latency-ms", type=float, help="Override fake model latency")
+    parser.add_argument("--tool-latency-ms", type=float, help="Override fake tool call latency")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    parser.add_argument("--compare", type=Path, help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    defaults = LatencyProfile()
+    overrides = {
+        name: getattr(defaults, name) * args.latency_scale
+        for name in LatencyProfile.__dataclass_fields__
+        if name != "jitter"
+    }
+    if args.model_latency_ms is not None:
+        overrides["model"] = args.model_latency_ms / 1000
+    if args.tool_latency_ms is not None:
+        overrides["tool_call"] = args.tool_latency_ms / 1000
+    profile = LatencyProfile(**overrides)
+
+    mix = parse_mix(args.mix)
+    kinds = random.choices(list(mix), weights=list(mix.values()), k=args.requests)
+
+    cognito = FakeCognito(profile)
+    tokens = [cognito.get_user_token(f"actor-{i}")["access_token"] for i in range(args.actors)]
+
+    with ExitStack() as stack:
+        install_fakes(stack, profile)
+        stack.enter_context(redirect_stdout(io.StringIO()))
+        import runtime_handler
+
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+        jobs = [
+            (kind, tokens[i % args.actors], f"session-{i % args.sessions}")
+            for i, kind in enumerate(kinds)
+        ]
+        start = time.perf_counter()
+        if args.use_async:
+            results = asyncio.run(
+                run_event_loop(runtime_handler.invoke_async, jobs, args.concurrency)
+            )
+        else:
+            results = run_threaded(runtime_handler.invoke, jobs, args.concurrency)
+        wall_time = time.perf_counter() - start
+
+        logger.remove()
+        logger.add(sys.stderr, level="INFO")
+
+    summary = summarize(results, wall_time)
+    revision = git_revision()
+    report = {
+        "revision": revision,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "async": args.use_async,
+            "mix": mix,
+            "actors": args.actors,
+            "sessions": args.sessions,
+            "seed": args.seed,
+            "latency_profile": asdict(profile),
+        },
+        "summary": summary,
+    }
+
+    output = args.output or ROOT / "benchmarks/results" / f"load_test-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    latency = summary["latency"]
+    logger.info(
+        f"{summary['requests']} requests, {summary['errors']} errors, "
+        f"{summary['requests_per_second']:.2f} req/s"
+    )
+    logger.info(
+        f"Latency p50={latency['p50_ms']:.1f}ms p95={latency['p95_ms']:.1f}ms "
+        f"p99={latency['p99_ms']:.1f}ms"
+    )
+    for stage, stats in summary["stages"].items():
+        logger.info(
+            f"  {stage:<16} mean={stats['mean_ms']:8.1f}ms p95={stats['p95_ms']:8.1f}ms "
+            f"calls/request={stats['calls_per_request']:.2f}"
+        )
+    for name, stats in summary["spans"].items():
+        logger.info(
+            f"  span {name:<24} mean={stats['mean_ms']:8.1f}ms p95={stats['p95_ms']:8.1f}ms"
+        )
+    logger.info(f"Results written to {output}")
+
+    if args.compare:
+        compare(summary, args.compare)
+
+
+if __name__ == "__main__":
+    main()
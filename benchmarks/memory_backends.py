@@ -0,0 +1,170 @@
+"""Compare the AgentCore and SQLite memory backends on the agent's access pattern.
+
+Every simulated turn does what one invocation does to memory: read the last k turns
+and the summary records when the agent starts, then store the user and assistant
+messages one at a time. Sessions run concurrently on a thread pool. The AgentCore
+backend is the in-process fake with its latency profile, or with --live the
+configured AgentCore Memory.
+
+Example:
+    uv run benchmarks/memory_backends.py --sessions 20 --turns 30 --threads 8
+    uv run benchmarks/memory_backends.py --live --sessions 4 --turns 5
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from bedrock_agentcore.memory.constants import ConversationalMessage, MessageRole  # noqa: E402
+from fakes import FakeMemoryStore, FakeSessionManager, LatencyProfile  # noqa: E402
+from load_test import git_revision, latency_stats  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from agentcore_agents.agent import resolve_memory_id  # noqa: E402
+from agentcore_agents.config import settings  # noqa: E402
+from agentcore_agents.memory.backend import MemoryBackend, SessionMemory  # noqa: E402
+from agentcore_agents.memory.session import AgentSessionManager  # noqa: E402
+from agentcore_agents.memory.sqlite import SQLiteMemoryBackend  # noqa: E402
+from agentcore_agents.memory.summary import _summary_filter  # noqa: E402
+
+type Timings = dict[str, list[float]]
+
+
+class FakeAgentCoreBackend:
+    def __init__(self, profile: LatencyProfile) -> None:
+        self.manager = FakeSessionManager(FakeMemoryStore(), profile, memory_id="benchmark")
+
+    def get_or_create_session(self, actor_id: str, session_id: str) -> SessionMemory:
+        return self.manager.create_memory_session(actor_id, session_id)
+
+
+def run_session(backend: MemoryBackend, session_id: str, turns: int, k: int) -> Timings:
+    timings: Timings = defaultdict(list)
+
+    def timed(operation: str, call: Any, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        result = call(*args, **kwargs)
+        timings[operation].append(time.perf_counter() - started)
+        return result
+
+    for turn in range(turns):
+        memory = timed("session_create", backend.get_or_create_session, "benchmark", session_id)
+        timed("get_last_k_turns", memory.get_last_k_turns, k=k)
+        timed("list_summary", memory.list_events, eventMetadata=_summary_filter(), max_results=10)
+        for role, text in (
+            (MessageRole.USER, f"Question {turn}: what is {turn} times 7?"),
+            (MessageRole.ASSISTANT, f"Answer {turn}: {turn} times 7 is {turn * 7}."),
+        ):
+            timed("add_turns", memory.add_turns, [ConversationalMessage(text, role)])
+    return timings
+
+
+def run_backend(
+    backend: MemoryBackend, sessions: int, turns: int, k: int, threads: int
+) -> dict[str, Any]:
+    run_id = uuid.uuid4().hex[:8]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(
+            executor.map(
+                lambda i: run_session(backend, f"benchmark-{run_id}-{i}", turns, k),
+                range(sessions),
+            )
+        )
+    wall_time = time.perf_counter() - started
+
+    merged: Timings = defaultdict(list)
+    for timings in results:
+        for operation, values in timings.items():
+            merged[operation].extend(values)
+    operations = sum(len(values) for values in merged.values())
+    return {
+        "wall_time_s": wall_time,
+        "operations_per_second": operations / wall_time if wall_time else 0.0,
+        "turn_ms": sum(map(sum, merged.values())) / (sessions * turns) * 1000,
+        "operations": {operation: latency_stats(values) for operation, values in merged.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the memory backends")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent sessions")
+    parser.add_argument("--turns", type=int, default=30, help="Turns per session")
+    parser.add_argument("--k", type=int, default=10, help="Turns read when an agent starts")
+    parser.add_argument("--threads", type=int, default=8, help="Sessions run at a time")
+    parser.add_argument(
+        "--live", action="store_true", help="Use the configured AgentCore Memory, not the fake"
+    )
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Scale fake latency")
+    parser.add_argument("--sqlite-path", type=Path, help="Database file (default: a temp file)")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    defaults = LatencyProfile()
+    profile = LatencyProfile(
+        **{
+            name: getattr(defaults, name) * args.latency_scale
+            for name in LatencyProfile.__dataclass_fields__
+            if name != "jitter"
+        }
+    )
+    agentcore: MemoryBackend
+    if args.live:
+        agentcore = AgentSessionManager(memory_id=resolve_memory_id(), region=settings.aws.region)
+    else:
+        agentcore = FakeAgentCoreBackend(profile)
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+    report: dict[str, Any] = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "sessions": args.sessions,
+            "turns": args.turns,
+            "k": args.k,
+            "threads": args.threads,
+            "live": args.live,
+            "latency_profile": None if args.live else asdict(profile),
+        },
+        "backends": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite = SQLiteMemoryBackend(args.sqlite_path or Path(tmp) / "memory.db")
+        for name, backend in (("agentcore", agentcore), ("sqlite", sqlite)):
+            summary = run_backend(backend, args.sessions, args.turns, args.k, args.threads)
+            report["backends"][name] = summary
+            logger.info(
+                f"{name}: {summary['operations_per_second']:.0f} ops/s, "
+                f"{summary['turn_ms']:.1f}ms of memory time per turn"
+            )
+            for operation, stats in summary["operations"].items():
+                logger.info(
+                    f"  {operation:<18} mean={stats['mean_ms']:8.2f}ms "
+                    f"p95={stats['p95_ms']:8.2f}ms p99={stats['p99_ms']:8.2f}ms"
+                )
+
+    output = (
+        args.output or ROOT / "benchmarks/results" / f"memory_backends-{report['revision']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
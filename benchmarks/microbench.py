@@ -0,0 +1,293 @@
+"""Microbenchmarks of pure-Python hot paths, checked against baselines in the repo.
+
+Every benchmark is timed with timeit in rounds alternating with a fixed reference
+workload, and compared by its median ratio to the reference, so baselines recorded
+on one machine still apply on another. The run fails when a benchmark's relative time
+exceeds its baseline by more than --tolerance. Nothing here calls AWS: S3 is
+stubbed and the Gateway schema is read from the repo.
+
+Example:
+    uv run benchmarks/microbench.py
+    uv run benchmarks/microbench.py --filter lambda --tolerance 0.5
+    uv run benchmarks/microbench.py --update
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_BASELINE = ROOT / "benchmarks/baselines/microbench.json"
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+# The Lambda module creates its S3 client on import
+os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage  # noqa: E402
+from bedrock_agentcore.memory.models.filters import EventMetadataFilter, MetadataValue  # noqa: E402
+from fakes import make_access_token  # noqa: E402
+from loguru import logger  # noqa: E402
+from strands.hooks import AgentInitializedEvent  # noqa: E402
+
+from agentcore_agents.auth.cognito import compute_secret_hash  # noqa: E402
+from agentcore_agents.auth.user_identity import (  # noqa: E402
+    decode_jwt_payload,
+    extract_user_identity,
+)
+from agentcore_agents.gateway.setup import GatewaySetup  # noqa: E402
+from agentcore_agents.memory.hooks import MemoryHookProvider, history_messages  # noqa: E402
+from agentcore_agents.observability.logs import configure_logging  # noqa: E402
+from agentcore_agents.observability.tracing import StageTracer  # noqa: E402
+
+handler = importlib.import_module("agentcore_agents.lambda.handler")
+
+HISTORY_TURNS = 500
+DOCUMENT = ("Quarterly revenue grew in every region. " * 100).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    run: Callable[[], object]
+
+
+class StubS3:
+    """The two S3 calls the Lambda tools make, served from memory."""
+
+    class exceptions:  # noqa: N801
+        NoSuchKey = type("NoSuchKey", (Exception,), {})
+
+    def __init__(self, documents: dict[str, bytes]) -> None:
+        self.documents = documents
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if Key not in self.documents:
+            raise self.exceptions.NoSuchKey(Key)
+        return {"Body": io.BytesIO(self.documents[Key]), "ContentType": "text/plain"}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str, Delimiter: str) -> dict[str, Any]:  # noqa: N803
+        return {
+            "Contents": [
+                {"Key": key, "Size": len(data)}
+                for key, data in self.documents.items()
+                if key.startswith(Prefix)
+            ]
+        }
+
+
+class StoredTurns:
+    """A session memory that only serves its stored turns, like a warm history read."""
+
+    def __init__(self, turns: list[list[dict[str, Any]]]) -> None:
+        self.turns = turns
+
+    def get_last_k_turns(self, k: int = 5) -> list[list[Any]]:
+        return self.turns[-k:]
+
+    def add_turns(
+        self,
+        messages: list[ConversationalMessage | BlobMessage],
+        *,
+        metadata: dict[str, MetadataValue] | None = None,
+    ) -> Any:
+        raise NotImplementedError
+
+    def list_events(
+        self,
+        *,
+        eventMetadata: list[EventMetadataFilter] | None = None,  # noqa: N803
+        max_results: int = 100,
+    ) -> list[Any]:
+        return []
+
+    def delete_event(self, event_id: str) -> Any:
+        raise NotImplementedError
+
+
+def lambda_context(tool_name: str) -> Any:
+    custom = {"bedrockAgentCoreToolName": f"AgentTools___{tool_name}"}
+    return SimpleNamespace(client_context=SimpleNamespace(custom=custom))
+
+
+def invoke(event: dict[str, Any], context: Any) -> Callable[[], object]:
+    return lambda: handler.lambda_handler(event, context)
+
+
+def memory_turns(count: int) -> list[list[dict[str, Any]]]:
+    return [
+        [
+            {"role": "USER", "content": {"text": f"Question {i}: what changed in report {i}?"}},
+            {"role": "ASSISTANT", "content": {"text": f"Report {i} shows revenue up {i}%. " * 4}},
+        ]
+        for i in range(count)
+    ]
+
+
+def reference() -> object:
+    # Fixed mix of interpreter and C work the benchmarks are measured against
+    data = {"items": [{"id": i, "name": f"item-{i}"} for i in range(20)]}
+    decoded = json.loads(json.dumps(data))
+    return sorted((item["name"] for item in decoded["items"]), reverse=True)
+
+
+def build_benchmarks() -> list[Benchmark]:
+    token = make_access_token("2f1c6e8a-actor", "benchmark-user")
+    s3 = StubS3({f"reports/report-{i:03d}.txt": DOCUMENT for i in range(100)})
+    setattr(handler, "s3_client", s3)  # noqa: B010
+    events: dict[str, dict[str, Any]] = {
+        "calculator": {"expression": "(12 * 7) + 3 / 4"},
+        "get_current_time": {},
+        "read_s3_document": {"bucket": "documents", "key": "reports/report-042.txt"},
+        "read_s3_document_list": {"bucket": "documents"},
+        "unknown_tool": {},
+    }
+    contexts = {
+        name: lambda_context("read_s3_document" if name == "read_s3_document_list" else name)
+        for name in events
+    }
+
+    turns = memory_turns(HISTORY_TURNS)
+    hook = MemoryHookProvider(
+        memory_session=StoredTurns(turns),
+        actor_id="actor",
+        session_id="session",
+        tracer=StageTracer(enabled=False),
+        cache_history=True,
+        recent_turns=HISTORY_TURNS,
+    )
+    agent: Any = SimpleNamespace(messages=[])
+
+    def load_history() -> None:
+        # Each load replaces the history the previous one inserted
+        hook.on_agent_initialized(AgentInitializedEvent(agent=agent))
+
+    # load_tool_schema reads a path relative to the repo root and needs no clients
+    gateway_setup = GatewaySetup.__new__(GatewaySetup)
+
+    return [
+        Benchmark("auth.decode_jwt_payload", lambda: decode_jwt_payload(token)),
+        Benchmark("auth.extract_user_identity", lambda: extract_user_identity(token)),
+        Benchmark(
+            "auth.compute_secret_hash",
+            lambda: compute_secret_hash("client-id", "client-secret", "benchmark-user"),
+        ),
+        *(
+            Benchmark(f"lambda.{name}", invoke(event, contexts[name]))
+            for name, event in events.items()
+        ),
+        Benchmark(f"memory.history_messages_{HISTORY_TURNS}", lambda: history_messages(turns)),
+        Benchmark(f"memory.load_history_{HISTORY_TURNS}", load_history),
+        Benchmark("gateway.load_tool_schema", gateway_setup.load_tool_schema),
+    ]
+
+
+def calibrated(run: Callable[[], object]) -> tuple[timeit.Timer, int]:
+    """A timer of `run` and a call count taking about 50ms."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return timer, max(1, number // 4)
+
+
+def measure(
+    run: Callable[[], object], reference_timer: tuple[timeit.Timer, int], rounds: int
+) -> dict[str, float]:
+    """Best time of one call in nanoseconds, and the median ratio to the reference.
+
+    The reference is timed right after the benchmark in every round, so a change of
+    CPU speed or load during the run affects both sides of each ratio alike.
+    """
+    timer, number = calibrated(run)
+    reference, reference_number = reference_timer
+    times, ratios = [], []
+    for _ in range(rounds):
+        elapsed = timer.timeit(number) / number
+        reference_elapsed = reference.timeit(reference_number) / reference_number
+        times.append(elapsed)
+        ratios.append(elapsed / reference_elapsed)
+    return {"ns": min(times) * 1e9, "relative": statistics.median(ratios)}
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        expected = baseline["benchmarks"].get(name)
+        if expected is None:
+            logger.info(f"  {name:<36} {result['ns']:>12.0f}ns  (no baseline)")
+            continue
+        change = result["relative"] / expected["relative"] - 1
+        status = "REGRESSED" if change > tolerance else "ok"
+        logger.info(f"  {name:<36} {result['ns']:>12.0f}ns  {change:+7.1%}  {status}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the microbenchmarks against baselines")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown, e.g. 0.25 for 25%%"
+    )
+    parser.add_argument("--rounds", type=int, default=9, help="Timing rounds per benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this")
+    parser.add_argument("--update", action="store_true", help="Write the results as baseline")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    configure_logging()
+    logging.disable(logging.CRITICAL)  # the Lambda module's error logs
+
+    benchmarks = [b for b in build_benchmarks() if args.filter in b.name]
+    reference_timer = calibrated(reference)
+    # The Lambda handler prints a metrics record per call; writing it stays in the timing
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = {
+            benchmark.name: measure(benchmark.run, reference_timer, args.rounds)
+            for benchmark in benchmarks
+        }
+
+    if args.update:
+        previous = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            # A filtered run only replaces the baselines it measured
+            "benchmarks": {**previous.get("benchmarks", {}), **results},
+        }
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        for name, result in results.items():
+            logger.info(f"  {name:<36} {result['ns']:>12.0f}ns")
+        logger.info(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        logger.error(f"No baseline at {args.baseline}; run with --update to record one")
+        sys.exit(1)
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    if regressions:
+        logger.error(f"{len(regressions)} benchmarks regressed beyond {args.tolerance:.0%}")
+        sys.exit(1)
+    logger.info(f"All {len(results)} benchmarks within {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,88 +1,264 @@
+import asyncio
+import json
 import sys
+import time
+import weakref
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+# Cold-start timing starts before the heavy imports below
+_process_started = time.perf_counter()
+
 # Add src directory to Python path so agentcore_agents can be imported
 src_path = Path(__file__).parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-from agentcore_agents.agent import StrandsAgentWrapper
+from agentcore_agents.admission import AdmissionRejected, admission
+from agentcore_agents.agent import StrandsAgentWrapper, get_memory_backend
 from agentcore_agents.auth.user_identity import extract_user_identity
 from agentcore_agents.config import settings
+from agentcore_agents.gateway.routing import get_gateway_router
 from agentcore_agents.gateway.setup import GatewaySetup
+from agentcore_agents.models import configured_model_ids, get_model, warm_up_models
+from agentcore_agents.observability.logs import configure_logging
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.startup import StartupWarmer
 from bedrock_agentcore.runtime.app import BedrockAgentCoreApp
+from bedrock_agentcore.runtime.models import PingStatus
+
+configure_logging()
+
+FALLBACK_GATEWAY_URL = (
+    "https://agentgateway-3sqyxtamyl.gateway.bedrock-agentcore.eu-central-1.amazonaws.com/mcp"
+)
+
+warmer = StartupWarmer(started_at=_process_started)
+warmer.record_stage("imports", time.perf_counter() - _process_started)
+
+# Gateway URLs found through the API, keyed by gateway name
+_gateway_urls: dict[str, str] = {}
+
+_configured_loops: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+
+
+def get_bearer_token(payload: dict[str, Any], context: Any) -> str | None:
+    # Get bearer token from request headers
+    bearer_token = None
+    if hasattr(context, "request_headers") and isinstance(context.request_headers, dict):
+        auth_header = context.request_headers.get("Authorization") or context.request_headers.get(
+            "authorization"
+        )
+        if auth_header and isinstance(auth_header, str) and auth_header.startswith("Bearer "):
+            bearer_token = auth_header[7:]
+
+    if not bearer_token:
+        bearer_token = payload.get("bearer_token") or payload.get("access_token")
+    return bearer_token
+
+
+def resolve_gateway_urls(tracer: StageTracer) -> list[str]:
+    # Gateway endpoints - configured endpoints and URL first, then query API, then fallback
+    configured = [*settings.gateway.endpoints, *filter(None, [settings.gateway.gateway_url])]
+    if configured:
+        return list(dict.fromkeys(configured))
+    gateway_mcp_url = _gateway_urls.get(settings.gateway.name)
+    if gateway_mcp_url:
+        return [gateway_mcp_url]
+
+    try:
+        with tracer.span("runtime.gateway_lookup"):
+            setup = GatewaySetup()
+            gateway_info = setup.get_gateway_info(settings.gateway.name)
+        gateway_mcp_url = _gateway_urls[settings.gateway.name] = gateway_info["gateway_url"]
+        logger.info(f"Retrieved Gateway URL from API: {gateway_mcp_url}")
+    except Exception as e:
+        logger.warning(f"Could not get Gateway URL from API: {e}")
+        gateway_mcp_url = FALLBACK_GATEWAY_URL
+        logger.info(f"Using fallback Gateway URL: {gateway_mcp_url}")
+    return [gateway_mcp_url]
+
+
+def prewarm_gateway() -> None:
+    # Starts probing the endpoints, so the first request already connects to the best one
+    get_gateway_router(resolve_gateway_urls(StageTracer(enabled=False)))
 
-app = BedrockAgentCoreApp()
+
+def prewarm_tasks() -> dict[str, Any]:
+    def warm_models() -> None:
+        if settings.model.warm_up_on_start:
+            warm_up_models()
+        else:
+            for model_id in configured_model_ids():
+                get_model(model_id)
+
+    # The MCP tool list needs the caller's bearer token, so it is not pre-warmed
+    return {
+        "gateway_url": prewarm_gateway,
+        "memory": get_memory_backend,
+        "models": warm_models,
+    }
+
+
+if settings.runtime.prewarm_on_start:
+    warmer.start(prewarm_tasks())
+else:
+    warmer.start({})
+
+
+@asynccontextmanager
+async def lifespan(_app: Any) -> AsyncIterator[None]:
+    # Hold off serving until warm, but never longer than the configured timeout
+    if not await asyncio.to_thread(warmer.wait, settings.runtime.prewarm_timeout_seconds):
+        logger.warning("Pre-warm still running, starting to serve requests anyway")
+    yield
+
+
+app = BedrockAgentCoreApp(lifespan=lifespan)
+
+
+@app.ping
+def ping() -> PingStatus | None:
+    # Busy until warm; afterwards None falls back to the app's automatic status
+    return None if warmer.ready else PingStatus.HEALTHY_BUSY
+
+
+def finish_invocation(
+    response: dict[str, Any], tracer: StageTracer, started: float
+) -> dict[str, Any]:
+    warmer.record_request(time.perf_counter() - started)
+    timings = tracer.summary()
+    if settings.tracing.log_timings:
+        logger.info("Invocation timings: {}", timings)
+    if settings.tracing.return_timings:
+        response["timings"] = {**timings, "metrics": metrics.report()}
+    if metrics.export_due(settings.tracing.metrics_log_interval_seconds):
+        logger.info("Metrics: {}", json.dumps(metrics.report(), default=str))
+    return response
+
+
+def rejection_response(rejection: AdmissionRejected) -> dict[str, Any]:
+    return {
+        "error": "Too many requests, please retry later",
+        "reason": rejection.reason,
+        "retry_after_seconds": round(rejection.retry_after, 1),
+    }
 
 
-@app.entrypoint
 def invoke(payload: dict[str, Any], context: Any) -> dict[str, Any]:
+    started = time.perf_counter()
+    tracer = StageTracer()
     try:
         prompt = payload.get("prompt", "")
-        
-        # Get bearer token from request headers
-        bearer_token = None
-        if hasattr(context, "request_headers") and isinstance(context.request_headers, dict):
-            auth_header = (
-                context.request_headers.get("Authorization")
-                or context.request_headers.get("authorization")
-            )
-            if auth_header and isinstance(auth_header, str) and auth_header.startswith("Bearer "):
-                bearer_token = auth_header[7:]
-        
-        if not bearer_token:
-            bearer_token = payload.get("bearer_token") or payload.get("access_token")
-        
+
+        bearer_token = get_bearer_token(payload, context)
         if not bearer_token:
             logger.error("No bearer token found in request")
             return {"error": "Authentication required. Please provide a bearer token"}
-        
-        logger.info("Bearer token found, proceeding with agent creation")
-        
+
+        logger.debug("Bearer token found, proceeding with agent creation")
+
         # Extract user identity from token (same as test files)
         user_identity = extract_user_identity(bearer_token)
         actor_id = user_identity["actor_id"]
         session_id = payload.get("session_id") or settings.memory.session_id
 
-        logger.info(f"Creating agent for actor_id={actor_id}, session_id={session_id}")
-
-        # Get Gateway URL - try from config/env first, then query API, then fallback
-        gateway_mcp_url = settings.gateway.gateway_url
-        
-        if not gateway_mcp_url:
-            try:
-                setup = GatewaySetup()
-                gateway_info = setup.get_gateway_info(settings.gateway.name)
-                gateway_mcp_url = gateway_info["gateway_url"]
-                logger.info(f"Retrieved Gateway URL from API: {gateway_mcp_url}")
-            except Exception as e:
-                logger.warning(f"Could not get Gateway URL from API: {e}")
-                gateway_mcp_url = "https://agentgateway-3sqyxtamyl.gateway.bedrock-agentcore.eu-central-1.amazonaws.com/mcp"
-                logger.info(f"Using fallback Gateway URL: {gateway_mcp_url}")
-        
-        if not gateway_mcp_url:
-            return {"error": "Gateway URL not configured"}
-
-        # Use same token for Gateway access (same as test files)
-        with StrandsAgentWrapper(
-            actor_id=actor_id,
-            session_id=session_id,
-            use_gateway=True,
-            gateway_url=gateway_mcp_url,
-            access_token=bearer_token,  # Same token from user
-        ) as agent:
-            response = agent.run(prompt)
-            return response
+        with admission.admit(actor_id):
+            logger.info("Creating agent for actor_id={}, session_id={}", actor_id, session_id)
+
+            gateway_urls = resolve_gateway_urls(tracer)
+
+            # Use same token for Gateway access (same as test files)
+            with StrandsAgentWrapper(
+                actor_id=actor_id,
+                session_id=session_id,
+                use_gateway=True,
+                gateway_url=gateway_urls,
+                access_token=bearer_token,  # Same token from user
+                tracer=tracer,
+            ) as agent:
+                response = agent.run(
+                    prompt,
+                    use_tool_cache=payload.get("use_tool_cache", True),
+                    use_response_cache=payload.get("use_response_cache", True),
+                )
+
+        return finish_invocation(response, tracer, started)
+    except AdmissionRejected as e:
+        return rejection_response(e)
+    except Exception as e:
+        logger.error(f"Error in invoke handler: {e}", exc_info=True)
+        return {"error": f"Handler error: {str(e)}"}
+
+
+def _configure_loop() -> None:
+    loop = asyncio.get_running_loop()
+    if loop not in _configured_loops:
+        # Blocking boto/MCP work runs via asyncio.to_thread; size the pool for the
+        # concurrency limit rather than the CPU count.
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=settings.runtime.blocking_io_threads,
+                thread_name_prefix="agentcore-io",
+            )
+        )
+        _configured_loops.add(loop)
+
+
+async def invoke_async(payload: dict[str, Any], context: Any) -> dict[str, Any]:
+    started = time.perf_counter()
+    tracer = StageTracer()
+    try:
+        prompt = payload.get("prompt", "")
+
+        bearer_token = get_bearer_token(payload, context)
+        if not bearer_token:
+            logger.error("No bearer token found in request")
+            return {"error": "Authentication required. Please provide a bearer token"}
+
+        user_identity = extract_user_identity(bearer_token)
+        actor_id = user_identity["actor_id"]
+        session_id = payload.get("session_id") or settings.memory.session_id
+
+        _configure_loop()
+        async with admission.admit_async(actor_id):
+            logger.info("Creating agent for actor_id={}, session_id={}", actor_id, session_id)
+
+            gateway_urls = await asyncio.to_thread(resolve_gateway_urls, tracer)
+
+            agent = await StrandsAgentWrapper.create_async(
+                actor_id=actor_id,
+                session_id=session_id,
+                use_gateway=True,
+                gateway_url=gateway_urls,
+                access_token=bearer_token,
+                tracer=tracer,
+            )
+            async with agent:
+                response = await agent.run_async(
+                    prompt,
+                    use_tool_cache=payload.get("use_tool_cache", True),
+                    use_response_cache=payload.get("use_response_cache", True),
+                )
+
+        return finish_invocation(response, tracer, started)
+    except AdmissionRejected as e:
+        return rejection_response(e)
     except Exception as e:
         logger.error(f"Error in invoke handler: {e}", exc_info=True)
         return {"error": f"Handler error: {str(e)}"}
 
 
+app.entrypoint(invoke_async if settings.runtime.async_entrypoint else invoke)
+
+
 if __name__ == "__main__":
     logger.info("Starting BedrockAgentCoreApp runtime server...")
     logger.info("Note: This is designed for AWS AgentCore Runtime deployment.")
     app.run()
-
@@ -1,5 +1,4 @@
 import json
-import time
 import zipfile
 from io import BytesIO
 from pathlib import Path
@@ -9,6 +8,7 @@ from botocore.exceptions import ClientError
 from loguru import logger
 
 from agentcore_agents.config import settings
+from agentcore_agents.provisioning import poll
 
 
 def load_tool_schema() -> dict:
@@ -53,9 +53,8 @@ def create_lambda_role(lambda_client: boto3.client, iam_client: boto3.client) ->
             Description="Role for AgentCore Gateway Lambda function",
         )
         role_arn = role["Role"]["Arn"]
+        # IAM propagation is awaited where the role is first used, in create_function
         logger.info(f"Created role: {role_arn}")
-        logger.info("Waiting for IAM role to propagate...")
-        time.sleep(5)
 
     iam_client.attach_role_policy(
         RoleName=role_name,
@@ -107,13 +106,15 @@ def package_lambda_code() -> bytes:
 def deploy_lambda(
     function_name: str | None = None,
     lambda_arn: str | None = None,
+    role_arn: str | None = None,
 ) -> str:
     if function_name is None:
         function_name = settings.lambda_settings.function_name
     lambda_client = boto3.client("lambda", region_name=settings.aws.region)
-    iam_client = boto3.client("iam", region_name=settings.aws.region)
 
-    role_arn = create_lambda_role(lambda_client, iam_client)
+    if role_arn is None:
+        iam_client = boto3.client("iam", region_name=settings.aws.region)
+        role_arn = create_lambda_role(lambda_client, iam_client)
     code = package_lambda_code()
 
     if lambda_arn:
@@ -175,52 +176,43 @@ def deploy_lambda(
 
     logger.info(f"Creating Lambda function: {function_name}")
 
-    max_retries = 3
-    retry_delay = 5
-    last_error: Exception | None = None
-
-    for attempt in range(max_retries):
-        try:
-            response = lambda_client.create_function(
-                FunctionName=function_name,
-                Runtime="python3.13",
-                Role=role_arn,
-                Handler="handler.lambda_handler",
-                Code={"ZipFile": code},
-                Description=(
-                    "AgentCore Gateway tools Lambda "
-                    "(calculator, get_current_time, read_s3_document)"
-                ),
-                Timeout=settings.lambda_settings.timeout,
-                MemorySize=settings.lambda_settings.memory_size,
-                Environment={
-                    "Variables": {
-                        "S3_DOCUMENTS_BUCKET": settings.s3.documents_bucket,
-                    }
-                },
-            )
-
-            created_arn: str = response["FunctionArn"]
-            logger.info(f"Lambda created: {created_arn}")
-            return created_arn
-
-        except ClientError as e:
-            last_error = e
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "InvalidParameterValueException" and attempt < max_retries - 1:
-                logger.warning(
-                    f"Role not yet assumable (attempt {attempt + 1}/{max_retries}), "
-                    f"waiting {retry_delay} seconds..."
-                )
-                time.sleep(retry_delay)
-                retry_delay *= 2
-            else:
-                logger.error(f"Failed to create Lambda function: {e}")
-                raise
-
-    if last_error:
-        raise RuntimeError("Failed to create Lambda function after all retries") from last_error
-    raise RuntimeError("Failed to create Lambda function after all retries")
+    def create_function() -> str:
+        response = lambda_client.create_function(
+            FunctionName=function_name,
+            Runtime="python3.13",
+            Role=role_arn,
+            Handler="handler.lambda_handler",
+            Code={"ZipFile": code},
+            Description=(
+                "AgentCore Gateway tools Lambda (calculator, get_current_time, read_s3_document)"
+            ),
+            Timeout=settings.lambda_settings.timeout,
+            MemorySize=settings.lambda_settings.memory_size,
+            Environment={
+                "Variables": {
+                    "S3_DOCUMENTS_BUCKET": settings.s3.documents_bucket,
+                }
+            },
+        )
+        created_arn: str = response["FunctionArn"]
+        return created_arn
+
+    def role_not_assumable(e: Exception) -> bool:
+        # A new role cannot be assumed by Lambda until IAM has propagated it
+        return (
+            isinstance(e, ClientError)
+            and e.response.get("Error", {}).get("Code", "") == "InvalidParameterValueException"
+        )
+
+    try:
+        created_arn = poll(
+            create_function, "the Lambda role to become assumable", retry_if=role_not_assumable
+        )
+    except (ClientError, TimeoutError) as e:
+        logger.error(f"Failed to create Lambda function: {e}")
+        raise
+    logger.info(f"Lambda created: {created_arn}")
+    return created_arn
 
 
 def main() -> None:
@@ -0,0 +1,148 @@
+"""Provision the S3 bucket, tools Lambda, Gateway, test user and runtime permissions.
+
+The setup scripts' steps run as a dependency graph: the S3 bucket, the Lambda role and
+the Cognito authorizer are created concurrently, and each later step starts as soon as
+the steps it needs are done. Completed steps and their outputs are recorded in a local
+state file, so rerunning after a failure skips what already succeeded.
+
+Example:
+    uv run scripts/provision.py
+    uv run scripts/provision.py --redo lambda_function --runtime-role-name MyRuntimeRole
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import boto3
+from deploy_lambda import create_lambda_role, deploy_lambda
+from loguru import logger
+from setup_gateway import add_lambda_target, create_authorizer
+from setup_runtime_permissions import add_runtime_permissions, find_execution_role
+from setup_s3 import setup_bucket
+from setup_user_auth import setup_user_auth
+
+from agentcore_agents.config import settings
+from agentcore_agents.gateway.setup import GatewaySetup
+from agentcore_agents.provisioning import Outputs, ProvisionState, Step, poll, run_steps
+
+DEFAULT_STATE_FILE = Path(".provision_state.json")
+
+
+def s3_bucket(completed: dict[str, Outputs]) -> Outputs:
+    setup_bucket(settings.s3.documents_bucket, settings.aws.region)
+    return {"bucket": settings.s3.documents_bucket}
+
+
+def lambda_role(completed: dict[str, Outputs]) -> Outputs:
+    lambda_client = boto3.client("lambda", region_name=settings.aws.region)
+    iam_client = boto3.client("iam", region_name=settings.aws.region)
+    return {"role_arn": create_lambda_role(lambda_client, iam_client)}
+
+
+def lambda_function(completed: dict[str, Outputs]) -> Outputs:
+    return {"lambda_arn": deploy_lambda(role_arn=completed["lambda_role"]["role_arn"])}
+
+
+def cognito_authorizer(completed: dict[str, Outputs]) -> Outputs:
+    setup = GatewaySetup()
+    existing = setup.find_gateway(settings.gateway.name)
+    if existing:
+        # A second authorizer would orphan a user pool; the gateway keeps its own
+        logger.info(f"Gateway '{settings.gateway.name}' already exists, keeping its authorizer")
+        return {"authorizer_config": existing.get("authorizerConfiguration", {})}
+    return {"authorizer_config": create_authorizer(setup, settings.gateway.name)}
+
+
+def gateway(completed: dict[str, Outputs]) -> Outputs:
+    setup = GatewaySetup()
+    created = setup.get_or_create_gateway(
+        authorizer_config=completed["cognito_authorizer"]["authorizer_config"],
+        name=settings.gateway.name,
+    )
+    return {"gateway_id": created["gatewayId"], "gateway_url": created["gatewayUrl"]}
+
+
+def wait_for_gateway(setup: GatewaySetup) -> dict:
+    # A new gateway can take a moment to be listed
+    return poll(
+        lambda: setup.find_gateway(settings.gateway.name),
+        f"gateway '{settings.gateway.name}'",
+        timeout=60,
+    )
+
+
+def lambda_target(completed: dict[str, Outputs]) -> Outputs:
+    setup = GatewaySetup()
+    target = add_lambda_target(setup, wait_for_gateway(setup))
+    return {"target_name": settings.gateway.lambda_target_name, "arn": target.get("arn")}
+
+
+def user_auth(completed: dict[str, Outputs]) -> Outputs:
+    setup = GatewaySetup()
+    wait_for_gateway(setup)
+    config_path = setup_user_auth(setup, settings.gateway.name)
+    return {"config_path": str(config_path)}
+
+
+def build_steps(runtime_role_name: str | None) -> list[Step]:
+    steps = [
+        Step("s3_bucket", s3_bucket),
+        Step("lambda_role", lambda_role),
+        Step("cognito_authorizer", cognito_authorizer),
+        Step("lambda_function", lambda_function, requires=("lambda_role",)),
+        Step("gateway", gateway, requires=("cognito_authorizer",)),
+        Step("lambda_target", lambda_target, requires=("gateway", "lambda_function")),
+        Step("user_auth", user_auth, requires=("gateway",)),
+    ]
+    if runtime_role_name:
+        role_name = runtime_role_name
+
+        def runtime_permissions(completed: dict[str, Outputs]) -> Outputs:
+            add_runtime_permissions(role_name)
+            return {"role_name": role_name}
+
+        steps.append(Step("runtime_permissions", runtime_permissions))
+    return steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Provision all AgentCore resources")
+    parser.add_argument(
+        "--state-file", type=Path, default=DEFAULT_STATE_FILE, help="Completed steps"
+    )
+    parser.add_argument(
+        "--redo", nargs="+", default=[], metavar="STEP", help="Run these steps again"
+    )
+    parser.add_argument(
+        "--runtime-role-name",
+        help="Runtime execution role (default: from .bedrock_agentcore.yaml, if present)",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Steps run at a time")
+    args = parser.parse_args()
+
+    runtime_role_name = args.runtime_role_name
+    if runtime_role_name is None and Path(".bedrock_agentcore.yaml").exists():
+        runtime_role_name = find_execution_role()
+    if runtime_role_name is None:
+        logger.warning("No runtime execution role; skipping runtime permissions")
+        logger.info("Rerun with --runtime-role-name after `agentcore deploy`")
+
+    state = ProvisionState.load(args.state_file)
+    state.forget(args.redo)
+    try:
+        run_steps(build_steps(runtime_role_name), state, max_workers=args.workers)
+    except (RuntimeError, ValueError) as e:
+        logger.error(str(e))
+        logger.info(f"Fix the failure and rerun; completed steps are kept in {args.state_file}")
+        sys.exit(1)
+
+    logger.info("=" * 60)
+    logger.info("Provisioning Complete!")
+    logger.info(f"Gateway URL: {state.completed['gateway']['gateway_url']}")
+    logger.info(f"Lambda ARN: {state.completed['lambda_function']['lambda_arn']}")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Replay a JSONL file of invocation payloads through `runtime_handler.invoke`.
+
+Each input line is a payload such as {"prompt": ..., "session_id": ..., "token": ...}.
+Results are appended to the output JSONL in input order as they complete, and a checkpoint
+records how far the input and output got, so rerunning the same command after an
+interruption resumes where it stopped. The input is streamed, never loaded whole.
+
+Example:
+    uv run scripts/replay.py payloads.jsonl --output results.jsonl --concurrency 16
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from loguru import logger
+
+ROOT = Path(__file__).parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Never echoed into the output file
+TOKEN_FIELDS = ("token", "bearer_token", "access_token")
+
+
+@dataclass
+class Checkpoint:
+    # Byte offsets just past the last input line consumed and the last result written
+    input_offset: int = 0
+    output_offset: int = 0
+    line: int = 0
+    records: int = 0
+    done: bool = False
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint":
+        if not path.exists():
+            return cls()
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self)))
+        os.replace(tmp, path)
+
+
+def read_payloads(source: BinaryIO, line: int) -> Iterator[tuple[int, int, dict[str, Any] | str]]:
+    """Yields (line number, offset after the line, payload or parse error) from `source`."""
+    for raw in iter(source.readline, b""):
+        line += 1
+        if not raw.strip():
+            continue
+        try:
+            payload = json.loads(raw)
+            if not isinstance(payload, dict):
+                raise ValueError("payload is not a JSON object")
+        except ValueError as e:
+            yield line, source.tell(), f"Invalid payload: {e}"
+            continue
+        yield line, source.tell(), payload
+
+
+def run_payload(
+    invoke: Callable[..., dict[str, Any]], line: int, payload: dict[str, Any] | str
+) -> dict[str, Any]:
+    if isinstance(payload, str):
+        return {"line": line, "ok": False, "latency_ms": 0.0, "response": {"error": payload}}
+
+    request = dict(payload)
+    if "token" in request:
+        request.setdefault("bearer_token", request.pop("token"))
+    started = time.perf_counter()
+    try:
+        response = invoke(request, None)
+    except Exception as e:
+        response = {"error": f"Replay error: {e}"}
+    latency_ms = (time.perf_counter() - started) * 1000
+    record = {key: value for key, value in payload.items() if key not in TOKEN_FIELDS}
+    return {
+        **record,
+        "line": line,
+        "ok": "error" not in response,
+        "latency_ms": round(latency_ms, 1),
+        "response": response,
+    }
+
+
+def replay(
+    input_path: Path,
+    output_path: Path,
+    checkpoint_path: Path,
+    concurrency: int,
+    invoke: Callable[..., dict[str, Any]],
+    checkpoint_every: int = 50,
+) -> Checkpoint:
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint.done:
+        logger.info(f"{input_path} was already replayed into {output_path}")
+        return checkpoint
+    if checkpoint.records:
+        logger.info(f"Resuming after {checkpoint.records} records")
+
+    # At most this many payloads are read ahead of the oldest unwritten result
+    window = concurrency * 4
+    pending: dict[int, tuple[int, Future[dict[str, Any]]]] = {}
+    started = time.perf_counter()
+    written = 0
+
+    with (
+        input_path.open("rb") as source,
+        output_path.open("ab") as output,
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="replay") as executor,
+    ):
+        # Drop results written after the last checkpoint; their payloads run again
+        output.truncate(checkpoint.output_offset)
+        source.seek(checkpoint.input_offset)
+        payloads = read_payloads(source, line=checkpoint.line)
+        order: deque[int] = deque()
+
+        def flush() -> None:
+            nonlocal written
+            while order and pending[order[0]][1].done():
+                line = order.popleft()
+                offset, future = pending.pop(line)
+                output.write(json.dumps(future.result(), default=str).encode("utf-8") + b"\n")
+                checkpoint.input_offset = offset
+                checkpoint.line = line
+                checkpoint.records += 1
+                written += 1
+                if written % checkpoint_every == 0:
+                    output.flush()
+                    checkpoint.output_offset = output.tell()
+                    checkpoint.save(checkpoint_path)
+                    logger.info(f"{checkpoint.records} records replayed")
+
+        try:
+            for line, offset, payload in payloads:
+                while len(pending) >= window:
+                    wait([future for _, future in pending.values()], return_when=FIRST_COMPLETED)
+                    flush()
+                pending[line] = (offset, executor.submit(run_payload, invoke, line, payload))
+                order.append(line)
+                flush()
+            while pending:
+                wait([future for _, future in pending.values()], return_when=FIRST_COMPLETED)
+                flush()
+            checkpoint.done = True
+        except KeyboardInterrupt:
+            logger.warning("Interrupted; rerun the same command to resume")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            output.flush()
+            checkpoint.output_offset = output.tell()
+            checkpoint.save(checkpoint_path)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Replayed {written} records in {elapsed:.1f}s")
+    return checkpoint
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay JSONL payloads through the runtime")
+    parser.add_argument("input", type=Path, help="JSONL file of invocation payloads")
+    parser.add_argument(
+        "--output", type=Path, help="Results JSONL (default: <input>.results.jsonl)"
+    )
+    parser.add_argument(
+        "--checkpoint", type=Path, help="Checkpoint file (default: <output>.checkpoint)"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Payloads in flight")
+    parser.add_argument("--checkpoint-every", type=int, default=50, help="Records per checkpoint")
+    args = parser.parse_args()
+
+    output_path = args.output or args.input.with_suffix(".results.jsonl")
+    checkpoint_path = args.checkpoint or output_path.with_name(output_path.name + ".checkpoint")
+
+    import runtime_handler
+
+    replay(
+        args.input,
+        output_path,
+        checkpoint_path,
+        concurrency=args.concurrency,
+        invoke=runtime_handler.invoke,
+        checkpoint_every=args.checkpoint_every,
+    )
+
+
+if __name__ == "__main__":
+    main()
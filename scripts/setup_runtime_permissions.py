@@ -10,6 +10,20 @@ from loguru import logger
 from agentcore_agents.config import settings
 
 
+def find_execution_role(config_path: str = ".bedrock_agentcore.yaml") -> str | None:
+    """Read the default agent's execution role name from the agentcore config."""
+    import yaml
+
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    default_agent = config.get("default_agent")
+    agent_config = config.get("agents", {}).get(default_agent, {})
+    execution_role_arn = agent_config.get("aws", {}).get("execution_role", "")
+    if not execution_role_arn:
+        return None
+    return execution_role_arn.split("/")[-1]
+
+
 def add_runtime_permissions(role_name: str) -> None:
     """Add required IAM permissions to the execution role."""
     iam = boto3.client("iam", region_name=settings.aws.region)
@@ -49,27 +63,23 @@ def add_runtime_permissions(role_name: str) -> None:
         ],
     }
 
-    try:
-        # Add Gateway permissions
-        iam.put_role_policy(
-            RoleName=role_name,
-            PolicyName="AgentCoreGatewayAccess",
-            PolicyDocument=json.dumps(gateway_policy),
-        )
-        logger.info(f"✓ Added Gateway permissions to role: {role_name}")
-
-        # Add Memory permissions
-        iam.put_role_policy(
-            RoleName=role_name,
-            PolicyName="AgentCoreMemoryAccess",
-            PolicyDocument=json.dumps(memory_policy),
-        )
-        logger.info(f"✓ Added Memory permissions to role: {role_name}")
-
-        logger.info("✓ All permissions added successfully!")
-    except Exception as e:
-        logger.error(f"Failed to add permissions: {e}")
-        sys.exit(1)
+    # Add Gateway permissions
+    iam.put_role_policy(
+        RoleName=role_name,
+        PolicyName="AgentCoreGatewayAccess",
+        PolicyDocument=json.dumps(gateway_policy),
+    )
+    logger.info(f"✓ Added Gateway permissions to role: {role_name}")
+
+    # Add Memory permissions
+    iam.put_role_policy(
+        RoleName=role_name,
+        PolicyName="AgentCoreMemoryAccess",
+        PolicyDocument=json.dumps(memory_policy),
+    )
+    logger.info(f"✓ Added Memory permissions to role: {role_name}")
+
+    logger.info("✓ All permissions added successfully!")
 
 
 def main() -> None:
@@ -88,24 +98,22 @@ def main() -> None:
         role_name = args.role_name
     else:
         try:
-            import yaml
-            with open(".bedrock_agentcore.yaml") as f:
-                config = yaml.safe_load(f)
-                default_agent = config.get("default_agent")
-                agent_config = config.get("agents", {}).get(default_agent, {})
-                execution_role_arn = agent_config.get("aws", {}).get("execution_role", "")
-                if execution_role_arn:
-                    role_name = execution_role_arn.split("/")[-1]
-                    logger.info(f"Found execution role from config: {role_name}")
-                else:
-                    logger.error("No execution role found in .bedrock_agentcore.yaml")
-                    sys.exit(1)
+            found_role = find_execution_role()
         except Exception as e:
             logger.error(f"Could not read config: {e}")
             logger.info("Please specify --role-name")
             sys.exit(1)
+        if not found_role:
+            logger.error("No execution role found in .bedrock_agentcore.yaml")
+            sys.exit(1)
+        role_name = found_role
+        logger.info(f"Found execution role from config: {role_name}")
 
-    add_runtime_permissions(role_name)
+    try:
+        add_runtime_permissions(role_name)
+    except Exception as e:
+        logger.error(f"Failed to add permissions: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
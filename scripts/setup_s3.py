@@ -5,10 +5,7 @@ from loguru import logger
 from agentcore_agents.config import settings
 
 
-def main() -> None:
-    bucket_name = settings.s3.documents_bucket
-    region = settings.aws.region
-
+def setup_bucket(bucket_name: str, region: str) -> None:
     logger.info(f"Setting up S3 bucket: {bucket_name}")
     logger.info(f"Region: {region}")
 
@@ -22,7 +19,7 @@ def main() -> None:
         error_code = e.response.get("Error", {}).get("Code", "")
         if error_code != "404":
             logger.error(f"Error checking bucket: {e}")
-            return
+            raise
 
     logger.info(f"Creating bucket '{bucket_name}' in region '{region}'...")
 
@@ -40,6 +37,9 @@ def main() -> None:
             raise
 
 
+def main() -> None:
+    setup_bucket(settings.s3.documents_bucket, settings.aws.region)
+
+
 if __name__ == "__main__":
     main()
-
@@ -14,19 +14,9 @@ from agentcore_agents.config import settings
 from agentcore_agents.gateway.setup import GatewaySetup
 
 
-def main() -> None:
-    logger.info("Setting up user authentication for Gateway Inbound Auth")
-
-    setup = GatewaySetup()
-    gateway_name = settings.gateway.name
-
-    try:
-        client_info = setup.get_client_info_from_gateway(gateway_name)
-    except ValueError as e:
-        logger.error(f"Gateway not found: {e}")
-        logger.info("Run setup_gateway.py first")
-        return
-
+def setup_user_auth(setup: GatewaySetup, gateway_name: str) -> Path:
+    """Creates the test user, fetches its token and returns the saved config path."""
+    client_info = setup.get_client_info_from_gateway(gateway_name)
     user_pool_id = client_info["user_pool_id"]
     client_id = client_info["client_id"]
 
@@ -74,8 +64,18 @@ def main() -> None:
         json.dump(user_config, f, indent=2)
 
     logger.info(f"\n✓ User authentication config saved to: {config_path_user}")
+    return config_path_user
 
 
+def main() -> None:
+    logger.info("Setting up user authentication for Gateway Inbound Auth")
+
+    try:
+        setup_user_auth(GatewaySetup(), settings.gateway.name)
+    except ValueError as e:
+        logger.error(f"Gateway not found: {e}")
+        logger.info("Run setup_gateway.py first")
+
 
 if __name__ == "__main__":
     main()
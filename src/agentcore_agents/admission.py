@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.observability.logs import log_hot
+from agentcore_agents.observability.metrics import metrics
+
+
+class AdmissionRejected(Exception):
+    """An invocation turned away; `retry_after` is a hint in seconds for the caller."""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(f"Request rejected ({reason}), retry after {retry_after:.1f}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Takes a token; returns 0, or the seconds until one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass
+class _ActorState:
+    bucket: TokenBucket | None = None
+    queued: int = 0
+    queue_ms: float = 0.0
+    max_queue_ms: float = 0.0
+
+
+@dataclass(eq=False)
+class _Waiter:
+    wake: Callable[[], None]
+    granted: bool = False
+
+
+class AdmissionController:
+    """Admits invocations by actor rate and global concurrency.
+
+    Each actor has a token bucket refilled at `rate_per_second` up to `burst`; a
+    request without a token is rejected at once. Admitted requests run up to
+    `max_concurrent` at a time; the rest wait in a FIFO queue of at most `max_queue`
+    for up to `max_queue_wait` seconds. A freed slot is handed straight to the
+    oldest waiter, so a burst cannot overtake the queue.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        max_queue_wait: float,
+        rate_per_second: float,
+        burst: float,
+        max_actors: int,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.active = 0
+        self._queue: deque[_Waiter] = deque()
+        # Least recently seen actors are forgotten first, with their queue times; they come
+        # back with a full bucket
+        self._actors = BoundedCache[str, _ActorState](max_entries=max_actors, max_bytes=max_actors)
+        # Moving average of how long an admitted invocation holds its slot
+        self._service_seconds = 1.0
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def _estimate_wait(self, position: int) -> float:
+        return max(1.0, self._service_seconds * (position + 1) / self.max_concurrent)
+
+    def _actor(self, actor_id: str) -> _ActorState:
+        # Called with the controller's lock held
+        state = self._actors.get(actor_id)
+        if state is None:
+            state = _ActorState()
+            self._actors.put(actor_id, state, size=1)
+        return state
+
+    def queue_times(self, limit: int) -> dict[str, dict[str, float]]:
+        """Queue time of the `limit` actors that waited longest in total, of those tracked."""
+        with self._lock:
+            states = [(actor_id, state) for actor_id, state in self._actors.items() if state.queued]
+            states.sort(key=lambda item: item[1].queue_ms, reverse=True)
+            return {
+                actor_id: {
+                    "count": state.queued,
+                    "sum_ms": round(state.queue_ms, 3),
+                    "max_ms": round(state.max_queue_ms, 3),
+                }
+                for actor_id, state in states[:limit]
+            }
+
+    def _enter(self, actor_id: str, wake: Callable[[], None]) -> _Waiter | None:
+        """Takes a slot, or queues and returns the waiter; raises AdmissionRejected."""
+        with self._lock:
+            if self.rate_per_second > 0:
+                now = time.monotonic()
+                state = self._actor(actor_id)
+                if state.bucket is None:
+                    state.bucket = TokenBucket(self.rate_per_second, self.burst, now)
+                wait = state.bucket.take(now)
+                if wait:
+                    raise AdmissionRejected("rate_limited", wait)
+
+            if self.active < self.max_concurrent and not self._queue:
+                self.active += 1
+                return None
+            if len(self._queue) >= self.max_queue:
+                raise AdmissionRejected("queue_full", self._estimate_wait(len(self._queue)))
+            waiter = _Waiter(wake)
+            self._queue.append(waiter)
+            return waiter
+
+    def _leave_queue(self, waiter: _Waiter) -> bool:
+        """Removes a waiter that stopped waiting; True if it was granted a slot meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._queue.remove(waiter)
+            return False
+
+    def _release(self, held_seconds: float | None) -> None:
+        with self._lock:
+            if held_seconds is not None:
+                self._service_seconds += 0.2 * (held_seconds - self._service_seconds)
+            if self._queue:
+                waiter = self._queue.popleft()
+                waiter.granted = True
+                waiter.wake()
+            else:
+                self.active -= 1
+
+    def _timed_out(self) -> AdmissionRejected:
+        with self._lock:
+            return AdmissionRejected("queue_timeout", self._estimate_wait(len(self._queue)))
+
+    def _admitted(self, actor_id: str, started: float) -> float:
+        now = time.perf_counter()
+        queue_ms = (now - started) * 1000
+        # Metric series are never evicted, so per-actor queue time is kept with the actor's
+        # state instead of as an actor label
+        metrics.observe("admission.queue_ms", queue_ms)
+        with self._lock:
+            state = self._actor(actor_id)
+            state.queued += 1
+            state.queue_ms += queue_ms
+            state.max_queue_ms = max(state.max_queue_ms, queue_ms)
+        return now
+
+    def _rejected(self, actor_id: str, rejection: AdmissionRejected) -> None:
+        metrics.increment("admission.rejections", reason=rejection.reason)
+        log_hot(
+            "admission",
+            "WARNING",
+            "Rejected request of actor {} ({}), retry after {:.1f}s",
+            lambda: actor_id,
+            lambda: rejection.reason,
+            lambda: rejection.retry_after,
+        )
+
+    @contextmanager
+    def admit(self, actor_id: str) -> Iterator[None]:
+        """Holds a slot for the block; blocks the thread while queued."""
+        started = time.perf_counter()
+        event = threading.Event()
+        try:
+            waiter = self._enter(actor_id, event.set)
+            if waiter is not None:
+                event.wait(self.max_queue_wait)
+                if not self._leave_queue(waiter):
+                    raise self._timed_out()
+        except AdmissionRejected as e:
+            self._rejected(actor_id, e)
+            raise
+
+        admitted = self._admitted(actor_id, started)
+        try:
+            yield
+        finally:
+            self._release(time.perf_counter() - admitted)
+
+    @asynccontextmanager
+    async def admit_async(self, actor_id: str) -> AsyncIterator[None]:
+        """Holds a slot for the block; waits on the running loop while queued."""
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def grant() -> None:
+            if not granted.done():
+                granted.set_result(None)
+
+        def wake() -> None:
+            # Called with the controller's lock held, possibly from another thread
+            loop.call_soon_threadsafe(grant)
+
+        try:
+            waiter = self._enter(actor_id, wake)
+            if waiter is not None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(granted), self.max_queue_wait)
+                except TimeoutError:
+                    pass
+                except asyncio.CancelledError:
+                    # A slot granted while the caller was being cancelled goes to the next waiter
+                    if self._leave_queue(waiter):
+                        self._release(None)
+                    raise
+                if not self._leave_queue(waiter):
+                    raise self._timed_out()
+        except AdmissionRejected as e:
+            self._rejected(actor_id, e)
+            raise
+
+        admitted = self._admitted(actor_id, started)
+        try:
+            yield
+        finally:
+            self._release(time.perf_counter() - admitted)
+
+
+admission = AdmissionController(
+    max_concurrent=settings.runtime.max_concurrent_invocations,
+    max_queue=settings.admission.max_queue,
+    max_queue_wait=settings.admission.max_queue_wait_seconds,
+    rate_per_second=settings.admission.rate_per_second,
+    burst=settings.admission.burst,
+    max_actors=settings.admission.max_actors,
+)
+metrics.add_reporter(
+    "admission.queue_ms_by_actor",
+    lambda: admission.queue_times(settings.admission.report_actors),
+)
@@ -1,16 +1,97 @@
+import asyncio
+import threading
+import time
+from collections.abc import Sequence
+from functools import partial
 from typing import Any
 
 from loguru import logger
-from mcp.client.streamable_http import streamablehttp_client
 from strands import Agent
-from strands.models import BedrockModel
+from strands.agent import AgentResult
 from strands.tools.mcp.mcp_client import MCPClient
+from strands.tools.registry import ToolRegistry
+from strands.types.content import Message, Messages, SystemContentBlock
 
 from agentcore_agents.config import settings
+from agentcore_agents.gateway.connection import GatewayConnection
+from agentcore_agents.memory.backend import MemoryBackend
 from agentcore_agents.memory.hooks import MemoryHookProvider
 from agentcore_agents.memory.manager import AgentMemoryManager
+from agentcore_agents.memory.recall import RecallIndex, get_recall_index
 from agentcore_agents.memory.session import AgentSessionManager
+from agentcore_agents.memory.sqlite import get_sqlite_backend
+from agentcore_agents.memory.summary import summarizer
+from agentcore_agents.model_router import ModelRouter, RouteDecision, strong_route
+from agentcore_agents.models import get_model
+from agentcore_agents.observability.logs import log_hot, truncate
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer, TimingHookProvider
 from agentcore_agents.prompts.system import SYSTEM_PROMPT
+from agentcore_agents.response_cache import (
+    catalog_version,
+    message_text,
+    response_cache,
+    response_ttl,
+)
+from agentcore_agents.tools.cache import USE_TOOL_CACHE
+from agentcore_agents.tools.executor import build_tool_executor
+from agentcore_agents.tools.selection import ToolSelector, build_tool_selector
+from agentcore_agents.tools.truncation import continuation_tools, truncate_tools
+
+# Response usage field -> Strands usage key
+USAGE_KEYS = {
+    "input_tokens": "inputTokens",
+    "output_tokens": "outputTokens",
+    "cache_read_input_tokens": "cacheReadInputTokens",
+    "cache_write_input_tokens": "cacheWriteInputTokens",
+}
+
+
+_memory_ids: dict[tuple[str, str], str] = {}
+_memory_ids_lock = threading.Lock()
+
+
+def resolve_memory_id() -> str:
+    """Resolves the configured memory once per process; its id does not change."""
+    key = (settings.memory.name, settings.aws.region)
+    memory_id = _memory_ids.get(key)
+    if memory_id is None:
+        with _memory_ids_lock:
+            memory_id = _memory_ids.get(key)
+            if memory_id is None:
+                memory_manager = AgentMemoryManager(region=settings.aws.region)
+                memory = memory_manager.get_or_create_memory(
+                    name=settings.memory.name,
+                    description=settings.memory.description,
+                    event_expiry_days=settings.memory.event_expiry_days,
+                )
+                memory_id = getattr(memory, "id", "")
+                if memory_id:
+                    _memory_ids[key] = memory_id
+    return memory_id
+
+
+def clear_memory_ids() -> None:
+    with _memory_ids_lock:
+        _memory_ids.clear()
+
+
+def get_memory_backend() -> MemoryBackend:
+    """The configured memory backend; for AgentCore this resolves the memory first."""
+    if settings.memory.backend == "sqlite":
+        return get_sqlite_backend(settings.memory.sqlite_path, settings.memory.event_expiry_days)
+    if settings.memory.backend != "agentcore":
+        raise ValueError(f"Unknown memory backend: {settings.memory.backend}")
+    return AgentSessionManager(memory_id=resolve_memory_id(), region=settings.aws.region)
+
+
+def system_prompt_blocks(prompt_caching: bool) -> list[SystemContentBlock]:
+    # Cache point after the static system prompt; with cache_tools on the model the
+    # tool specs before it are cached too
+    blocks: list[SystemContentBlock] = [{"text": SYSTEM_PROMPT}]
+    if prompt_caching:
+        blocks.append({"cachePoint": {"type": "default"}})
+    return blocks
 
 
 class StrandsAgentWrapper:
@@ -19,74 +100,277 @@ class StrandsAgentWrapper:
         actor_id: str | None = None,
         session_id: str | None = None,
         use_gateway: bool = False,
-        gateway_url: str | None = None,
+        gateway_url: str | Sequence[str] | None = None,
         access_token: str | None = None,
+        tracer: StageTracer | None = None,
+        gateway: GatewayConnection | None = None,
     ) -> None:
         actor_id = actor_id or settings.memory.actor_id
         session_id = session_id or settings.memory.session_id
+        self.actor_id = actor_id
+        self.tracer = tracer or StageTracer()
+        self.tool_selector: ToolSelector | None = None
 
-        logger.info(f"Agent initialized with model: {settings.model.model_id}")
+        self.router: ModelRouter | None = None
 
-        model = BedrockModel(
-            model_id=settings.model.model_id,
-            region_name=settings.aws.region,
-            max_tokens=settings.model.max_tokens,
-            temperature=settings.model.temperature,
+        model_id = (
+            settings.routing.fast_model_id if settings.routing.enabled else settings.model.model_id
         )
+        logger.debug("Agent initialized with model: {}", model_id)
 
-        memory_manager = AgentMemoryManager(region=settings.aws.region)
-        memory = memory_manager.get_or_create_memory(
-            name=settings.memory.name,
-            description=settings.memory.description,
-            event_expiry_days=settings.memory.event_expiry_days,
-        )
+        prompt_caching = settings.model.prompt_caching
+        with self.tracer.span("agent.model_setup", model_id=model_id):
+            model = get_model(model_id)
 
-        memory_id = getattr(memory, "id", "")
-        session_manager = AgentSessionManager(memory_id=memory_id, region=settings.aws.region)
-        memory_session = session_manager.get_or_create_session(
-            actor_id=actor_id, session_id=session_id
-        )
+        with self.tracer.span("memory.resolve"):
+            memory_backend = get_memory_backend()
 
-        memory_hook = MemoryHookProvider(
-            memory_session=memory_session, actor_id=actor_id, session_id=session_id
-        )
+        with self.tracer.span("memory.session_create"):
+            memory_session = memory_backend.get_or_create_session(
+                actor_id=actor_id, session_id=session_id
+            )
 
-        if use_gateway:
-            if not gateway_url or not access_token:
-                raise ValueError("gateway_url and access_token are required when use_gateway=True")
+        recall_index: RecallIndex | None = None
+        if settings.recall.mode == "relevant":
+            with self.tracer.span("memory.recall_index"):
+                recall_index = get_recall_index(actor_id, session_id, memory_session)
 
-            logger.info("Connecting to Gateway to get tools...")
-            self.mcp_client = MCPClient(
-                lambda: streamablehttp_client(
-                    gateway_url, headers={"Authorization": f"Bearer {access_token}"}
-                )
-            )
-            self.mcp_client.__enter__()
-            tools = self.mcp_client.list_tools_sync()
-            logger.info(f"Found {len(tools)} tools from Gateway")
-        else:
+        self.memory_hook = MemoryHookProvider(
+            memory_session=memory_session,
+            actor_id=actor_id,
+            session_id=session_id,
+            tracer=self.tracer,
+            cache_history=prompt_caching,
+            recent_turns=settings.recall.recent_turns,
+            recall_index=recall_index,
+            summarizer=summarizer if settings.summary.enabled else None,
+        )
+
+        if not use_gateway:
             raise ValueError(
                 "use_gateway=True is required. Local tools have been removed. "
                 "Please use Gateway tools by setting use_gateway=True and "
                 "providing gateway_url and access_token."
+            )
+        self._owned_gateway: GatewayConnection | None = None
+        if gateway is None:
+            if not gateway_url or not access_token:
+                raise ValueError("gateway_url and access_token are required when use_gateway=True")
+            gateway = self._owned_gateway = GatewayConnection(
+                gateway_url, access_token, tracer=self.tracer
+            )
+        self.gateway = gateway
+
+        # Truncated per agent, after the shared connection's cache, which keeps full results
+        tools = truncate_tools(gateway.tools)
+        self.tool_selector = build_tool_selector(tools, lambda: self.gateway.client)
+        if self.tool_selector:
+            tools = list(self.tool_selector.tools.values())
+        if settings.routing.enabled:
+            self.router = ModelRouter(tools)
+        # Always available, whatever tools a prompt selects
+        self.continuation_tools = continuation_tools()
+        tools = [*tools, *self.continuation_tools]
+        self.tool_catalog_version = catalog_version(tools)
+
+        with self.tracer.span("agent.create"):
+            self.agent = Agent(
+                model=model,
+                tools=tools,
+                hooks=[self.memory_hook, TimingHookProvider(self.tracer)],
+                system_prompt=system_prompt_blocks(prompt_caching),
+                tool_executor=build_tool_executor(),
+            )
+
+    def _route(self, prompt: str) -> RouteDecision | None:
+        if self.router is None:
+            return None
+        # Loaded history is part of the agent's messages, two messages per turn
+        decision = self.router.route(prompt, history_turns=len(self.agent.messages) // 2)
+        self._use_route(decision)
+        return decision
+
+    def _use_route(self, decision: RouteDecision) -> None:
+        self.agent.model = get_model(decision.model_id)
+        metrics.increment("model_router.decisions", route=decision.route, reason=decision.reason)
+        logger.debug(
+            "Routing to {} model {} ({})", decision.route, decision.model_id, decision.reason
         )
 
-        self.agent = Agent(
-            model=model,
-            tools=tools,
-            hooks=[memory_hook],
-            system_prompt=SYSTEM_PROMPT,
+    def _escalate(self, decision: RouteDecision, messages: Messages, error: Exception) -> None:
+        logger.warning(f"{decision.model_id} failed, escalating to the strong model: {error}")
+        metrics.increment("model_router.escalations", route=decision.route)
+        # Drop whatever the failed attempt appended before retrying the prompt
+        self.agent.messages[:] = messages
+        self._use_route(strong_route("escalation"))
+
+    def _record_route(self, decision: RouteDecision | None, started: float, ok: bool) -> None:
+        if decision is not None:
+            metrics.observe(
+                "model_router.latency_ms",
+                (time.perf_counter() - started) * 1000,
+                route=decision.route,
+                outcome="ok" if ok else "error",
+            )
+
+    def _select_tools(self, prompt: str) -> None:
+        # The agent is built with the whole catalog; give it a registry of this prompt's tools
+        if self.tool_selector is None:
+            return
+        with self.tracer.span("tools.select"):
+            selected = self.tool_selector.select(prompt)
+        tool_registry = ToolRegistry()
+        tool_registry.process_tools([*selected, *self.continuation_tools])
+        self.agent.tool_registry = tool_registry
+
+    def _response_cache_key(self, prompt: str, use_response_cache: bool) -> tuple[str, str] | None:
+        if not settings.response_cache.enabled or not use_response_cache:
+            return None
+        return response_cache.make_key(
+            self.actor_id, prompt, self.agent.messages, self.tool_catalog_version
         )
 
-    def run(self, prompt: str) -> dict[str, Any]:
-        logger.info(f"Processing prompt: {prompt}")
-        result = self.agent(prompt)
-        response = {"prompt": prompt, "response": result.message}
+    def _cached_response(self, prompt: str, key: tuple[str, str] | None) -> dict[str, Any] | None:
+        if key is None:
+            metrics.increment("response_cache.bypassed")
+            return None
+        message = response_cache.get(key)
+        if message is None:
+            metrics.increment("response_cache.misses")
+            return None
+
+        metrics.increment("response_cache.hits")
+        logger.debug("Response cache hit for actor_id={}", self.actor_id)
+        self.agent.messages.extend([{"role": "user", "content": [{"text": prompt}]}, message])
+        return {
+            "prompt": prompt,
+            "response": message,
+            "usage": dict.fromkeys(USAGE_KEYS, 0),
+            "cached": True,
+        }
+
+    def _store_response(
+        self, key: tuple[str, str] | None, message: Message, turn_messages: Messages
+    ) -> None:
+        if key is None or not message_text(message):
+            return
+        ttl = response_ttl(turn_messages)
+        if ttl is None:
+            metrics.increment("response_cache.not_cacheable")
+            return
+        response_cache.put_response(key, message, ttl)
+
+    def run(
+        self, prompt: str, use_tool_cache: bool = True, use_response_cache: bool = True
+    ) -> dict[str, Any]:
+        log_hot("prompt", "INFO", "Processing prompt: {}", lambda: truncate(prompt))
+        self.memory_hook.recall_history(self.agent, prompt)
+        cache_key = self._response_cache_key(prompt, use_response_cache)
+        cached = self._cached_response(prompt, cache_key)
+        if cached is not None:
+            # Answered without the agent, so its MessageAddedEvent hooks never ran
+            self.memory_hook.save_turn(prompt, message_text(cached["response"]))
+            return cached
+
+        self._select_tools(prompt)
+        decision = self._route(prompt)
+        messages = list(self.agent.messages)
+        invocation_state = {USE_TOOL_CACHE: use_tool_cache}
+        usage_before = dict(self.agent.event_loop_metrics.accumulated_usage)
+        with self.tracer.span("agent.run"):
+            started = time.perf_counter()
+            try:
+                result = self.agent(prompt, invocation_state=invocation_state)
+            except Exception as e:
+                self._record_route(decision, started, ok=False)
+                if decision is None or not decision.can_escalate:
+                    raise
+                self._escalate(decision, messages, e)
+                decision, started = strong_route("escalation"), time.perf_counter()
+                result = self.agent(prompt, invocation_state=invocation_state)
+            self._record_route(decision, started, ok=True)
+        self._store_response(cache_key, result.message, self.agent.messages[len(messages) :])
+        response = {
+            "prompt": prompt,
+            "response": result.message,
+            "usage": self._usage(result, usage_before),
+            "cached": False,
+        }
+        return response
+
+    @classmethod
+    async def create_async(cls, **kwargs: Any) -> "StrandsAgentWrapper":
+        # Construction resolves memory and connects to the Gateway with blocking clients
+        return await asyncio.to_thread(partial(cls, **kwargs))
+
+    async def run_async(
+        self, prompt: str, use_tool_cache: bool = True, use_response_cache: bool = True
+    ) -> dict[str, Any]:
+        log_hot("prompt", "INFO", "Processing prompt: {}", lambda: truncate(prompt))
+        if self.memory_hook.recall_index is not None:
+            await asyncio.to_thread(self.memory_hook.recall_history, self.agent, prompt)
+        cache_key = self._response_cache_key(prompt, use_response_cache)
+        cached = self._cached_response(prompt, cache_key)
+        if cached is not None:
+            await asyncio.to_thread(
+                self.memory_hook.save_turn, prompt, message_text(cached["response"])
+            )
+            return cached
+
+        if self.tool_selector is not None:
+            await asyncio.to_thread(self._select_tools, prompt)
+        decision = self._route(prompt)
+        messages = list(self.agent.messages)
+        invocation_state = {USE_TOOL_CACHE: use_tool_cache}
+        usage_before = dict(self.agent.event_loop_metrics.accumulated_usage)
+        with self.tracer.span("agent.run"):
+            started = time.perf_counter()
+            try:
+                result = await self.agent.invoke_async(prompt, invocation_state=invocation_state)
+            except Exception as e:
+                self._record_route(decision, started, ok=False)
+                if decision is None or not decision.can_escalate:
+                    raise
+                self._escalate(decision, messages, e)
+                decision, started = strong_route("escalation"), time.perf_counter()
+                result = await self.agent.invoke_async(prompt, invocation_state=invocation_state)
+            self._record_route(decision, started, ok=True)
+        self._store_response(cache_key, result.message, self.agent.messages[len(messages) :])
+        response = {
+            "prompt": prompt,
+            "response": result.message,
+            "usage": self._usage(result, usage_before),
+            "cached": False,
+        }
         return response
 
+    def _usage(self, result: AgentResult, before: dict[str, Any]) -> dict[str, int]:
+        # Token usage of this run only; the agent's counters accumulate over its lifetime
+        after = result.metrics.accumulated_usage
+        usage = {name: after.get(key, 0) - before.get(key, 0) for name, key in USAGE_KEYS.items()}
+        for name, value in usage.items():
+            metrics.increment(f"model.{name}", value)
+        logger.debug("Token usage: {}", usage)
+        return usage
+
+    @property
+    def mcp_client(self) -> MCPClient:
+        # The current endpoint's client; the connection swaps it when it fails over
+        return self.gateway.client
+
+    def timing_summary(self) -> dict[str, Any]:
+        return self.tracer.summary()
+
     def __enter__(self) -> "StrandsAgentWrapper":
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if self.mcp_client:
-            self.mcp_client.__exit__(exc_type, exc_val, exc_tb)
+        # A gateway connection passed in by the caller outlives this agent
+        if self._owned_gateway:
+            self._owned_gateway.__exit__(exc_type, exc_val, exc_tb)
+
+    async def __aenter__(self) -> "StrandsAgentWrapper":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await asyncio.to_thread(self.__exit__, exc_type, exc_val, exc_tb)
@@ -0,0 +1,117 @@
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from agentcore_agents.agent import GatewayConnection, StrandsAgentWrapper
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    actor_id: str
+    session_id: str
+    prompts: Sequence[str]
+
+
+@dataclass
+class BatchResult:
+    actor_id: str
+    session_id: str
+    # Position of the prompt within its session
+    index: int
+    prompt: str
+    response: dict[str, Any] | None = None
+    error: str | None = None
+    latency_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_session(
+    gateway: GatewayConnection,
+    actor_id: str,
+    session_id: str,
+    prompts: list[str],
+    results: "queue.Queue[BatchResult]",
+    run_options: dict[str, bool],
+    stop: threading.Event,
+) -> None:
+    try:
+        agent = StrandsAgentWrapper(
+            actor_id=actor_id, session_id=session_id, use_gateway=True, gateway=gateway
+        )
+    except Exception as e:
+        logger.error(f"[{actor_id}:{session_id}] Failed to create agent: {e}")
+        for index, prompt in enumerate(prompts):
+            results.put(BatchResult(actor_id, session_id, index, prompt, error=str(e)))
+        return
+
+    # One agent per session runs its prompts in order, so each sees the turns before it
+    with agent:
+        for index, prompt in enumerate(prompts):
+            if stop.is_set():
+                return
+            started = time.perf_counter()
+            try:
+                response = agent.run(prompt, **run_options)
+                error = None
+            except Exception as e:
+                logger.error(f"[{actor_id}:{session_id}] Prompt {index} failed: {e}")
+                response, error = None, str(e)
+            latency_ms = (time.perf_counter() - started) * 1000
+            metrics.observe("batch.prompt_ms", latency_ms, ok=str(error is None).lower())
+            results.put(
+                BatchResult(actor_id, session_id, index, prompt, response, error, latency_ms)
+            )
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    gateway_url: str,
+    access_token: str,
+    max_concurrency: int | None = None,
+    use_tool_cache: bool = True,
+    use_response_cache: bool = True,
+) -> Iterator[BatchResult]:
+    """Runs many sessions' prompts concurrently and yields results as they finish.
+
+    Prompts of one session run in order on one agent; up to `max_concurrency` sessions
+    run at a time. Jobs for the same actor and session are merged in the order given.
+    All agents share one Gateway connection and the process-wide model clients.
+    """
+    sessions: dict[tuple[str, str], list[str]] = {}
+    for job in jobs:
+        sessions.setdefault((job.actor_id, job.session_id), []).extend(job.prompts)
+    total = sum(len(prompts) for prompts in sessions.values())
+    if not total:
+        return
+
+    results: queue.Queue[BatchResult] = queue.Queue()
+    stop = threading.Event()
+    run_options = {"use_tool_cache": use_tool_cache, "use_response_cache": use_response_cache}
+    workers = min(max_concurrency or settings.batch.max_concurrency, len(sessions))
+    logger.info("Running {} prompts in {} sessions, {} at a time", total, len(sessions), workers)
+
+    with GatewayConnection(gateway_url, access_token) as gateway:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch")
+        try:
+            for (actor_id, session_id), prompts in sessions.items():
+                executor.submit(
+                    _run_session, gateway, actor_id, session_id, prompts, results, run_options, stop
+                )
+            for _ in range(total):
+                yield results.get()
+        finally:
+            # A consumer that stops early leaves queued sessions unstarted and running
+            # ones stop after their current prompt
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
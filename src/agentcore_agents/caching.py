@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+
+@dataclass
+class _Entry[V]:
+    value: V
+    size: int
+    expires_at: float | None
+
+
+class BoundedCache[K: Hashable, V]:
+    """Thread-safe LRU with optional per-entry TTL, bounded by entry count and total size.
+
+    Callers pass each entry's size to `put`; values larger than `max_bytes` are not stored.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(self, key: K, value: V, size: int, ttl_seconds: float | None = None) -> None:
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value=value, size=size, expires_at=expires_at)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def items(self) -> list[tuple[K, V]]:
+        """The unexpired entries, least recently used first, without touching their recency."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, entry.value)
+                for key, entry in self._entries.items()
+                if entry.expires_at is None or entry.expires_at > now
+            ]
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
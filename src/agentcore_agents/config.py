@@ -12,6 +12,10 @@ class ModelSettings(BaseSettings):
     model_id: str = Field(default="anthropic.claude-3-haiku-20240307-v1:0")
     max_tokens: int = Field(default=1000)
     temperature: float = Field(default=0.7)
+    # Bedrock prompt caching; the model must support it (Claude 3 Haiku does not)
+    prompt_caching: bool = Field(default=False)
+    # Open the bedrock-runtime HTTPS connection when the runtime starts
+    warm_up_on_start: bool = Field(default=False)
 
 
 class MemorySettings(BaseSettings):
@@ -20,6 +24,11 @@ class MemorySettings(BaseSettings):
     event_expiry_days: int = Field(default=30)
     actor_id: str = Field(default="default_user")
     session_id: str = Field(default="session_001")
+    # Memory session handles kept per process, keyed by actor and session
+    session_cache_size: int = Field(default=1024)
+    # Where turns are stored: "agentcore" (AgentCore Memory) or "sqlite" (a local file)
+    backend: str = Field(default="agentcore")
+    sqlite_path: str = Field(default=".agent_memory.db")
 
 
 class CognitoSettings(BaseSettings):
@@ -35,6 +44,15 @@ class GatewaySettings(BaseSettings):
     name: str = Field(default="AgentGateway")
     enable_semantic_search: bool = Field(default=True)
     lambda_target_name: str = Field(default="AgentTools")
+    # Gateway MCP URLs, e.g. one per region; the agent connects to the best-scoring one
+    endpoints: list[str] = Field(default_factory=list)
+    # Background probing of the endpoints when there are several; 0 disables it
+    probe_interval_seconds: float = Field(default=10.0)
+    probe_timeout_seconds: float = Field(default=2.0)
+    # Weight of the newest sample in the latency and health moving averages
+    ewma_alpha: float = Field(default=0.3)
+    # Endpoints whose health (moving average of successes) is below this are tried last
+    min_health: float = Field(default=0.5)
 
 
 class LambdaSettings(BaseSettings):
@@ -48,6 +66,170 @@ class S3Settings(BaseSettings):
     documents_bucket: str = Field(default="model-optimized-bucket")
 
 
+class TracingSettings(BaseSettings):
+    enabled: bool = Field(default=False)
+    log_timings: bool = Field(default=True)
+    return_timings: bool = Field(default=False)
+    # The metrics report is logged at most this often from the invocation path; 0 turns it off
+    metrics_log_interval_seconds: float = Field(default=60.0)
+
+
+class LoggingSettings(BaseSettings):
+    level: str = Field(default="INFO")
+    enqueue: bool = Field(default=True)
+    max_payload_chars: int = Field(default=200)
+    sample_rates: dict[str, float] = Field(
+        default_factory=lambda: {"prompt": 1.0, "history": 1.0, "memory_write": 0.1}
+    )
+
+
+class RuntimeSettings(BaseSettings):
+    async_entrypoint: bool = Field(default=True)
+    max_concurrent_invocations: int = Field(default=64)
+    blocking_io_threads: int = Field(default=64)
+    prewarm_on_start: bool = Field(default=True)
+    # Longest the server waits for pre-warming before it starts taking requests
+    prewarm_timeout_seconds: float = Field(default=10.0)
+
+
+class AdmissionSettings(BaseSettings):
+    # Per-actor token bucket; a rate of 0 turns rate limiting off
+    rate_per_second: float = Field(default=0.0)
+    burst: float = Field(default=10.0)
+    # Requests beyond runtime.max_concurrent_invocations wait in this queue
+    max_queue: int = Field(default=128)
+    max_queue_wait_seconds: float = Field(default=30.0)
+    max_actors: int = Field(default=10_000)
+    # The metrics report lists the queue time of this many actors that waited longest
+    report_actors: int = Field(default=10)
+
+
+class ToolSettings(BaseSettings):
+    max_parallel: int = Field(default=4)
+    timeout_seconds: float = Field(default=30.0)
+
+
+class ToolCacheSettings(BaseSettings):
+    enabled: bool = Field(default=True)
+    max_entries: int = Field(default=1024)
+    max_bytes: int = Field(default=16 * 1024 * 1024)
+    # Per-tool policy: "always", "never" or "ttl"; unlisted tools are never cached
+    policies: dict[str, str] = Field(
+        default_factory=lambda: {
+            "calculator": "always",
+            "get_current_time": "never",
+            "read_s3_document": "ttl",
+        }
+    )
+    ttl_seconds: dict[str, float] = Field(default_factory=lambda: {"read_s3_document": 300.0})
+    default_ttl_seconds: float = Field(default=60.0)
+
+
+class ToolResilienceSettings(BaseSettings):
+    # Idempotent tools get a duplicate call once the first one is slower than usual
+    hedged_tools: list[str] = Field(default_factory=lambda: ["calculator", "read_s3_document"])
+    # The hedge starts after this percentile of the tool's recent latencies, within bounds
+    hedge_percentile: float = Field(default=95.0)
+    hedge_min_delay_ms: float = Field(default=50.0)
+    hedge_max_delay_ms: float = Field(default=2000.0)
+    # Used until a tool has min_samples latencies
+    hedge_initial_delay_ms: float = Field(default=1000.0)
+    latency_window: int = Field(default=200)
+    min_samples: int = Field(default=20)
+    # Consecutive failed calls that open a tool's circuit, and how long it stays open
+    breaker_failure_threshold: int = Field(default=5)
+    breaker_open_seconds: float = Field(default=30.0)
+
+
+class ToolOutputSettings(BaseSettings):
+    # Text results over their tool's token limit keep only a head and a tail
+    enabled: bool = Field(default=True)
+    # Keyed by Gateway tool name; read_s3_document also returns the bucket listings
+    max_tokens: dict[str, int] = Field(default_factory=lambda: {"read_s3_document": 2000})
+    default_max_tokens: int = Field(default=4000)
+    # Token estimate used for the limits, without calling a tokenizer
+    chars_per_token: float = Field(default=4.0)
+    # Share of the limit spent on the head; the rest goes to the tail
+    head_fraction: float = Field(default=0.8)
+    # Where full results are kept for read_tool_output: "memory", "disk" or "none"
+    store: str = Field(default="memory")
+    store_dir: str = Field(default=".tool_outputs")
+    store_max_bytes: int = Field(default=64 * 1024 * 1024)
+    store_ttl_seconds: float = Field(default=3600.0)
+    # Size of each chunk read_tool_output returns
+    continuation_max_tokens: int = Field(default=2000)
+
+
+class ToolSelectionSettings(BaseSettings):
+    enabled: bool = Field(default=False)
+    strategy: str = Field(default="local")  # "local" index or "gateway" semantic search
+    top_k: int = Field(default=3)
+    # Expose every tool when the best match scores below this
+    fallback_min_score: float = Field(default=0.1)
+
+
+class RoutingSettings(BaseSettings):
+    enabled: bool = Field(default=False)
+    fast_model_id: str = Field(default="anthropic.claude-3-haiku-20240307-v1:0")
+    strong_model_id: str = Field(default="anthropic.claude-3-5-sonnet-20240620-v1:0")
+    # A prompt exceeding any of these goes to the strong model
+    max_fast_prompt_chars: int = Field(default=400)
+    max_fast_history_turns: int = Field(default=10)
+    max_fast_tools: int = Field(default=1)
+    tool_match_min_score: float = Field(default=0.2)
+    strong_keywords: list[str] = Field(
+        default_factory=lambda: [
+            "analyze",
+            "compare",
+            "explain",
+            "step by step",
+            "summarize",
+            "why",
+        ]
+    )
+    escalate_on_error: bool = Field(default=True)
+
+
+class ResponseCacheSettings(BaseSettings):
+    enabled: bool = Field(default=False)
+    ttl_seconds: float = Field(default=3600.0)
+    max_entries: int = Field(default=1024)
+    max_bytes: int = Field(default=16 * 1024 * 1024)
+
+
+class RecallSettings(BaseSettings):
+    # "recent" loads the last turns; "relevant" recalls turns similar to each prompt
+    mode: str = Field(default="recent")
+    recent_turns: int = Field(default=10)
+    # In "relevant" mode: the latest turns are always kept, plus the top_k most similar
+    keep_last_turns: int = Field(default=2)
+    top_k: int = Field(default=4)
+    min_score: float = Field(default=0.1)
+    embedder: str = Field(default="hashing")  # "hashing" or "bedrock"
+    embedding_model_id: str = Field(default="amazon.titan-embed-text-v2:0")
+    dimensions: int = Field(default=512)
+    bootstrap_turns: int = Field(default=100)
+    max_turns: int = Field(default=1000)
+    max_sessions: int = Field(default=256)
+
+
+class SummarySettings(BaseSettings):
+    enabled: bool = Field(default=False)
+    model_id: str = Field(default="anthropic.claude-3-haiku-20240307-v1:0")
+    # History is the summary plus the turns after it; a fold keeps this many raw
+    # turns and runs once another fold_turns turns are stored after them
+    recent_turns: int = Field(default=4)
+    fold_turns: int = Field(default=6)
+    max_words: int = Field(default=250)
+    max_events: int = Field(default=200)
+    workers: int = Field(default=2)
+
+
+class BatchSettings(BaseSettings):
+    # Sessions run at a time by run_batch
+    max_concurrency: int = Field(default=8)
+
+
 class Settings(BaseSettings):
     aws: AWSSettings = Field(default_factory=AWSSettings)
     model: ModelSettings = Field(default_factory=ModelSettings)
@@ -56,6 +238,20 @@ class Settings(BaseSettings):
     gateway: GatewaySettings = Field(default_factory=GatewaySettings)
     lambda_settings: LambdaSettings = Field(default_factory=LambdaSettings)
     s3: S3Settings = Field(default_factory=S3Settings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    runtime: RuntimeSettings = Field(default_factory=RuntimeSettings)
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+    tools: ToolSettings = Field(default_factory=ToolSettings)
+    tool_cache: ToolCacheSettings = Field(default_factory=ToolCacheSettings)
+    tool_resilience: ToolResilienceSettings = Field(default_factory=ToolResilienceSettings)
+    tool_output: ToolOutputSettings = Field(default_factory=ToolOutputSettings)
+    tool_selection: ToolSelectionSettings = Field(default_factory=ToolSelectionSettings)
+    routing: RoutingSettings = Field(default_factory=RoutingSettings)
+    response_cache: ResponseCacheSettings = Field(default_factory=ResponseCacheSettings)
+    recall: RecallSettings = Field(default_factory=RecallSettings)
+    summary: SummarySettings = Field(default_factory=SummarySettings)
+    batch: BatchSettings = Field(default_factory=BatchSettings)
 
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+
+from loguru import logger
+from mcp.client.streamable_http import streamablehttp_client
+from strands.tools.mcp.mcp_client import MCPClient
+from strands.types.tools import AgentTool, ToolResult, ToolUse
+
+from agentcore_agents.gateway.routing import endpoint_label, get_gateway_router
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.tools.cache import cache_tools
+from agentcore_agents.tools.executor import bound_tools
+from agentcore_agents.tools.resilience import resilient_tools
+from agentcore_agents.tools.wrappers import (
+    ToolWrapper,
+    make_tool_result,
+    run_tool,
+    tool_result_text,
+)
+
+# MCPClient reports a call that failed in transport as an error result starting with this
+TRANSPORT_ERROR_PREFIX = "Tool execution failed:"
+
+
+def transport_failed(result: ToolResult) -> bool:
+    return result.get("status") == "error" and tool_result_text(result).startswith(
+        TRANSPORT_ERROR_PREFIX
+    )
+
+
+def _close(client: Any) -> None:
+    client.__exit__(None, None, None)
+
+
+class FailoverTool(ToolWrapper):
+    """Calls a Gateway tool on its connection's current endpoint.
+
+    A call that fails in transport counts against the endpoint, moves the connection
+    to the next best endpoint and is retried there once. The Gateway tools only read,
+    so a retry is safe.
+    """
+
+    def __init__(self, tool: AgentTool, connection: "GatewayConnection") -> None:
+        super().__init__(tool)
+        self.connection = connection
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        current = self.connection.current_tool(self.tool_name)
+        if current is None:
+            return self._missing_result(tool_use)
+        url, tool = current
+        result = await self._call_on(url, tool, tool_use, invocation_state, **kwargs)
+        if not transport_failed(result):
+            return result
+
+        replacement = await asyncio.to_thread(self.connection.failover, url, self.tool_name)
+        if replacement is None:
+            if self.connection.url != url:
+                # Failed over to an endpoint whose catalog lacks this tool
+                return self._missing_result(tool_use)
+            return result
+        metrics.increment("gateway.tool_retries", tool=self.base_name)
+        return await self._call_on(*replacement, tool_use, invocation_state, **kwargs)
+
+    def _missing_result(self, tool_use: ToolUse) -> ToolResult:
+        return make_tool_result(
+            tool_use,
+            f"Tool {self.base_name} is not available on Gateway endpoint "
+            f"{endpoint_label(self.connection.url)}",
+            status="error",
+        )
+
+    async def _call_on(
+        self,
+        url: str,
+        tool: AgentTool,
+        tool_use: ToolUse,
+        invocation_state: dict[str, Any],
+        **kwargs: Any,
+    ) -> ToolResult:
+        try:
+            result = await run_tool(tool, tool_use, invocation_state, **kwargs)
+        except Exception as e:
+            result = make_tool_result(tool_use, f"{TRANSPORT_ERROR_PREFIX} {e!s}", status="error")
+        self.connection.router.record_result(url, not transport_failed(result))
+        return result
+
+
+class GatewayConnection:
+    """An open MCP session to a Gateway endpoint and its tool catalog; agents can share one.
+
+    Given several endpoints, it connects to the best-ranked one that answers, and its
+    tools fail over to the next best endpoint when a call fails in transport.
+    """
+
+    def __init__(
+        self,
+        gateway_url: str | Sequence[str],
+        access_token: str,
+        tracer: StageTracer | None = None,
+    ) -> None:
+        endpoints = [gateway_url] if isinstance(gateway_url, str) else list(gateway_url)
+        if not endpoints:
+            raise ValueError("At least one Gateway endpoint is required")
+        self.router = get_gateway_router(endpoints)
+        self._access_token = access_token
+        self._failover_lock = threading.Lock()
+        # Swapped as a whole on failover, so readers never see a mixed state
+        self._current = self._connect(self.router.ranked(), tracer or StageTracer())
+
+        tools: list[AgentTool] = list(self._current[2].values())
+        if len(self.router.endpoints) > 1:
+            tools = [FailoverTool(tool, self) for tool in tools]
+        # Cache hits are served before the circuit breaker and a concurrency slot; each
+        # hedged attempt takes its own slot
+        self.tools = cache_tools(resilient_tools(bound_tools(tools)))
+        logger.debug("Found {} tools from Gateway", len(self.tools))
+
+    @property
+    def url(self) -> str:
+        return self._current[0]
+
+    @property
+    def client(self) -> MCPClient:
+        return self._current[1]
+
+    def _connect(
+        self, candidates: list[str], tracer: StageTracer
+    ) -> tuple[str, MCPClient, dict[str, AgentTool]]:
+        error: Exception | None = None
+        for url in candidates:
+            logger.info("Connecting to Gateway to get tools...")
+            started = time.perf_counter()
+            client = MCPClient(
+                partial(
+                    streamablehttp_client,
+                    url,
+                    headers={"Authorization": f"Bearer {self._access_token}"},
+                )
+            )
+            try:
+                with tracer.span("gateway.connect", endpoint=endpoint_label(url)):
+                    client.__enter__()
+                try:
+                    with tracer.span("gateway.list_tools"):
+                        tools = client.list_tools_sync()
+                except Exception:
+                    _close(client)
+                    raise
+            except Exception as e:
+                logger.warning(f"Could not connect to Gateway endpoint {url}: {e}")
+                self.router.record_result(url, False)
+                error = e
+                continue
+
+            self.router.record_result(url, True)
+            metrics.observe(
+                "gateway.connect_ms",
+                (time.perf_counter() - started) * 1000,
+                endpoint=endpoint_label(url),
+            )
+            return url, client, {tool.tool_name: tool for tool in tools}
+
+        if error is None:
+            raise ConnectionError("No other Gateway endpoint to connect to")
+        raise error
+
+    def current_tool(self, tool_name: str) -> tuple[str, AgentTool] | None:
+        """The current endpoint and its tool of this name, or None if its catalog lacks it."""
+        url, _, tools = self._current
+        tool = tools.get(tool_name)
+        return (url, tool) if tool is not None else None
+
+    def failover(self, failed_url: str, tool_name: str) -> tuple[str, AgentTool] | None:
+        """Moves to the next best endpoint unless another call already has.
+
+        Returns the endpoint and tool to retry on, or None if no other endpoint connects.
+        """
+        with self._failover_lock:
+            if self.url == failed_url:
+                candidates = [url for url in self.router.ranked() if url != failed_url]
+                try:
+                    replacement = self._connect(candidates, StageTracer(enabled=False))
+                except Exception as e:
+                    logger.error(f"Gateway failover from {failed_url} failed: {e}")
+                    return None
+                previous, self._current = self._current, replacement
+                metrics.increment("gateway.failovers", endpoint=endpoint_label(replacement[0]))
+                logger.warning(f"Gateway failed over from {failed_url} to {replacement[0]}")
+                # Calls still running on the old session fail and retry on the new one
+                _close(previous[1])
+
+        return self.current_tool(tool_name)
+
+    def __enter__(self) -> "GatewayConnection":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _close(self.client)
@@ -0,0 +1,166 @@
+import math
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Sequence
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+
+
+def endpoint_label(url: str) -> str:
+    return urlparse(url).netloc or url
+
+
+@dataclass
+class EndpointStats:
+    url: str
+    # Moving averages of probe latency and of outcomes (1 success, 0 failure)
+    latency_ms: float | None = None
+    health: float = 1.0
+
+
+class GatewayRouter:
+    """Ranks Gateway endpoints by moving-average latency and health.
+
+    Latency comes from background probes; health also counts the outcome of every
+    connect and tool call. Healthy endpoints rank by latency divided by health, and
+    endpoints below `min_health` rank after them, so they are only used when all
+    the others fail.
+    """
+
+    def __init__(self, endpoints: Sequence[str], alpha: float, min_health: float) -> None:
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.alpha = alpha
+        self.min_health = min_health
+        self.stats = {url: EndpointStats(url) for url in self.endpoints}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record_latency(self, url: str, latency_ms: float) -> None:
+        with self._lock:
+            stats = self.stats[url]
+            if stats.latency_ms is None:
+                stats.latency_ms = latency_ms
+            else:
+                stats.latency_ms += self.alpha * (latency_ms - stats.latency_ms)
+
+    def record_result(self, url: str, ok: bool) -> None:
+        with self._lock:
+            stats = self.stats[url]
+            stats.health += self.alpha * (float(ok) - stats.health)
+            health = stats.health
+        if not ok:
+            metrics.increment("gateway.endpoint_failures", endpoint=endpoint_label(url))
+            if health < self.min_health:
+                logger.warning(f"Gateway endpoint {url} is unhealthy (health {health:.2f})")
+
+    def ranked(self) -> list[str]:
+        with self._lock:
+            stats = [self.stats[url] for url in self.endpoints]
+
+            def score(item: tuple[int, EndpointStats]) -> tuple[bool, float, float, int]:
+                index, endpoint = item
+                # Unprobed endpoints rank behind probed ones, by health and configured order
+                latency = math.inf if endpoint.latency_ms is None else endpoint.latency_ms
+                expected = latency / max(endpoint.health, 0.01)
+                return endpoint.health < self.min_health, expected, -endpoint.health, index
+
+            return [endpoint.url for _, endpoint in sorted(enumerate(stats), key=score)]
+
+    def state(self) -> dict[str, object]:
+        """The ranking and each endpoint's moving averages."""
+        ranking = self.ranked()
+        with self._lock:
+            endpoints = {
+                url: {
+                    "latency_ms": None if stats.latency_ms is None else round(stats.latency_ms, 1),
+                    "health": round(stats.health, 3),
+                }
+                for url, stats in self.stats.items()
+            }
+        return {"ranking": ranking, "endpoints": endpoints}
+
+    def probe(self, url: str, timeout: float) -> None:
+        """Times one unauthenticated request; any answer below 500 means the endpoint is up."""
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=timeout):
+                pass
+            ok = True
+        except urllib.error.HTTPError as e:
+            # The MCP endpoint rejects a GET without a token; that still proves it is serving
+            ok = e.code < 500
+        except (OSError, ValueError) as e:
+            logger.debug(f"Probe of {url} failed: {e}")
+            ok = False
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        metrics.observe("gateway.probe_ms", latency_ms, endpoint=endpoint_label(url))
+        if ok:
+            self.record_latency(url, latency_ms)
+        self.record_result(url, ok)
+
+    def probe_all(self, timeout: float) -> None:
+        for url in self.endpoints:
+            self.probe(url, timeout)
+
+    def start(self, interval: float, timeout: float) -> None:
+        """Probes every endpoint now and then every `interval` seconds in a daemon thread."""
+        if self._thread is not None:
+            return
+
+        def run() -> None:
+            ranking: list[str] = []
+            while not self._stop.is_set():
+                self.probe_all(timeout)
+                current = self.ranked()
+                if current != ranking:
+                    ranking = current
+                    logger.info("Gateway endpoint ranking: {}", self.state())
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=run, name="gateway-prober", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+_routers: dict[tuple[str, ...], GatewayRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_gateway_router(endpoints: Sequence[str]) -> GatewayRouter:
+    """Returns the process-wide router of these endpoints, probing them if there are several."""
+    key = tuple(dict.fromkeys(endpoints))
+    with _routers_lock:
+        router = _routers.get(key)
+        if router is None:
+            config = settings.gateway
+            router = _routers[key] = GatewayRouter(key, config.ewma_alpha, config.min_health)
+            if len(key) > 1 and config.probe_interval_seconds > 0:
+                router.start(config.probe_interval_seconds, config.probe_timeout_seconds)
+    return router
+
+
+def gateway_routing_state() -> list[dict[str, object]]:
+    with _routers_lock:
+        routers = list(_routers.values())
+    return [router.state() for router in routers]
+
+
+metrics.add_reporter("gateway_routing", gateway_routing_state)
+
+
+def clear_gateway_routers() -> None:
+    with _routers_lock:
+        for router in _routers.values():
+            router.stop()
+        _routers.clear()
@@ -27,7 +27,7 @@ class GatewaySetup:
         return cognito_response
 
     def get_or_create_gateway(self, authorizer_config: dict, name: str | None = None) -> dict:
-        existing = self._find_gateway_by_name(name)
+        existing = self.find_gateway(name)
         if existing:
             gateway_id = existing.get("gatewayId") or existing.get("id")
             logger.info(f"Gateway '{name}' already exists with ID: {gateway_id}")
@@ -57,7 +57,7 @@ class GatewaySetup:
 
         return gateway
 
-    def _find_gateway_by_name(self, name: str | None) -> dict | None:
+    def find_gateway(self, name: str | None) -> dict | None:
         if not name:
             return None
 
@@ -133,7 +133,7 @@ class GatewaySetup:
     def get_gateway_info(self, gateway_name: str | None = None) -> dict:
         if gateway_name is None:
             gateway_name = settings.gateway.name
-        gateway = self._find_gateway_by_name(gateway_name)
+        gateway = self.find_gateway(gateway_name)
         if not gateway:
             raise ValueError(f"Gateway '{gateway_name}' not found")
 
@@ -147,7 +147,7 @@ class GatewaySetup:
     def get_client_info_from_gateway(self, gateway_name: str | None = None) -> dict:
         if gateway_name is None:
             gateway_name = settings.gateway.name
-        gateway = self._find_gateway_by_name(gateway_name)
+        gateway = self.find_gateway(gateway_name)
         if not gateway:
             raise ValueError(f"Gateway '{gateway_name}' not found")
 
@@ -1,5 +1,7 @@
+import json
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Any
 
@@ -10,6 +12,13 @@ logger.setLevel(logging.INFO)
 
 s3_client = boto3.client("s3")
 
+# CloudWatch namespace of the Embedded Metric Format record each invocation prints
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "AgentCoreAgents/Tools")
+
+_cold_start = True
+# (milliseconds, bytes) of the current invocation's S3 GETs; one invocation runs at a time
+_s3_reads: list[tuple[float, int]] = []
+
 
 def calculator(expression: str) -> str:
     try:
@@ -64,8 +73,10 @@ def read_s3_document(bucket: str | None = None, key: str | None = None) -> str:
         return list_s3_files(bucket, prefix="")
 
     try:
+        started = time.perf_counter()
         response = s3_client.get_object(Bucket=bucket, Key=key)
         content = response["Body"].read()
+        _s3_reads.append(((time.perf_counter() - started) * 1000, len(content)))
 
         content_type = response.get("ContentType", "")
 
@@ -80,25 +91,7 @@ def read_s3_document(bucket: str | None = None, key: str | None = None) -> str:
         return f"Error reading file: {str(e)}"
 
 
-def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
-    delimiter = "___"
-
-    tool_name_full = ""
-    if (
-        hasattr(context, "client_context")
-        and context.client_context
-        and hasattr(context.client_context, "custom")
-    ):
-        tool_name_full = context.client_context.custom.get("bedrockAgentCoreToolName", "")
-
-    if not tool_name_full and hasattr(context, "bedrockAgentCoreToolName"):
-        tool_name_full = context.bedrockAgentCoreToolName
-
-    if delimiter in tool_name_full:
-        tool_name = tool_name_full[tool_name_full.index(delimiter) + len(delimiter) :]
-    else:
-        tool_name = tool_name_full
-
+def _dispatch(tool_name: str, event: dict[str, Any]) -> dict[str, Any]:
     try:
         if tool_name == "calculator":
             expression = event.get("expression", "")
@@ -124,3 +117,94 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Error executing tool {tool_name}: {e}")
         return {"error": str(e)}
+
+
+def metrics_record(
+    tool_name: str,
+    status: str,
+    duration_ms: float,
+    bytes_returned: int,
+    cold_start: bool,
+    s3_reads: list[tuple[float, int]],
+    request_id: str | None = None,
+) -> dict[str, Any]:
+    """One CloudWatch Embedded Metric Format record of an invocation."""
+    metrics = [
+        {"Name": "Duration", "Unit": "Milliseconds"},
+        {"Name": "BytesReturned", "Unit": "Bytes"},
+        {"Name": "ColdStart", "Unit": "Count"},
+    ]
+    values: dict[str, Any] = {
+        "Duration": round(duration_ms, 3),
+        "BytesReturned": bytes_returned,
+        "ColdStart": int(cold_start),
+    }
+    # S3 metrics only appear for invocations that read from S3
+    if s3_reads:
+        metrics += [
+            {"Name": "S3GetLatency", "Unit": "Milliseconds"},
+            {"Name": "S3BytesRead", "Unit": "Bytes"},
+        ]
+        values["S3GetLatency"] = round(sum(ms for ms, _ in s3_reads), 3)
+        values["S3BytesRead"] = sum(size for _, size in s3_reads)
+    record: dict[str, Any] = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": METRICS_NAMESPACE,
+                    "Dimensions": [["ToolName", "Status"]],
+                    "Metrics": metrics,
+                }
+            ],
+        },
+        "ToolName": tool_name or "unknown",
+        "Status": status,
+        **values,
+    }
+    if request_id:
+        record["RequestId"] = request_id
+    return record
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    delimiter = "___"
+
+    tool_name_full = ""
+    if (
+        hasattr(context, "client_context")
+        and context.client_context
+        and hasattr(context.client_context, "custom")
+    ):
+        tool_name_full = context.client_context.custom.get("bedrockAgentCoreToolName", "")
+
+    if not tool_name_full and hasattr(context, "bedrockAgentCoreToolName"):
+        tool_name_full = context.bedrockAgentCoreToolName
+
+    if delimiter in tool_name_full:
+        tool_name = tool_name_full[tool_name_full.index(delimiter) + len(delimiter) :]
+    else:
+        tool_name = tool_name_full
+
+    global _cold_start
+    cold_start, _cold_start = _cold_start, False
+    _s3_reads.clear()
+    started = time.perf_counter()
+    response = _dispatch(tool_name, event)
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    # The tools report their own failures as "Error: ..." results
+    failed = "error" in response or str(response.get("result", "")).startswith("Error")
+    record = metrics_record(
+        tool_name,
+        "error" if failed else "success",
+        duration_ms,
+        # ASCII-escaped JSON, so characters are bytes
+        len(json.dumps(response)),
+        cold_start,
+        _s3_reads,
+        getattr(context, "aws_request_id", None),
+    )
+    # Lambda sends stdout to CloudWatch Logs, which extracts the metrics from the record
+    print(json.dumps(record, separators=(",", ":")), flush=True)
+    return response
@@ -0,0 +1,31 @@
+from typing import Any, Protocol
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage
+from bedrock_agentcore.memory.models.filters import EventMetadataFilter, MetadataValue
+
+
+class SessionMemory(Protocol):
+    """The short-term memory of one actor's session, as the hooks use it.
+
+    `MemorySession` from the AgentCore SDK implements it; events and turns are
+    dict-like in the shape of the AgentCore data plane API.
+    """
+
+    def get_last_k_turns(self, k: int = 5) -> list[list[Any]]: ...
+
+    def add_turns(
+        self,
+        messages: list[ConversationalMessage | BlobMessage],
+        *,
+        metadata: dict[str, MetadataValue] | None = None,
+    ) -> Any: ...
+
+    def list_events(
+        self, *, eventMetadata: list[EventMetadataFilter] | None = None, max_results: int = 100
+    ) -> list[Any]: ...
+
+    def delete_event(self, event_id: str) -> Any: ...
+
+
+class MemoryBackend(Protocol):
+    def get_or_create_session(self, actor_id: str, session_id: str) -> SessionMemory: ...
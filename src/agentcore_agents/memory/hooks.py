@@ -1,16 +1,77 @@
+import asyncio
 from typing import Any
 
 from bedrock_agentcore.memory.constants import ConversationalMessage, MessageRole
-from bedrock_agentcore.memory.session import MemorySession
 from loguru import logger
+from strands import Agent
 from strands.hooks import AgentInitializedEvent, HookProvider, HookRegistry, MessageAddedEvent
+from strands.types.content import Messages, Role
+
+from agentcore_agents.config import settings
+from agentcore_agents.memory.backend import SessionMemory
+from agentcore_agents.memory.recall import RecallIndex
+from agentcore_agents.memory.summary import (
+    ConversationSummarizer,
+    load_summary,
+    summary_messages,
+    unsummarized_history,
+)
+from agentcore_agents.observability.logs import log_hot, truncate
+from agentcore_agents.observability.tracing import StageTracer
+
+
+def history_messages(recent_turns: list[list[Any]]) -> Messages:
+    """Converts memory turns into Converse messages that alternate user/assistant."""
+    messages: Messages = []
+    for turn in recent_turns:
+        for message in turn:
+            role = message.get("role")
+            if role not in (MessageRole.USER.value, MessageRole.ASSISTANT.value):
+                continue
+            content = message.get("content", {})
+            text = content.get("text", "") if isinstance(content, dict) else str(content)
+            if not text:
+                continue
+
+            strands_role: Role = "user" if role == MessageRole.USER.value else "assistant"
+            if messages and messages[-1]["role"] == strands_role:
+                messages[-1]["content"].append({"text": text})
+            else:
+                messages.append({"role": strands_role, "content": [{"text": text}]})
+
+    # Converse wants a user message first, and the new prompt is the next user message
+    while messages and messages[0]["role"] != "user":
+        messages.pop(0)
+    while messages and messages[-1]["role"] != "assistant":
+        messages.pop()
+    return messages
 
 
 class MemoryHookProvider(HookProvider):
-    def __init__(self, memory_session: MemorySession, actor_id: str, session_id: str) -> None:
+    def __init__(
+        self,
+        memory_session: SessionMemory,
+        actor_id: str,
+        session_id: str,
+        tracer: StageTracer | None = None,
+        cache_history: bool = False,
+        recent_turns: int = 10,
+        recall_index: RecallIndex | None = None,
+        summarizer: ConversationSummarizer | None = None,
+    ) -> None:
         self.memory_session = memory_session
         self.actor_id = actor_id
         self.session_id = session_id
+        self.tracer = tracer or StageTracer()
+        self.cache_history = cache_history
+        self.recent_turns = recent_turns
+        # With an index, history is recalled per prompt instead of loaded at startup
+        self.recall_index = recall_index
+        self._recall_before: int | None = None
+        # With a summarizer, history is the session summary plus a few recent turns
+        self.summarizer = summarizer
+        # The messages last inserted as history, by identity
+        self._history: Messages = []
 
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
         registry.add_callback(MessageAddedEvent, self.on_message_added)
@@ -18,44 +79,105 @@ class MemoryHookProvider(HookProvider):
         logger.info("Memory hooks registered")
 
     def on_agent_initialized(self, event: AgentInitializedEvent) -> None:
-        self._load_conversation_history(event)
+        if self.recall_index is not None:
+            # Turns written from now on are also in the agent's own messages
+            self._recall_before = self.recall_index.total_turns
+            return
+        with self.tracer.span("memory.load_history"):
+            self._load_conversation_history(event)
 
-    def on_message_added(self, event: MessageAddedEvent) -> None:
-        self._save_message(event)
+    async def on_message_added(self, event: MessageAddedEvent) -> None:
+        # Memory writes are blocking boto calls; keep them off the agent's event loop
+        await asyncio.to_thread(self._save_message, event)
 
     def _load_conversation_history(self, event: AgentInitializedEvent) -> None:
-        logger.info(
-            f"Loading conversation history for actor_id={self.actor_id}, "
-            "session_id={self.session_id}"
+        logger.debug(
+            "Loading conversation history for actor_id={}, session_id={}",
+            self.actor_id,
+            self.session_id,
         )
         try:
-            recent_turns = self.memory_session.get_last_k_turns(k=10)
-            if not recent_turns:
-                return
-
-            context_messages = []
-            for turn in recent_turns:
-                for message in turn:
-                    role = message.get("role", "unknown")
-                    content = message.get("content", {})
-                    text = content.get("text", "") if isinstance(content, dict) else str(content)
-                    context_messages.append(f"{role}: {text}")
-
-            context = "\n".join(context_messages)
-            logger.info(
-                f"[{self.actor_id}:{self.session_id}] "
-                "Context being injected into system prompt:\n{context}"
-            )
-
-            if event.agent.system_prompt:
-                event.agent.system_prompt += f"\n\nRecent conversation:\n{context}"
+            if self.summarizer is not None:
+                summary = load_summary(self.memory_session)
+                recent_turns = unsummarized_history(self.memory_session, summary)
+                history = summary_messages(summary) + history_messages(recent_turns)
             else:
-                event.agent.system_prompt = f"Recent conversation:\n{context}"
-
-            logger.info(f"Loaded {len(recent_turns)} conversation turns")
+                recent_turns = self.memory_session.get_last_k_turns(k=self.recent_turns)
+                history = history_messages(recent_turns)
+            self._insert_history(event.agent, history)
+            logger.debug("Loaded {} conversation turns", len(recent_turns))
         except Exception as e:
             logger.error(f"Failed to load conversation history: {e}")
 
+    def recall_history(self, agent: Agent, prompt: str) -> None:
+        """Replaces the recalled history with the stored turns most relevant to the prompt."""
+        if self.recall_index is None:
+            return
+        try:
+            with self.tracer.span("memory.recall"):
+                turns = self.recall_index.search(
+                    prompt,
+                    top_k=settings.recall.top_k,
+                    keep_last=settings.recall.keep_last_turns,
+                    min_score=settings.recall.min_score,
+                    before=self._recall_before,
+                )
+            self._insert_history(agent, history_messages(turns))
+            logger.debug("Recalled {} of {} turns", len(turns), len(self.recall_index))
+        except Exception as e:
+            logger.error(f"Failed to recall conversation history: {e}")
+
+    def _insert_history(self, agent: Agent, history: Messages) -> None:
+        if not history and not self._history:
+            return
+        # History goes into the conversation, not the system prompt, so the system
+        # prompt and tool specs stay a stable prefix for prompt caching
+        if history and self.cache_history:
+            history[-1]["content"].append({"cachePoint": {"type": "default"}})
+
+        log_hot(
+            "history",
+            "DEBUG",
+            "[{}:{}] History loaded into messages:\n{}",
+            lambda: self.actor_id,
+            lambda: self.session_id,
+            lambda: truncate(
+                "\n".join(
+                    f"{m['role']}: {block['text']}"
+                    for m in history
+                    for block in m["content"]
+                    if "text" in block
+                )
+            ),
+        )
+
+        # The conversation manager trims from the front, so whatever is left of the
+        # previous history is a prefix of the messages, possibly a shorter one
+        inserted = {id(message) for message in self._history}
+        kept = 0
+        while kept < len(agent.messages) and id(agent.messages[kept]) in inserted:
+            kept += 1
+        agent.messages[:kept] = history
+        self._history = history
+
+    def save_turn(self, user_text: str, assistant_text: str) -> None:
+        """Stores a turn that was answered without running the agent."""
+        try:
+            with self.tracer.span("memory.write", role="TURN"):
+                self.memory_session.add_turns(
+                    messages=[
+                        ConversationalMessage(user_text, MessageRole.USER),
+                        ConversationalMessage(assistant_text, MessageRole.ASSISTANT),
+                    ]
+                )
+            if self.recall_index is not None:
+                self.recall_index.add_message(MessageRole.USER.value, user_text)
+                self.recall_index.add_message(MessageRole.ASSISTANT.value, assistant_text)
+            if self.summarizer is not None:
+                self.summarizer.turn_saved(self.memory_session, self.actor_id, self.session_id)
+        except Exception as e:
+            logger.error(f"[{self.actor_id}:{self.session_id}] Failed to save turn: {e}")
+
     def _save_message(self, event: MessageAddedEvent) -> None:
         try:
             messages = event.agent.messages
@@ -71,14 +193,28 @@ class MemoryHookProvider(HookProvider):
                 MessageRole.USER if last_message["role"] == "user" else MessageRole.ASSISTANT
             )
 
-            result = self.memory_session.add_turns(
-                messages=[ConversationalMessage(message_text, message_role)]
-            )
-
-            event_id = result.get("eventId", "unknown")
-            logger.info(
-                f"[{self.actor_id}:{self.session_id}] Stored message with Event ID: {event_id}, "
-                "Role: {message_role.value}"
+            with self.tracer.span("memory.write", role=message_role.value):
+                result = self.memory_session.add_turns(
+                    messages=[ConversationalMessage(message_text, message_role)]
+                )
+            if self.recall_index is not None:
+                self.recall_index.add_message(message_role.value, message_text)
+            # A turn is complete at the assistant message that calls no more tools
+            if (
+                self.summarizer is not None
+                and message_role == MessageRole.ASSISTANT
+                and not any("toolUse" in block for block in last_message["content"])
+            ):
+                self.summarizer.turn_saved(self.memory_session, self.actor_id, self.session_id)
+
+            log_hot(
+                "memory_write",
+                "INFO",
+                "[{}:{}] Stored message with Event ID: {}, Role: {}",
+                lambda: self.actor_id,
+                lambda: self.session_id,
+                lambda: result.get("eventId", "unknown"),
+                lambda: message_role.value,
             )
         except Exception as e:
             logger.error(f"[{self.actor_id}:{self.session_id}] Failed to save message: {e}")
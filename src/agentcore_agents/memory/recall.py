@@ -0,0 +1,215 @@
+import hashlib
+import json
+import threading
+from functools import cache
+from typing import Any, Protocol
+
+import boto3
+import numpy as np
+import numpy.typing as npt
+from bedrock_agentcore.memory.constants import MessageRole
+from loguru import logger
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.memory.backend import SessionMemory
+from agentcore_agents.text import words
+
+type Vectors = npt.NDArray[np.float32]
+
+
+class Embedder(Protocol):
+    dim: int
+
+    def embed(self, texts: list[str]) -> Vectors: ...
+
+
+def _normalize(vectors: Vectors) -> Vectors:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """Deterministic embedding of word stems and stem bigrams hashed into signed buckets."""
+
+    def __init__(self, dim: int = 256) -> None:
+        self.dim = dim
+
+    def embed(self, texts: list[str]) -> Vectors:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            stems = words(text)
+            for feature in [*stems, *(f"{a} {b}" for a, b in zip(stems, stems[1:], strict=False))]:
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest, "little")
+                vectors[row, bucket % self.dim] += 1.0 if bucket >> 63 else -1.0
+        return _normalize(vectors)
+
+
+class BedrockEmbedder:
+    """Titan text embeddings, one InvokeModel call per text."""
+
+    def __init__(self, model_id: str, dim: int, region: str) -> None:
+        self.model_id = model_id
+        self.dim = dim
+        self.client = boto3.client("bedrock-runtime", region_name=region)
+
+    def embed(self, texts: list[str]) -> Vectors:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            response = self.client.invoke_model(
+                modelId=self.model_id,
+                body=json.dumps({"inputText": text, "dimensions": self.dim, "normalize": True}),
+            )
+            vectors[row] = json.loads(response["body"].read())["embedding"]
+        return _normalize(vectors)
+
+
+@cache
+def build_embedder() -> Embedder:
+    if settings.recall.embedder == "bedrock":
+        return BedrockEmbedder(
+            settings.recall.embedding_model_id, settings.recall.dimensions, settings.aws.region
+        )
+    return HashingEmbedder(settings.recall.dimensions)
+
+
+def _turn_text(turn: list[dict[str, Any]]) -> str:
+    return "\n".join(message["content"]["text"] for message in turn)
+
+
+class RecallIndex:
+    """One session's turns and their embeddings, kept as rows of a float32 matrix.
+
+    Rows are unit length, so cosine similarity to a prompt is one matrix-vector product.
+    Turns are numbered from the start of the session; once `max_turns` are held the
+    oldest are dropped.
+    """
+
+    def __init__(self, embedder: Embedder, max_turns: int) -> None:
+        self.embedder = embedder
+        self.max_turns = max_turns
+        self.turns: list[list[dict[str, Any]]] = []
+        self.dropped = 0
+        self._vectors: Vectors = np.zeros((min(16, max_turns), embedder.dim), dtype=np.float32)
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self.max_turns * self.embedder.dim * 4
+
+    @property
+    def total_turns(self) -> int:
+        return self.dropped + len(self.turns)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def load(self, turns: list[list[Any]]) -> None:
+        """Indexes turns as returned by SessionMemory.get_last_k_turns."""
+        loaded = []
+        for turn in turns:
+            messages = [
+                {"role": message["role"], "content": {"text": message["content"]["text"]}}
+                for message in turn
+                if message.get("role") in (MessageRole.USER.value, MessageRole.ASSISTANT.value)
+                and isinstance(message.get("content"), dict)
+                and message["content"].get("text")
+            ]
+            if messages:
+                loaded.append(messages)
+        if not loaded:
+            return
+
+        vectors = self.embedder.embed([_turn_text(turn) for turn in loaded])
+        with self._lock:
+            for turn, vector in zip(loaded, vectors, strict=True):
+                self._append(turn, vector)
+
+    def add_message(self, role: str, text: str) -> None:
+        """Adds a stored message: a user message opens a turn, an assistant message extends it."""
+        message = {"role": role, "content": {"text": text}}
+        # Embedding under the lock keeps rows in write order; a session writes sequentially
+        with self._lock:
+            if role == MessageRole.USER.value or not self.turns:
+                turn = [message]
+                self._append(turn, self.embedder.embed([text])[0])
+            else:
+                turn = self.turns[-1]
+                turn.append(message)
+                self._vectors[len(self.turns) - 1] = self.embedder.embed([_turn_text(turn)])[0]
+
+    def _append(self, turn: list[dict[str, Any]], vector: Vectors) -> None:
+        if len(self.turns) == self.max_turns:
+            self.turns.pop(0)
+            self._vectors[:-1] = self._vectors[1:]
+            self.dropped += 1
+        elif len(self.turns) == len(self._vectors):
+            grown = np.zeros(
+                (min(2 * len(self._vectors), self.max_turns), self.embedder.dim), dtype=np.float32
+            )
+            grown[: len(self.turns)] = self._vectors[: len(self.turns)]
+            self._vectors = grown
+        self.turns.append(turn)
+        self._vectors[len(self.turns) - 1] = vector
+
+    def search(
+        self,
+        prompt: str,
+        top_k: int,
+        keep_last: int = 0,
+        min_score: float = 0.0,
+        before: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Returns, in session order, the last `keep_last` turns and the `top_k` earlier turns
+        most similar to the prompt. `before` excludes turns numbered from it onwards.
+        """
+        query = self.embedder.embed([prompt])[0]
+        with self._lock:
+            end = len(self.turns)
+            if before is not None:
+                end = max(0, min(end, before - self.dropped))
+            recent_start = max(0, end - keep_last)
+            selected = set(range(recent_start, end))
+            if recent_start and top_k > 0:
+                scores = self._vectors[:recent_start] @ query
+                best = np.argsort(-scores, kind="stable")[:top_k]
+                selected.update(int(i) for i in best if scores[i] >= min_score)
+            return [self.turns[i] for i in sorted(selected)]
+
+
+# Sized by each index's worst case, a full float32 matrix
+_index_bytes = settings.recall.max_turns * settings.recall.dimensions * 4
+_indexes = BoundedCache[tuple[str, str], RecallIndex](
+    max_entries=settings.recall.max_sessions,
+    max_bytes=settings.recall.max_sessions * _index_bytes,
+)
+_indexes_lock = threading.Lock()
+
+
+def get_recall_index(actor_id: str, session_id: str, memory_session: SessionMemory) -> RecallIndex:
+    """Returns the process-wide index of a session, bootstrapping it from memory on first use."""
+    key = (actor_id, session_id)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    index = RecallIndex(build_embedder(), settings.recall.max_turns)
+    try:
+        index.load(memory_session.get_last_k_turns(k=settings.recall.bootstrap_turns))
+    except Exception as e:
+        # Not cached, so the next agent for this session tries again
+        logger.error(f"[{actor_id}:{session_id}] Failed to bootstrap recall index: {e}")
+        return index
+
+    with _indexes_lock:
+        existing = _indexes.get(key)
+        if existing is not None:
+            return existing
+        _indexes.put(key, index, index.max_bytes)
+    logger.debug("Indexed {} turns for actor_id={}, session_id={}", len(index), *key)
+    return index
+
+
+def clear_recall_indexes() -> None:
+    _indexes.clear()
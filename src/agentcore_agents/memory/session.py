@@ -1,21 +1,61 @@
+import threading
+
 from bedrock_agentcore.memory.session import MemorySession, MemorySessionManager
 from loguru import logger
 
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+
+_managers: dict[tuple[str, str], MemorySessionManager] = {}
+_managers_lock = threading.Lock()
+# Handles are small; the cache is bounded by count, one unit per handle
+_sessions = BoundedCache[tuple[str, str, str], MemorySession](
+    max_entries=settings.memory.session_cache_size,
+    max_bytes=settings.memory.session_cache_size,
+)
+
+
+def get_session_manager(memory_id: str, region: str) -> MemorySessionManager:
+    """Returns the process-wide session manager, and so boto3 client, for a memory."""
+    key = (memory_id, region)
+    manager = _managers.get(key)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.get(key)
+            if manager is None:
+                manager = _managers[key] = MemorySessionManager(
+                    memory_id=memory_id, region_name=region
+                )
+                logger.debug("MemorySessionManager created for memory: {}", memory_id)
+    return manager
+
+
+def clear_sessions() -> None:
+    with _managers_lock:
+        _managers.clear()
+    _sessions.clear()
+
 
 class AgentSessionManager:
     def __init__(self, memory_id: str, region: str = "eu-central-1") -> None:
         self.memory_id = memory_id
         self.region = region
-        self.manager = MemorySessionManager(memory_id=memory_id, region_name=region)
-        logger.info(f"SessionManager initialized for memory: {memory_id}")
+        self.manager = get_session_manager(memory_id, region)
+        logger.debug("SessionManager initialized for memory: {}", memory_id)
 
     def get_or_create_session(self, actor_id: str, session_id: str) -> MemorySession:
-        logger.info(f"Getting or creating session for actor: {actor_id}, session: {session_id}")
+        key = (self.memory_id, actor_id, session_id)
+        session = _sessions.get(key)
+        if session is not None:
+            return session
+
+        logger.debug("Getting or creating session for actor: {}, session: {}", actor_id, session_id)
         session = self.manager.create_memory_session(actor_id=actor_id, session_id=session_id)
-        logger.info(f"Session ready: {session}")
+        _sessions.put(key, session, size=1)
+        logger.debug("Session ready: {}", session)
         return session
 
     def get_session(self, actor_id: str, session_id: str) -> MemorySession:
-        logger.info(f"Getting session for actor: {actor_id}, session: {session_id}")
+        logger.debug("Getting session for actor: {}, session: {}", actor_id, session_id)
         session = self.manager.get_memory_session(actor_id=actor_id, session_id=session_id)
         return session
@@ -0,0 +1,218 @@
+import json
+import sqlite3
+import threading
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage, MessageRole
+from bedrock_agentcore.memory.models.filters import EventMetadataFilter, MetadataValue, OperatorType
+from loguru import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    actor_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    -- Microseconds since the epoch, UTC
+    timestamp INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_session ON events (actor_id, session_id, timestamp);
+"""
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(timestamp: datetime) -> int:
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + micros * _MICROSECOND
+
+
+def _payload_item(message: ConversationalMessage | BlobMessage) -> dict[str, Any]:
+    if isinstance(message, BlobMessage):
+        return {"blob": message.data}
+    return {"conversational": {"content": {"text": message.text}, "role": message.role.value}}
+
+
+def _metadata_condition(expression: EventMetadataFilter) -> tuple[str, list[str]]:
+    path = json.dumps(expression["left"]["metadataKey"])
+    operator: Any = expression["operator"]
+    # Callers pass either the enum or its string value, as ListEvents accepts both
+    operator = operator.value if isinstance(operator, OperatorType) else operator
+    right = expression.get("right")
+    if operator == OperatorType.EQUALS_TO.value and right is not None:
+        value = right["metadataValue"]["stringValue"]
+        return "json_extract(metadata, ?) = ?", [f"$.{path}.stringValue", value]
+    if operator == OperatorType.EXISTS.value:
+        return "json_extract(metadata, ?) IS NOT NULL", [f"$.{path}"]
+    if operator == OperatorType.NOT_EXISTS.value:
+        return "json_extract(metadata, ?) IS NULL", [f"$.{path}"]
+    raise ValueError(f"Unsupported metadata filter operator: {operator}")
+
+
+class SQLiteMemorySession:
+    """One session's events in the local database, with the AgentCore event shape."""
+
+    def __init__(self, backend: "SQLiteMemoryBackend", actor_id: str, session_id: str) -> None:
+        self.backend = backend
+        self.actor_id = actor_id
+        self.session_id = session_id
+
+    def _event(self, row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "eventId": row["event_id"],
+            "actorId": self.actor_id,
+            "sessionId": self.session_id,
+            "eventTimestamp": _from_micros(row["timestamp"]),
+            "payload": json.loads(row["payload"]),
+            "metadata": json.loads(row["metadata"]),
+        }
+
+    def _newest_first(
+        self,
+        columns: str,
+        conditions: str = "",
+        params: list[Any] | None = None,
+        limit: int = -1,
+    ) -> Iterator[sqlite3.Row]:
+        return self.backend.connection().execute(
+            f"SELECT {columns} FROM events WHERE actor_id = ? AND session_id = ?{conditions}"
+            " ORDER BY timestamp DESC, seq DESC LIMIT ?",
+            [self.actor_id, self.session_id, *(params or []), limit],
+        )
+
+    def add_turns(
+        self,
+        messages: list[ConversationalMessage | BlobMessage],
+        *,
+        metadata: dict[str, MetadataValue] | None = None,
+        event_timestamp: datetime | None = None,
+    ) -> dict[str, Any]:
+        event_id = uuid.uuid4().hex
+        timestamp = _to_micros(event_timestamp or datetime.now(UTC))
+        payload = json.dumps([_payload_item(message) for message in messages])
+        with self.backend.connection() as connection:
+            connection.execute(
+                "INSERT INTO events (event_id, actor_id, session_id, timestamp, payload, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    event_id,
+                    self.actor_id,
+                    self.session_id,
+                    timestamp,
+                    payload,
+                    json.dumps(metadata or {}),
+                ],
+            )
+        return {
+            "eventId": event_id,
+            "actorId": self.actor_id,
+            "sessionId": self.session_id,
+            "eventTimestamp": _from_micros(timestamp),
+        }
+
+    def get_last_k_turns(self, k: int = 5) -> list[list[dict[str, Any]]]:
+        """The last k turns, oldest first; a turn starts at each user message."""
+        # Walks back from the newest event only as far as the k-th user message
+        newest_first: list[dict[str, Any]] = []
+        user_messages = 0
+        for row in self._newest_first("payload"):
+            for item in reversed(json.loads(row["payload"])):
+                if "conversational" in item:
+                    newest_first.append(item["conversational"])
+                    user_messages += item["conversational"]["role"] == MessageRole.USER.value
+            if user_messages >= k:
+                break
+
+        turns: list[list[dict[str, Any]]] = []
+        for message in reversed(newest_first):
+            if message["role"] == MessageRole.USER.value or not turns:
+                turns.append([])
+            turns[-1].append(message)
+        return turns[-k:] if k else []
+
+    def list_events(
+        self, *, eventMetadata: list[EventMetadataFilter] | None = None, max_results: int = 100
+    ) -> list[dict[str, Any]]:
+        """Newest first, like ListEvents; metadata filters must all match."""
+        conditions = ""
+        params: list[Any] = []
+        for expression in eventMetadata or []:
+            condition, values = _metadata_condition(expression)
+            conditions += f" AND {condition}"
+            params += values
+        rows = self._newest_first("*", conditions, params, max_results)
+        return [self._event(row) for row in rows]
+
+    def delete_event(self, event_id: str) -> None:
+        with self.backend.connection() as connection:
+            connection.execute(
+                "DELETE FROM events WHERE event_id = ? AND actor_id = ? AND session_id = ?",
+                [event_id, self.actor_id, self.session_id],
+            )
+
+
+class SQLiteMemoryBackend:
+    """Session memory in a local SQLite file, for development, CI and single-node deployments.
+
+    The database runs in WAL mode, so reads do not wait for the turn writes of other
+    threads; each thread has its own connection. Events older than `expiry_days` are
+    deleted when the backend opens.
+    """
+
+    def __init__(self, path: str | Path, expiry_days: int | None = None) -> None:
+        self.path = Path(path)
+        self._local = threading.local()
+        connection = self.connection()
+        connection.executescript(_SCHEMA)
+        if expiry_days:
+            cutoff = _to_micros(datetime.now(UTC) - timedelta(days=expiry_days))
+            with connection:
+                expired = connection.execute("DELETE FROM events WHERE timestamp < ?", [cutoff])
+            if expired.rowcount:
+                logger.debug("Deleted {} expired memory events", expired.rowcount)
+        logger.debug("SQLite memory opened at {}", self.path)
+
+    def connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            # With WAL, NORMAL only risks the last transactions on power loss, not corruption
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get_or_create_session(self, actor_id: str, session_id: str) -> SQLiteMemorySession:
+        # A session exists once it has events; there is nothing to create up front
+        return SQLiteMemorySession(self, actor_id, session_id)
+
+
+_backends: dict[Path, SQLiteMemoryBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_sqlite_backend(path: str | Path, expiry_days: int | None = None) -> SQLiteMemoryBackend:
+    """Returns the process-wide backend of a database file."""
+    key = Path(path).resolve()
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = _backends[key] = SQLiteMemoryBackend(key, expiry_days)
+    return backend
+
+
+def clear_sqlite_backends() -> None:
+    with _backends_lock:
+        _backends.clear()
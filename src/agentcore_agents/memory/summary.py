@@ -0,0 +1,228 @@
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from bedrock_agentcore.memory.constants import BlobMessage, MessageRole
+from bedrock_agentcore.memory.models.filters import EventMetadataFilter, OperatorType
+from loguru import logger
+from strands import Agent
+from strands.types.content import Messages
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.memory.backend import SessionMemory
+from agentcore_agents.models import get_model
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.prompts.summary import SUMMARY_PROMPT
+
+# Summary records are blob events in the session itself, tagged with this metadata
+RECORD_KEY = "record"
+SUMMARY_RECORD = "conversation_summary"
+
+type Turn = list[tuple[datetime, str, str]]
+
+
+@dataclass
+class ConversationSummary:
+    text: str
+    # Timestamp of the newest message folded into the summary
+    through: datetime
+    folded_turns: int
+    event_id: str | None = None
+
+
+def _summary_filter() -> list[EventMetadataFilter]:
+    # ListEvents takes the operator's string value, as EventMetadataFilter.build_expression does
+    return [
+        {
+            "left": {"metadataKey": RECORD_KEY},
+            "operator": OperatorType.EQUALS_TO.value,  # type: ignore[typeddict-item]
+            "right": {"metadataValue": {"stringValue": SUMMARY_RECORD}},
+        }
+    ]
+
+
+def _parse_summary(event: Any) -> ConversationSummary | None:
+    for item in event.get("payload", []):
+        if "blob" not in item:
+            continue
+        data = item["blob"]
+        if isinstance(data, str):
+            data = json.loads(data)
+        return ConversationSummary(
+            text=data["summary"],
+            through=datetime.fromisoformat(data["through"]),
+            folded_turns=data["folded_turns"],
+            event_id=event.get("eventId"),
+        )
+    return None
+
+
+def load_summary(memory_session: SessionMemory) -> ConversationSummary | None:
+    """Returns the session's newest summary record, if any."""
+    # A fold deletes the record it replaces, so this lists one or two events
+    events = memory_session.list_events(eventMetadata=_summary_filter(), max_results=10)
+    summaries = [summary for event in events if (summary := _parse_summary(event))]
+    return max(summaries, key=lambda summary: summary.through, default=None)
+
+
+def summary_messages(summary: ConversationSummary | None) -> Messages:
+    """Converse messages that put the summary ahead of the recent turns."""
+    if summary is None:
+        return []
+    return [
+        {
+            "role": "user",
+            "content": [{"text": f"Summary of our conversation so far:\n{summary.text}"}],
+        },
+        {"role": "assistant", "content": [{"text": "Noted, I will keep that in mind."}]},
+    ]
+
+
+def _unsummarized_turns(events: list[Any], through: datetime | None) -> list[Turn]:
+    messages = []
+    for event in events:
+        timestamp = event["eventTimestamp"]
+        if through is not None and timestamp <= through:
+            continue
+        for index, item in enumerate(event.get("payload", [])):
+            if "conversational" in item:
+                message = item["conversational"]
+                messages.append((timestamp, index, message["role"], message["content"]["text"]))
+
+    turns: list[Turn] = []
+    for timestamp, _, role, text in sorted(messages, key=lambda m: (m[0], m[1])):
+        if role == MessageRole.USER.value or not turns:
+            turns.append([])
+        turns[-1].append((timestamp, role, text))
+    return turns
+
+
+def unsummarized_history(
+    memory_session: SessionMemory, summary: ConversationSummary | None
+) -> list[list[dict[str, Any]]]:
+    """The turns stored after the summary, oldest first, shaped like get_last_k_turns.
+
+    Between folds up to recent_turns + fold_turns - 1 turns are unsummarized, so
+    loading only the last recent_turns would leave the ones before them out of both
+    the summary and the history.
+    """
+    events = memory_session.list_events(max_results=settings.summary.max_events)
+    turns = _unsummarized_turns(events, summary.through if summary else None)
+    # More are unsummarized only while a fold is pending or failing
+    limit = settings.summary.recent_turns + settings.summary.fold_turns
+    return [
+        [{"role": role, "content": {"text": text}} for _, role, text in turn]
+        for turn in turns[-limit:]
+    ]
+
+
+def summarize_turns(previous: str, turns: list[Turn]) -> str:
+    transcript = "\n".join(f"{role}: {text}" for turn in turns for _, role, text in turn)
+    agent = Agent(
+        model=get_model(settings.summary.model_id),
+        system_prompt=SUMMARY_PROMPT.format(max_words=settings.summary.max_words),
+        callback_handler=None,
+    )
+    result = agent(f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}")
+    return str(result).strip()
+
+
+class ConversationSummarizer:
+    """Folds a session's older turns into one persisted summary, off the request path.
+
+    Stored turns are counted per session; every `fold_turns` of them a background
+    worker summarizes all but the last `recent_turns` unsummarized turns into the
+    previous summary, writes the new summary record and deletes the old one.
+    """
+
+    def __init__(
+        self,
+        summarize: Callable[[str, list[Turn]], str] = summarize_turns,
+        workers: int | None = None,
+    ) -> None:
+        self._summarize = summarize
+        self._workers = workers
+        # Created on the first fold, so a summarizer that is never used starts no threads
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending: set[tuple[str, str]] = set()
+        # Turns stored since a session was last checked; a session not in here is
+        # checked on its next turn
+        self._unchecked = BoundedCache[tuple[str, str], int](max_entries=4096, max_bytes=4096)
+
+    def turn_saved(self, memory_session: SessionMemory, actor_id: str, session_id: str) -> None:
+        key = (actor_id, session_id)
+        with self._lock:
+            if key in self._pending:
+                return
+            unchecked = self._unchecked.get(key)
+            if unchecked is not None and unchecked + 1 < settings.summary.fold_turns:
+                self._unchecked.put(key, unchecked + 1, size=1)
+                return
+            self._unchecked.put(key, 0, size=1)
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers or settings.summary.workers,
+                    thread_name_prefix="summary",
+                )
+            executor = self._executor
+        executor.submit(self._fold_in_background, memory_session, key)
+
+    def _fold_in_background(self, memory_session: SessionMemory, key: tuple[str, str]) -> None:
+        try:
+            self.fold(memory_session)
+        except Exception as e:
+            metrics.increment("memory.summary_errors")
+            logger.error(f"[{key[0]}:{key[1]}] Failed to fold conversation summary: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def fold(self, memory_session: SessionMemory) -> ConversationSummary | None:
+        """Folds the session's older unsummarized turns; returns the new summary, if any."""
+        summary = load_summary(memory_session)
+        # Folding keeps the unsummarized tail short, so the newest events cover it
+        events = memory_session.list_events(max_results=settings.summary.max_events)
+        turns = _unsummarized_turns(events, summary.through if summary else None)
+        recent_turns = settings.summary.recent_turns
+        if len(turns) < recent_turns + settings.summary.fold_turns:
+            return None
+
+        folded = turns[:-recent_turns] if recent_turns else turns
+        text = self._summarize(summary.text if summary else "", folded)
+        new_summary = ConversationSummary(
+            text=text,
+            through=folded[-1][-1][0],
+            folded_turns=(summary.folded_turns if summary else 0) + len(folded),
+        )
+        event = memory_session.add_turns(
+            messages=[
+                BlobMessage(
+                    {
+                        "summary": new_summary.text,
+                        "through": new_summary.through.isoformat(),
+                        "folded_turns": new_summary.folded_turns,
+                    }
+                )
+            ],
+            metadata={RECORD_KEY: {"stringValue": SUMMARY_RECORD}},
+        )
+        new_summary.event_id = event.get("eventId")
+        if summary is not None and summary.event_id:
+            memory_session.delete_event(summary.event_id)
+
+        metrics.increment("memory.summary_folds")
+        metrics.observe("memory.summary_folded_turns", len(folded))
+        logger.debug(
+            "Folded {} turns into the summary ({} in total)", len(folded), new_summary.folded_turns
+        )
+        return new_summary
+
+
+summarizer = ConversationSummarizer()
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+from strands.types.tools import AgentTool
+
+from agentcore_agents.config import settings
+from agentcore_agents.tools.selection import LocalToolIndex
+
+FAST_ROUTE = "fast"
+STRONG_ROUTE = "strong"
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    route: str
+    model_id: str
+    reason: str
+
+    @property
+    def can_escalate(self) -> bool:
+        return self.route == FAST_ROUTE and settings.routing.escalate_on_error
+
+
+def strong_route(reason: str) -> RouteDecision:
+    return RouteDecision(STRONG_ROUTE, settings.routing.strong_model_id, reason)
+
+
+class ModelRouter:
+    """Picks the fast or the strong model for a prompt with cheap heuristics.
+
+    A prompt goes to the strong model when it is long, asks for reasoning, comes
+    with a long history or likely needs several tools; everything else goes fast.
+    """
+
+    def __init__(self, tools: list[AgentTool]) -> None:
+        self.tool_index = LocalToolIndex(tools) if tools else None
+
+    def likely_tool_count(self, prompt: str) -> int:
+        if self.tool_index is None:
+            return 0
+        ranked = self.tool_index.search(prompt, top_k=len(self.tool_index))
+        return sum(1 for _, score in ranked if score >= settings.routing.tool_match_min_score)
+
+    def route(self, prompt: str, history_turns: int) -> RouteDecision:
+        config = settings.routing
+        text = prompt.lower()
+        if len(prompt) > config.max_fast_prompt_chars:
+            return strong_route("long_prompt")
+        if any(keyword in text for keyword in config.strong_keywords):
+            return strong_route("reasoning")
+        if history_turns > config.max_fast_history_turns:
+            return strong_route("long_history")
+        if self.likely_tool_count(prompt) > config.max_fast_tools:
+            return strong_route("multi_tool")
+        return RouteDecision(FAST_ROUTE, config.fast_model_id, "simple")
@@ -0,0 +1,70 @@
+import threading
+from typing import Any
+
+from botocore.exceptions import ClientError
+from loguru import logger
+from strands.models import BedrockModel
+from strands.models.model import Model
+
+from agentcore_agents.config import settings
+
+_models: dict[tuple[str, tuple[tuple[str, Any], ...]], Model] = {}
+_models_lock = threading.Lock()
+
+
+def model_params() -> dict[str, Any]:
+    return {
+        "region_name": settings.aws.region,
+        "max_tokens": settings.model.max_tokens,
+        "temperature": settings.model.temperature,
+        "cache_tools": "default" if settings.model.prompt_caching else None,
+    }
+
+
+def configured_model_ids() -> list[str]:
+    if settings.routing.enabled:
+        return [settings.routing.fast_model_id, settings.routing.strong_model_id]
+    return [settings.model.model_id]
+
+
+def get_model(model_id: str) -> Model:
+    """Returns the process-wide model for a model id and the configured parameters.
+
+    A BedrockModel only reads its config while streaming and its boto3 client is
+    thread-safe, so agents share one instance and its connection pool.
+    """
+    params = model_params()
+    key = (model_id, tuple(sorted(params.items())))
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                logger.debug("Creating shared model for {}", model_id)
+                model = _models[key] = BedrockModel(model_id=model_id, **params)
+    return model
+
+
+def clear_models() -> None:
+    with _models_lock:
+        _models.clear()
+
+
+def warm_up_models() -> None:
+    """Opens the HTTPS connection of each configured model's bedrock-runtime client.
+
+    Uses the free ListAsyncInvokes call: any service response, including an access
+    error, means the TLS handshake is done and the connection is pooled.
+    """
+    for model_id in configured_model_ids():
+        client = getattr(get_model(model_id), "client", None)
+        if client is None:
+            continue
+        try:
+            client.list_async_invokes(maxResults=1)
+        except ClientError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not warm up connection for {model_id}: {e}")
+            continue
+        logger.debug("Warmed up connection for {}", model_id)
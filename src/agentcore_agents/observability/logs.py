@@ -0,0 +1,58 @@
+import random
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from agentcore_agents.config import settings
+
+_configured = False
+
+
+def configure_logging() -> None:
+    """Replace loguru's default sink with one configured from `settings.logging`.
+
+    With `enqueue` enabled, records are handed to a background thread so the
+    request path never blocks on sink I/O.
+    """
+    global _configured
+    if _configured:
+        return
+
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.logging.level,
+        enqueue=settings.logging.enqueue,
+        backtrace=False,
+        diagnose=False,
+    )
+    _configured = True
+
+
+def truncate(text: Any, limit: int | None = None) -> str:
+    limit = settings.logging.max_payload_chars if limit is None else limit
+    text = str(text)
+    if limit <= 0 or len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text) - limit} more chars]"
+
+
+def is_sampled(category: str) -> bool:
+    rate = settings.logging.sample_rates.get(category, 1.0)
+    if rate >= 1.0:
+        return True
+    return rate > 0.0 and random.random() < rate
+
+
+def log_hot(category: str, level: str, message: str, *args: Callable[[], Any]) -> None:
+    """Log from a hot path: sampled per category and formatted only if emitted.
+
+    `args` are zero-argument callables producing the values for the `{}`
+    placeholders in `message`; they are not evaluated when the record is
+    sampled out or below the configured level.
+    """
+    if not is_sampled(category):
+        return
+    logger.opt(lazy=True, depth=1).log(level, message, *args)
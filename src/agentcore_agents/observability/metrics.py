@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={labels[key]}" for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+class MetricsRegistry:
+    """Process-wide counters and value summaries, keyed by name and labels."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._summaries: dict[str, dict[str, float]] = {}
+        self._reporters: dict[str, Callable[[], Any]] = {}
+        self._last_export = time.monotonic()
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        with self._lock:
+            self._counters[_series(name, labels)] += value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = _series(name, labels)
+        with self._lock:
+            summary = self._summaries.setdefault(
+                series, {"count": 0, "sum": 0.0, "min": value, "max": value}
+            )
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["min"] = min(summary["min"], value)
+            summary["max"] = max(summary["max"], value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get(_series(name, labels), 0.0)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "summaries": {series: dict(values) for series, values in self._summaries.items()},
+            }
+
+    def add_reporter(self, name: str, report: Callable[[], Any]) -> None:
+        """Adds state derived elsewhere, such as cache hit rates, to `report` under `name`."""
+        with self._lock:
+            self._reporters[name] = report
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            reporters = dict(self._reporters)
+        return {**self.snapshot(), **{name: report() for name, report in reporters.items()}}
+
+    def export_due(self, interval_seconds: float) -> bool:
+        """True at most once per interval, for the caller that should export the report."""
+        if interval_seconds <= 0:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_export < interval_seconds:
+                return False
+            self._last_export = now
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+metrics = MetricsRegistry()
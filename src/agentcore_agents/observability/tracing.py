@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry import trace
+from opentelemetry.trace import Span
+from strands.hooks import (
+    AfterModelCallEvent,
+    AfterToolCallEvent,
+    BeforeModelCallEvent,
+    BeforeToolCallEvent,
+    HookProvider,
+    HookRegistry,
+)
+
+from agentcore_agents.config import settings
+
+TRACER_NAME = "agentcore_agents"
+
+
+class StageTracer:
+    """Records per-stage latency for one invocation and mirrors stages as OTel spans.
+
+    OTel spans are only emitted when tracing is enabled; without a configured
+    `TracerProvider` the OpenTelemetry API is itself a no-op.
+    """
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        enabled = settings.tracing.enabled if enabled is None else enabled
+        self._otel = trace.get_tracer(TRACER_NAME) if enabled else None
+        self._lock = threading.Lock()
+        self._durations: dict[str, list[float]] = defaultdict(list)
+        self._open: dict[str, tuple[str, float, Span | None]] = {}
+        self._created = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            if self._otel is None:
+                yield
+            else:
+                with self._otel.start_as_current_span(name, attributes=attributes):
+                    yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def start(self, key: str, name: str, **attributes: Any) -> None:
+        otel_span = self._otel.start_span(name, attributes=attributes) if self._otel else None
+        with self._lock:
+            self._open[key] = (name, time.perf_counter(), otel_span)
+
+    def end(self, key: str, error: Exception | None = None) -> None:
+        with self._lock:
+            opened = self._open.pop(key, None)
+        if opened is None:
+            return
+
+        name, start, otel_span = opened
+        if otel_span is not None:
+            if error is not None:
+                otel_span.record_exception(error)
+                otel_span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+            otel_span.end()
+        self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._durations[name].append(seconds)
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            durations = {name: list(values) for name, values in self._durations.items()}
+
+        return {
+            "total_ms": round((time.perf_counter() - self._created) * 1000, 2),
+            "stages": {
+                name: {
+                    "count": len(values),
+                    "total_ms": round(sum(values) * 1000, 2),
+                    "max_ms": round(max(values) * 1000, 2),
+                }
+                for name, values in durations.items()
+            },
+        }
+
+
+class TimingHookProvider(HookProvider):
+    """Times model inference and tool calls of an agent through a `StageTracer`."""
+
+    def __init__(self, tracer: StageTracer) -> None:
+        self.tracer = tracer
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeModelCallEvent, self.on_before_model_call)
+        registry.add_callback(AfterModelCallEvent, self.on_after_model_call)
+        registry.add_callback(BeforeToolCallEvent, self.on_before_tool_call)
+        registry.add_callback(AfterToolCallEvent, self.on_after_tool_call)
+
+    def on_before_model_call(self, event: BeforeModelCallEvent) -> None:
+        self.tracer.start(f"model:{id(event.agent)}", "model.invoke")
+
+    def on_after_model_call(self, event: AfterModelCallEvent) -> None:
+        self.tracer.end(f"model:{id(event.agent)}", error=event.exception)
+
+    def on_before_tool_call(self, event: BeforeToolCallEvent) -> None:
+        tool_name = event.tool_use["name"].split("___")[-1]
+        self.tracer.start(
+            f"tool:{event.tool_use['toolUseId']}", f"tool.{tool_name}", tool_name=tool_name
+        )
+
+    def on_after_tool_call(self, event: AfterToolCallEvent) -> None:
+        self.tracer.end(f"tool:{event.tool_use['toolUseId']}", error=event.exception)
@@ -0,0 +1,5 @@
+SUMMARY_PROMPT = """You keep a running summary of a conversation between a user and an AI assistant.
+
+Merge the new turns into the current summary. Keep facts, decisions, names, numbers and open
+questions the assistant may need later; drop greetings and small talk.
+Reply with the updated summary only, in at most {max_words} words."""
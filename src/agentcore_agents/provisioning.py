@@ -0,0 +1,154 @@
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+type Outputs = dict[str, Any]
+
+
+def poll[T](
+    check: Callable[[], T | None],
+    description: str,
+    retry_if: Callable[[Exception], bool] = lambda e: False,
+    timeout: float = 120.0,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+) -> T:
+    """Calls `check` until it returns a value, backing off with full jitter between calls.
+
+    `None`, or an exception for which `retry_if` is true, means "not ready yet".
+    Raises TimeoutError once `timeout` seconds have passed.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            result = check()
+            if result is not None:
+                return result
+            reason = "not ready"
+        except Exception as e:
+            if not retry_if(e):
+                raise
+            reason = str(e)
+
+        delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Timed out after {timeout:.0f}s waiting for {description}")
+        attempt += 1
+        logger.debug(f"Waiting {delay:.1f}s for {description} (attempt {attempt}: {reason})")
+        time.sleep(delay)
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    # Takes the outputs of completed steps by step name and returns this step's outputs
+    run: Callable[[dict[str, Outputs]], Outputs | None]
+    requires: tuple[str, ...] = ()
+
+
+@dataclass
+class ProvisionState:
+    """Outputs of completed steps, saved to a local JSON file after each step."""
+
+    path: Path
+    completed: dict[str, Outputs] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ProvisionState":
+        if not path.exists():
+            return cls(path)
+        return cls(path, json.loads(path.read_text()).get("completed", {}))
+
+    def complete(self, name: str, outputs: Outputs) -> None:
+        with self._lock:
+            self.completed[name] = outputs
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"completed": self.completed}, indent=2, default=str))
+            os.replace(tmp, self.path)
+
+    def forget(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for name in names:
+                self.completed.pop(name, None)
+
+
+def _check_graph(steps: dict[str, Step]) -> None:
+    for step in steps.values():
+        unknown = [name for name in step.requires if name not in steps]
+        if unknown:
+            raise ValueError(f"Step '{step.name}' requires unknown steps: {unknown}")
+
+    remaining = dict(steps)
+    while remaining:
+        ready = [
+            name for name, step in remaining.items() if not set(step.requires) & remaining.keys()
+        ]
+        if not ready:
+            raise ValueError(f"Steps form a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+
+
+def run_steps(steps: list[Step], state: ProvisionState, max_workers: int = 4) -> ProvisionState:
+    """Runs each step once all the steps it requires have completed.
+
+    Independent steps run concurrently. Steps already in `state` are skipped, so a rerun
+    resumes after the last completed step. When a step fails, the steps that depend on
+    it are not started, the others run to completion, and then RuntimeError is raised.
+    """
+    by_name = {step.name: step for step in steps}
+    if len(by_name) != len(steps):
+        raise ValueError("Step names must be unique")
+    _check_graph(by_name)
+
+    for name in by_name.keys() & state.completed.keys():
+        logger.info(f"Skipping '{name}': completed in an earlier run")
+    pending = {name: step for name, step in by_name.items() if name not in state.completed}
+    running: dict[Future[Outputs | None], str] = {}
+    failed: dict[str, str] = {}
+    blocked_names: set[str] = set()
+    started = time.perf_counter()
+
+    def blocked(step: Step) -> bool:
+        return any(name in failed or name in blocked_names for name in step.requires)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provision") as executor:
+        while pending or running:
+            for name, step in list(pending.items()):
+                if blocked(step):
+                    blocked_names.add(name)
+                    del pending[name]
+                elif all(required in state.completed for required in step.requires):
+                    logger.info(f"Starting '{name}'")
+                    running[executor.submit(step.run, dict(state.completed))] = name
+                    del pending[name]
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    outputs = future.result() or {}
+                except Exception as e:
+                    logger.error(f"Step '{name}' failed: {e}")
+                    failed[name] = str(e)
+                    continue
+                state.complete(name, outputs)
+                logger.info(f"✓ '{name}' completed after {time.perf_counter() - started:.1f}s")
+
+    if failed:
+        skipped = f"; not started: {sorted(blocked_names)}" if blocked_names else ""
+        raise RuntimeError(f"Provisioning failed in {sorted(failed)}{skipped}")
+    return state
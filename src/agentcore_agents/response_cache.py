@@ -0,0 +1,87 @@
+import hashlib
+import json
+
+from strands.types.content import Message, Messages
+from strands.types.tools import AgentTool
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.models import configured_model_ids
+from agentcore_agents.prompts.system import SYSTEM_PROMPT
+from agentcore_agents.tools.cache import get_cache_policy
+from agentcore_agents.tools.wrappers import base_tool_name
+
+
+def _digest(data: object) -> str:
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def normalize_prompt(prompt: str) -> str:
+    return " ".join(prompt.casefold().split())
+
+
+def catalog_version(tools: list[AgentTool]) -> str:
+    return _digest(sorted((tool.tool_name, tool.tool_spec) for tool in tools))
+
+
+def model_fingerprint() -> str:
+    return _digest(
+        {
+            "models": configured_model_ids(),
+            "max_tokens": settings.model.max_tokens,
+            "temperature": settings.model.temperature,
+            "system_prompt": SYSTEM_PROMPT,
+        }
+    )
+
+
+def message_text(message: Message) -> str:
+    return "\n".join(block["text"] for block in message["content"] if "text" in block)
+
+
+def response_ttl(turn_messages: Messages) -> float | None:
+    """TTL for caching a turn's answer, or None if the turn must not be cached.
+
+    A turn is not cacheable if it called a tool with a "never" cache policy or got a
+    tool error; a TTL-cached tool caps the response TTL at the tool's TTL.
+    """
+    ttl = settings.response_cache.ttl_seconds
+    for message in turn_messages:
+        for block in message["content"]:
+            if "toolUse" in block:
+                policy = get_cache_policy(base_tool_name(block["toolUse"]["name"]))
+                if not policy.cacheable:
+                    return None
+                if policy.ttl_seconds is not None:
+                    ttl = min(ttl, policy.ttl_seconds)
+            if "toolResult" in block and block["toolResult"].get("status") == "error":
+                return None
+    return ttl
+
+
+class ResponseCache(BoundedCache[tuple[str, str], Message]):
+    """LRU of final assistant messages, scoped per actor."""
+
+    @staticmethod
+    def make_key(
+        actor_id: str, prompt: str, history: Messages, tool_catalog_version: str
+    ) -> tuple[str, str]:
+        return actor_id, _digest(
+            {
+                "prompt": normalize_prompt(prompt),
+                "history": history,
+                "catalog": tool_catalog_version,
+                "model": model_fingerprint(),
+            }
+        )
+
+    def put_response(self, key: tuple[str, str], message: Message, ttl_seconds: float) -> None:
+        size = len(json.dumps(message, default=str))
+        self.put(key, message, size, ttl_seconds)
+
+
+response_cache = ResponseCache(
+    max_entries=settings.response_cache.max_entries,
+    max_bytes=settings.response_cache.max_bytes,
+)
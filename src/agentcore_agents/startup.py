@@ -0,0 +1,79 @@
+import threading
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+from agentcore_agents.observability.metrics import metrics
+
+
+class StartupWarmer:
+    """Runs startup resolutions concurrently and tracks whether the process is warm.
+
+    A failed task is logged and the process still becomes ready; whatever it should
+    have resolved is then resolved lazily by the first request that needs it.
+    """
+
+    def __init__(self, started_at: float) -> None:
+        # time.perf_counter() at process start, before the heavy imports
+        self.started_at = started_at
+        self.stages: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._first_request_seen = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def record_stage(self, name: str, seconds: float) -> None:
+        self.stages[name] = seconds * 1000
+        metrics.observe("startup.stage_ms", seconds * 1000, stage=name)
+
+    def start(self, tasks: dict[str, Callable[[], object]]) -> None:
+        self._pending = len(tasks)
+        if not tasks:
+            self._finish()
+        for name, task in tasks.items():
+            threading.Thread(
+                target=self._run_task, args=(name, task), name=f"prewarm-{name}", daemon=True
+            ).start()
+
+    def _run_task(self, name: str, task: Callable[[], object]) -> None:
+        started = time.perf_counter()
+        try:
+            task()
+        except Exception as e:
+            self.errors[name] = str(e)
+            logger.warning(f"Startup pre-warm of {name} failed: {e}")
+        finally:
+            self.record_stage(name, time.perf_counter() - started)
+            with self._lock:
+                self._pending -= 1
+                done = self._pending == 0
+            if done:
+                self._finish()
+
+    def _finish(self) -> None:
+        cold_start_ms = (time.perf_counter() - self.started_at) * 1000
+        metrics.observe("startup.cold_start_ms", cold_start_ms)
+        logger.info(
+            "Warm after {:.0f}ms (stages: {}, errors: {})",
+            cold_start_ms,
+            {name: round(ms, 1) for name, ms in self.stages.items()},
+            list(self.errors),
+        )
+        self._ready.set()
+
+    def wait(self, timeout: float) -> bool:
+        return self._ready.wait(timeout)
+
+    def record_request(self, seconds: float) -> None:
+        with self._lock:
+            if self._first_request_seen:
+                return
+            self._first_request_seen = True
+        metrics.observe("startup.first_request_ms", seconds * 1000, warm=str(self.ready).lower())
+        logger.info("First request took {:.0f}ms (warm={})", seconds * 1000, self.ready)
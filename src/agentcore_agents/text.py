@@ -0,0 +1,28 @@
+import re
+from collections import Counter
+
+_WORD = re.compile(r"[a-z0-9]+")
+# fmt: off
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "could", "do", "for", "from", "get",
+    "give", "how", "i", "if", "in", "is", "it", "me", "my", "of", "on", "or", "please", "so",
+    "that", "the", "this", "to", "use", "what", "when", "which", "with", "would", "you", "your",
+})
+# fmt: on
+
+
+def words(text: str) -> list[str]:
+    # Crude stemming: drop a plural "s" and keep a 6-letter prefix, so "calculate"
+    # matches "calculator" and "times" matches "time"
+    stems = []
+    for word in _WORD.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s"):
+            word = word[:-1]
+        stems.append(word[:6])
+    return stems
+
+
+def word_counts(text: str) -> Counter[str]:
+    return Counter(words(text))
@@ -0,0 +1,129 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+from strands.types.tools import AgentTool, ToolResult, ToolUse
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.tools.wrappers import ToolWrapper, base_tool_name, tool_result_text
+
+# invocation_state key a caller sets to False to bypass the cache for one invocation
+USE_TOOL_CACHE = "use_tool_cache"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    mode: str  # "always", "never" or "ttl"
+    ttl_seconds: float | None = None
+
+    @property
+    def cacheable(self) -> bool:
+        return self.mode != "never"
+
+
+def get_cache_policy(tool_name: str) -> CachePolicy:
+    mode = settings.tool_cache.policies.get(tool_name, "never")
+    if mode == "ttl":
+        ttl = settings.tool_cache.ttl_seconds.get(
+            tool_name, settings.tool_cache.default_ttl_seconds
+        )
+        return CachePolicy(mode, ttl)
+    return CachePolicy(mode)
+
+
+class ToolResultCache(BoundedCache[tuple[str, str], ToolResult]):
+    """LRU of tool results keyed by tool name and canonical JSON input."""
+
+    @staticmethod
+    def make_key(tool_name: str, tool_input: Any) -> tuple[str, str]:
+        return tool_name, json.dumps(tool_input, sort_keys=True, default=str)
+
+    def put_result(
+        self, key: tuple[str, str], result: ToolResult, ttl_seconds: float | None
+    ) -> None:
+        size = len(json.dumps(result.get("content", []), default=str))
+        self.put(key, result, size, ttl_seconds)
+
+
+tool_result_cache = ToolResultCache(
+    max_entries=settings.tool_cache.max_entries, max_bytes=settings.tool_cache.max_bytes
+)
+
+
+def cache_stats() -> dict[str, dict[str, float]]:
+    stats: dict[str, dict[str, float]] = {}
+    for tool_name in settings.tool_cache.policies:
+        hits = metrics.counter("tool_cache.hits", tool=tool_name)
+        misses = metrics.counter("tool_cache.misses", tool=tool_name)
+        lookups = hits + misses
+        stats[tool_name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+metrics.add_reporter("tool_cache", cache_stats)
+
+
+class CachedTool(ToolWrapper):
+    """Serves repeated calls of a cacheable tool from the process-wide result cache."""
+
+    def __init__(
+        self, tool: AgentTool, policy: CachePolicy, cache: ToolResultCache | None = None
+    ) -> None:
+        super().__init__(tool)
+        self.policy = policy
+        self.cache = cache if cache is not None else tool_result_cache
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        if not invocation_state.get(USE_TOOL_CACHE, True):
+            metrics.increment("tool_cache.bypassed", tool=self.base_name)
+            return await super().call(tool_use, invocation_state, **kwargs)
+
+        key = self.cache.make_key(self.base_name, tool_use.get("input"))
+        cached = self.cache.get(key)
+        if cached is not None:
+            metrics.increment("tool_cache.hits", tool=self.base_name)
+            logger.debug("Tool cache hit for {}", self.base_name)
+            return {
+                "toolUseId": str(tool_use.get("toolUseId")),
+                "status": cached["status"],
+                "content": cached["content"],
+            }
+
+        metrics.increment("tool_cache.misses", tool=self.base_name)
+        result = await super().call(tool_use, invocation_state, **kwargs)
+        if result.get("status") != "error" and not _is_error_text(result):
+            self.cache.put_result(key, result, self.policy.ttl_seconds)
+        return result
+
+
+def _is_error_text(result: ToolResult) -> bool:
+    # The Lambda reports tool failures inside a successful MCP call, either as an
+    # {"error": ...} payload or as a result string starting with "Error"
+    text = tool_result_text(result)
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        payload = text
+    if isinstance(payload, dict):
+        return "error" in payload or str(payload.get("result", "")).startswith("Error")
+    return str(payload).startswith("Error")
+
+
+def cache_tools(tools: list[AgentTool]) -> list[AgentTool]:
+    if not settings.tool_cache.enabled:
+        return tools
+
+    wrapped: list[AgentTool] = []
+    for tool in tools:
+        policy = get_cache_policy(base_tool_name(tool.tool_name))
+        wrapped.append(CachedTool(tool, policy) if policy.cacheable else tool)
+    return wrapped
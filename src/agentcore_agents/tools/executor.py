@@ -0,0 +1,75 @@
+import asyncio
+import weakref
+from typing import Any
+
+from loguru import logger
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
+from strands.tools.executors._executor import ToolExecutor
+from strands.types.tools import AgentTool, ToolResult, ToolUse
+
+from agentcore_agents.config import settings
+from agentcore_agents.tools.wrappers import ToolWrapper, make_tool_result
+
+
+class ToolConcurrencyLimiter:
+    """Caps concurrent tool calls of one agent, with one semaphore per event loop."""
+
+    def __init__(self, max_parallel: int) -> None:
+        self.max_parallel = max_parallel
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_parallel)
+        return semaphore
+
+
+class BoundedTool(ToolWrapper):
+    """Runs a tool under a shared concurrency limit and a per-call timeout.
+
+    Timeouts and exceptions become error results, so one failing tool does not
+    abort the other tool calls of the same turn.
+    """
+
+    def __init__(
+        self, tool: AgentTool, limiter: ToolConcurrencyLimiter, timeout_seconds: float
+    ) -> None:
+        super().__init__(tool)
+        self.limiter = limiter
+        self.timeout_seconds = timeout_seconds
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        async with self.limiter.semaphore():
+            try:
+                return await asyncio.wait_for(
+                    super().call(tool_use, invocation_state, **kwargs),
+                    timeout=self.timeout_seconds,
+                )
+            except TimeoutError:
+                logger.warning(f"Tool {self.tool_name} timed out after {self.timeout_seconds}s")
+                return make_tool_result(
+                    tool_use,
+                    f"Error: tool {self.base_name} timed out after {self.timeout_seconds} seconds",
+                    status="error",
+                )
+            except Exception as e:
+                logger.error(f"Tool {self.tool_name} failed: {e}")
+                return make_tool_result(tool_use, f"Error: {e!s}", status="error")
+
+
+def bound_tools(tools: list[AgentTool]) -> list[AgentTool]:
+    limiter = ToolConcurrencyLimiter(settings.tools.max_parallel)
+    return [BoundedTool(tool, limiter, settings.tools.timeout_seconds) for tool in tools]
+
+
+def build_tool_executor() -> ToolExecutor:
+    # Results keep the order of the model's tool uses with either executor
+    if settings.tools.max_parallel > 1:
+        return ConcurrentToolExecutor()
+    return SequentialToolExecutor()
@@ -0,0 +1,254 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from loguru import logger
+from strands.types.tools import AgentTool, ToolResult, ToolUse
+
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.tools.wrappers import ToolWrapper, base_tool_name, make_tool_result
+
+
+class LatencyWindow:
+    """The most recent successful call latencies of one tool."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, latency_ms: float) -> None:
+        with self._lock:
+            self._samples.append(latency_ms)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            raise ValueError("No latency samples")
+        return samples[min(len(samples) - 1, int(len(samples) * q / 100))]
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and fails calls fast while open.
+
+    Once `open_seconds` have passed, one trial call is let through: success closes the
+    circuit, failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, open_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.open_seconds:
+            return "open"
+        return "half_open"
+
+    def retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Ends a call that neither succeeded nor failed, such as a cancelled one."""
+        with self._lock:
+            self._trial_running = False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._trial_running = False
+            if ok:
+                if self.opened_at is not None:
+                    metrics.increment("tool.circuit_closed", tool=self.name)
+                    logger.info(f"Circuit for tool {self.name} closed")
+                self.failures, self.opened_at = 0, None
+                return
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                metrics.increment("tool.circuit_opened", tool=self.name)
+                logger.warning(
+                    f"Circuit for tool {self.name} opened after {self.failures} failures"
+                )
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_latencies: dict[str, LatencyWindow] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(tool_name: str) -> CircuitBreaker:
+    """The process-wide breaker of a tool, shared by every agent's wrapper of it."""
+    with _registry_lock:
+        breaker = _breakers.get(tool_name)
+        if breaker is None:
+            config = settings.tool_resilience
+            breaker = _breakers[tool_name] = CircuitBreaker(
+                tool_name, config.breaker_failure_threshold, config.breaker_open_seconds
+            )
+        return breaker
+
+
+def get_latency_window(tool_name: str) -> LatencyWindow:
+    with _registry_lock:
+        window = _latencies.get(tool_name)
+        if window is None:
+            window = _latencies[tool_name] = LatencyWindow(settings.tool_resilience.latency_window)
+        return window
+
+
+def clear_tool_resilience() -> None:
+    with _registry_lock:
+        _breakers.clear()
+        _latencies.clear()
+
+
+def resilience_stats() -> dict[str, dict[str, Any]]:
+    """Per tool: its circuit, and whether hedging wins calls or only adds load."""
+    with _registry_lock:
+        breakers = dict(_breakers)
+    stats: dict[str, dict[str, Any]] = {}
+    for name, breaker in breakers.items():
+        calls = metrics.counter("tool.calls", tool=name)
+        hedges = metrics.counter("tool.hedges", tool=name)
+        wins = metrics.counter("tool.hedge_wins", tool=name)
+        stats[name] = {
+            "circuit": breaker.state,
+            "consecutive_failures": breaker.failures,
+            "circuit_opened": metrics.counter("tool.circuit_opened", tool=name),
+            "circuit_rejections": metrics.counter("tool.circuit_rejections", tool=name),
+            "calls": calls,
+            "hedges": hedges,
+            "hedge_wins": wins,
+            "hedge_rate": hedges / calls if calls else 0.0,
+            "hedge_win_rate": wins / hedges if hedges else 0.0,
+        }
+    return stats
+
+
+metrics.add_reporter("tool_resilience", resilience_stats)
+
+
+def circuit_open_result(tool_use: ToolUse, breaker: CircuitBreaker) -> ToolResult:
+    # Structured so the model can tell it apart from a tool error and act on it
+    error = {
+        "error": "tool_unavailable",
+        "tool": breaker.name,
+        "reason": f"{breaker.failures} consecutive calls failed",
+        "retry_after_seconds": round(breaker.retry_after(), 1),
+        "advice": "Do not call this tool again in this turn; answer without it or say it is down.",
+    }
+    return make_tool_result(tool_use, json.dumps(error), status="error")
+
+
+class ResilientTool(ToolWrapper):
+    """Guards a tool with its circuit breaker and, if it is idempotent, hedges slow calls.
+
+    A hedged call starts a duplicate once the first call has run longer than the
+    configured percentile of the tool's recent latencies; the first successful
+    result wins and the other call is cancelled.
+    """
+
+    def __init__(self, tool: AgentTool, hedged: bool) -> None:
+        super().__init__(tool)
+        self.hedged = hedged
+        self.breaker = get_breaker(self.base_name)
+        self.latencies = get_latency_window(self.base_name)
+
+    def hedge_delay(self) -> float:
+        config = settings.tool_resilience
+        if len(self.latencies) < config.min_samples:
+            return config.hedge_initial_delay_ms / 1000
+        delay_ms = self.latencies.percentile(config.hedge_percentile)
+        return min(max(delay_ms, config.hedge_min_delay_ms), config.hedge_max_delay_ms) / 1000
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        if not self.breaker.allow():
+            metrics.increment("tool.circuit_rejections", tool=self.base_name)
+            return circuit_open_result(tool_use, self.breaker)
+
+        metrics.increment("tool.calls", tool=self.base_name)
+        started = time.perf_counter()
+        try:
+            if self.hedged:
+                result = await self._hedged_call(tool_use, invocation_state, **kwargs)
+            else:
+                result = await super().call(tool_use, invocation_state, **kwargs)
+        except Exception:
+            self.breaker.record(ok=False)
+            raise
+        except BaseException:
+            # Cancellation (a client gone, an outer timeout) says nothing about the tool,
+            # but a half-open trial must not stay taken, or the circuit never closes
+            self.breaker.release()
+            raise
+
+        ok = result.get("status") != "error"
+        self.breaker.record(ok)
+        if ok:
+            self.latencies.add((time.perf_counter() - started) * 1000)
+        return result
+
+    async def _hedged_call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        primary = asyncio.create_task(super().call(tool_use, invocation_state, **kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if done:
+                return primary.result()
+
+            metrics.increment("tool.hedges", tool=self.base_name)
+            hedge = asyncio.create_task(super().call(tool_use, invocation_state, **kwargs))
+            tasks.append(hedge)
+            pending = set(tasks)
+            result: ToolResult | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if result.get("status") != "error":
+                        if task is hedge:
+                            metrics.increment("tool.hedge_wins", tool=self.base_name)
+                        return result
+            # Neither call succeeded: an error result if there is one, else the first exception
+            return result if result is not None else primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+def resilient_tools(tools: list[AgentTool]) -> list[AgentTool]:
+    hedged = set(settings.tool_resilience.hedged_tools)
+    return [ResilientTool(tool, base_tool_name(tool.tool_name) in hedged) for tool in tools]
@@ -0,0 +1,163 @@
+import json
+import math
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from loguru import logger
+from strands.tools.mcp.mcp_client import MCPClient
+from strands.types.tools import AgentTool
+
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.text import word_counts
+from agentcore_agents.tools.wrappers import base_tool_name
+
+# Built-in tool a Gateway with semantic search enabled adds to its catalog
+GATEWAY_SEARCH_TOOL = "x_amz_bedrock_agentcore_search"
+
+
+def is_search_tool(tool: AgentTool) -> bool:
+    return base_tool_name(tool.tool_name) == GATEWAY_SEARCH_TOOL
+
+
+def _tool_document(tool: AgentTool) -> str:
+    spec = tool.tool_spec
+    parts = [base_tool_name(tool.tool_name).replace("_", " "), spec.get("description", "")]
+    schema = spec.get("inputSchema", {}).get("json", {})
+    for name, prop in schema.get("properties", {}).items():
+        parts.append(name.replace("_", " "))
+        parts.append(str(prop.get("description", "")))
+    return " ".join(parts)
+
+
+class ToolSearch(Protocol):
+    def search(self, prompt: str, top_k: int) -> list[tuple[str, float]] | None: ...
+
+
+class LocalToolIndex:
+    """TF-IDF index over tool names, descriptions and parameter descriptions."""
+
+    def __init__(self, tools: list[AgentTool]) -> None:
+        documents = {tool.tool_name: word_counts(_tool_document(tool)) for tool in tools}
+        document_frequency: Counter[str] = Counter()
+        for features in documents.values():
+            document_frequency.update(features.keys())
+
+        self._idf = {
+            feature: math.log((1 + len(documents)) / (1 + count)) + 1
+            for feature, count in document_frequency.items()
+        }
+        self._vectors = {name: self._weigh(features) for name, features in documents.items()}
+
+    def _weigh(self, features: Counter[str]) -> dict[str, float]:
+        vector = {f: count * self._idf[f] for f, count in features.items() if f in self._idf}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {f: weight / norm for f, weight in vector.items()} if norm else {}
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def search(self, prompt: str, top_k: int) -> list[tuple[str, float]]:
+        query = self._weigh(word_counts(prompt))
+        scores = [
+            (name, sum(weight * vector.get(f, 0.0) for f, weight in query.items()))
+            for name, vector in self._vectors.items()
+        ]
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores[:top_k]
+
+
+class GatewayToolSearch:
+    """Ranks tools with the Gateway's built-in semantic search tool.
+
+    Costs one Gateway round trip per prompt; returns None when the search fails so
+    the caller can fall back to the full catalog.
+    """
+
+    def __init__(self, mcp_client: Callable[[], MCPClient], search_tool_name: str) -> None:
+        # Resolved per search, as a Gateway connection swaps its client on failover
+        self.mcp_client = mcp_client
+        self.search_tool_name = search_tool_name
+
+    def search(self, prompt: str, top_k: int) -> list[tuple[str, float]] | None:
+        try:
+            result = self.mcp_client().call_tool_sync(
+                tool_use_id=f"tool-search-{uuid.uuid4().hex}",
+                name=self.search_tool_name,
+                arguments={"query": prompt},
+            )
+        except Exception as e:
+            logger.warning(f"Gateway tool search failed: {e}")
+            return None
+        if result.get("status") == "error":
+            logger.warning("Gateway tool search returned an error")
+            return None
+
+        payload: Any = result.get("structuredContent")
+        if payload is None:
+            texts = [block["text"] for block in result.get("content", []) if "text" in block]
+            try:
+                payload = json.loads(texts[0]) if texts else {}
+            except ValueError:
+                return None
+
+        # Results come ranked without scores; rank 1 scores 1.0
+        names = [tool["name"] for tool in payload.get("tools", []) if "name" in tool]
+        return [(name, 1.0 / (rank + 1)) for rank, name in enumerate(names[:top_k])]
+
+
+class ToolSelector:
+    """Picks the tools to expose to the model for one prompt.
+
+    Falls back to the whole catalog when the catalog is small, the search fails or
+    the best match scores below `fallback_min_score`.
+    """
+
+    def __init__(self, tools: list[AgentTool], search: ToolSearch) -> None:
+        self.tools = {tool.tool_name: tool for tool in tools}
+        self._by_base_name = {base_tool_name(tool.tool_name): tool for tool in tools}
+        self.search = search
+
+    def _resolve(self, name: str) -> AgentTool | None:
+        return self.tools.get(name) or self._by_base_name.get(base_tool_name(name))
+
+    def select(self, prompt: str) -> list[AgentTool]:
+        config = settings.tool_selection
+        catalog = list(self.tools.values())
+        if len(catalog) <= config.top_k:
+            return catalog
+
+        ranked = self.search.search(prompt, config.top_k)
+        resolved = (self._resolve(name) for name, _ in ranked or [])
+        selected = [tool for tool in resolved if tool is not None]
+        if not ranked or not selected or ranked[0][1] < config.fallback_min_score:
+            metrics.increment("tool_selection.fallback")
+            logger.debug("Tool selection fell back to all {} tools", len(catalog))
+            return catalog
+
+        metrics.observe("tool_selection.selected", len(selected))
+        logger.debug("Selected tools: {}", [tool.tool_name for tool in selected])
+        return selected
+
+
+def build_tool_selector(
+    tools: list[AgentTool], mcp_client: Callable[[], MCPClient]
+) -> ToolSelector | None:
+    """Returns a selector over the catalog without the search tool, or None if disabled."""
+    if not settings.tool_selection.enabled:
+        return None
+
+    catalog = [tool for tool in tools if not is_search_tool(tool)]
+    search: ToolSearch
+    if settings.tool_selection.strategy == "gateway":
+        search_tool = next((tool for tool in tools if is_search_tool(tool)), None)
+        if search_tool is None:
+            logger.warning("Gateway search tool not found, using the local tool index")
+            search = LocalToolIndex(catalog)
+        else:
+            search = GatewayToolSearch(mcp_client, search_tool.tool_name)
+    else:
+        search = LocalToolIndex(catalog)
+    return ToolSelector(catalog, search)
@@ -0,0 +1,237 @@
+import hashlib
+import math
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.caching import BoundedCache
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.tools.wrappers import (
+    ToolWrapper,
+    base_tool_name,
+    make_tool_result,
+    tool_result_text,
+)
+
+# Local tool the model calls with a truncation note's handle to read the omitted part
+CONTINUATION_TOOL = "read_tool_output"
+
+_HANDLE = re.compile(r"[0-9a-f]{32}")
+
+
+def chars_to_tokens(chars: int) -> int:
+    return math.ceil(chars / settings.tool_output.chars_per_token)
+
+
+def token_chars(tokens: int) -> int:
+    return int(tokens * settings.tool_output.chars_per_token)
+
+
+class ToolOutputStore:
+    """Full text of truncated tool results, keyed by a hash of the text.
+
+    Kept in a process-wide LRU and, with a directory, also in files there, so a
+    handle stays readable after eviction or from another process on the same host.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, directory: Path | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        # Stored results are all oversized, so the byte limit is the one that binds
+        self._texts = BoundedCache[str, str](max_entries=max_bytes, max_bytes=max_bytes)
+
+    def put(self, text: str) -> str:
+        handle = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        self._texts.put(handle, text, len(text), self.ttl_seconds)
+        if self.directory is not None:
+            path = self.directory / handle
+            if not path.exists():
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                tmp.replace(path)
+        return handle
+
+    def get(self, handle: str) -> str | None:
+        if not _HANDLE.fullmatch(handle):
+            return None
+        text = self._texts.get(handle)
+        if text is not None or self.directory is None:
+            return text
+        path = self.directory / handle
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        self._texts.put(handle, text, len(text), self.ttl_seconds)
+        return text
+
+
+def _build_store() -> ToolOutputStore | None:
+    config = settings.tool_output
+    if config.store == "none":
+        return None
+    directory = Path(config.store_dir) if config.store == "disk" else None
+    return ToolOutputStore(config.store_max_bytes, config.store_ttl_seconds, directory)
+
+
+tool_output_store = _build_store()
+
+
+def continuation_note(handle: str, offset: int, remaining: int) -> str:
+    return (
+        f"[{remaining} more characters (about {chars_to_tokens(remaining)} tokens). "
+        f'To read on, call {CONTINUATION_TOOL} with handle "{handle}" and offset {offset}.]'
+    )
+
+
+def truncate_text(
+    text: str, max_tokens: int, head_fraction: float, store: ToolOutputStore | None
+) -> str:
+    """Keeps the head and tail of the text within `max_tokens`, noting what was left out."""
+    budget = token_chars(max_tokens)
+    head_end = int(budget * head_fraction)
+    tail_start = len(text) - (budget - head_end)
+    # Cut at line breaks when one is near, rather than mid-line
+    if (newline := text.rfind("\n", head_end // 2, head_end)) != -1:
+        head_end = newline + 1
+    if (newline := text.find("\n", tail_start, tail_start + (len(text) - tail_start) // 2)) != -1:
+        tail_start = newline + 1
+    omitted = tail_start - head_end
+    if store is not None:
+        note = continuation_note(store.put(text), head_end, omitted)
+    else:
+        note = f"[{omitted} characters omitted from the middle of this result.]"
+    return f"{text[:head_end]}\n...\n{note}\n...\n{text[tail_start:]}"
+
+
+class TruncatingTool(ToolWrapper):
+    """Cuts a tool's oversized text results down to its token limit before the model sees them.
+
+    Each result stays in the conversation for every later model call of the turn, so
+    one large read would otherwise multiply the input tokens of the whole turn.
+    """
+
+    def __init__(self, tool: AgentTool, max_tokens: int, store: ToolOutputStore | None) -> None:
+        super().__init__(tool)
+        self.max_tokens = max_tokens
+        self.store = store
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        result = await super().call(tool_use, invocation_state, **kwargs)
+        content = result.get("content", [])
+        if not content or any("text" not in block for block in content):
+            return result
+        text = tool_result_text(result)
+        tokens = chars_to_tokens(len(text))
+        if tokens <= self.max_tokens:
+            return result
+
+        metrics.increment("tool_output.truncated", tool=self.base_name)
+        metrics.observe("tool_output.tokens_saved", tokens - self.max_tokens, tool=self.base_name)
+        logger.debug(
+            "Truncated {} result from about {} to {} tokens",
+            self.base_name,
+            tokens,
+            self.max_tokens,
+        )
+        config = settings.tool_output
+        truncated = truncate_text(text, self.max_tokens, config.head_fraction, self.store)
+        return make_tool_result(tool_use, truncated, status=result["status"])
+
+
+class ToolOutputReader(AgentTool):
+    """Local tool returning the next chunk of a truncated tool result from the store."""
+
+    def __init__(self, store: ToolOutputStore, chunk_tokens: int) -> None:
+        super().__init__()
+        self.store = store
+        self.chunk_tokens = chunk_tokens
+
+    @property
+    def tool_name(self) -> str:
+        return CONTINUATION_TOOL
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {
+            "name": CONTINUATION_TOOL,
+            "description": (
+                "Read more of a tool result that was cut short. Pass the handle and offset "
+                "from the result's truncation note. Only call it if the omitted part is needed."
+            ),
+            "inputSchema": {
+                "json": {
+                    "type": "object",
+                    "properties": {
+                        "handle": {"type": "string", "description": "Handle from the note"},
+                        "offset": {"type": "integer", "description": "Character offset to read"},
+                    },
+                    "required": ["handle", "offset"],
+                }
+            },
+        }
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        yield ToolResultEvent(self.read(tool_use))
+
+    def read(self, tool_use: ToolUse) -> ToolResult:
+        tool_input = tool_use.get("input") or {}
+        handle = str(tool_input.get("handle", ""))
+        text = self.store.get(handle)
+        if text is None:
+            return make_tool_result(
+                tool_use,
+                f"Error: no stored tool result for handle {handle!r}; it may have expired. "
+                "Call the original tool again if the content is still needed.",
+                status="error",
+            )
+        try:
+            offset = max(0, int(tool_input.get("offset", 0)))
+        except (TypeError, ValueError):
+            return make_tool_result(tool_use, "Error: offset must be an integer", status="error")
+
+        metrics.increment("tool_output.continuations")
+        end = offset + token_chars(self.chunk_tokens)
+        chunk = text[offset:end]
+        if end < len(text):
+            chunk += "\n" + continuation_note(handle, end, len(text) - end)
+        return make_tool_result(tool_use, chunk)
+
+
+def truncate_tools(tools: list[AgentTool]) -> list[AgentTool]:
+    config = settings.tool_output
+    if not config.enabled:
+        return tools
+    return [
+        TruncatingTool(
+            tool,
+            config.max_tokens.get(base_tool_name(tool.tool_name), config.default_max_tokens),
+            tool_output_store,
+        )
+        for tool in tools
+    ]
+
+
+def continuation_tools() -> list[AgentTool]:
+    """The tools the model needs to follow truncation handles, if results are stored."""
+    if not settings.tool_output.enabled or tool_output_store is None:
+        return []
+    return [ToolOutputReader(tool_output_store, settings.tool_output.continuation_max_tokens)]
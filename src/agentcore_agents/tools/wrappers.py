@@ -0,0 +1,78 @@
+from typing import Any
+
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+# Gateway tools are exposed as "<target>___<tool>", same delimiter the Lambda handler strips
+TOOL_NAME_DELIMITER = "___"
+
+
+def base_tool_name(tool_name: str) -> str:
+    if TOOL_NAME_DELIMITER in tool_name:
+        return tool_name[tool_name.index(TOOL_NAME_DELIMITER) + len(TOOL_NAME_DELIMITER) :]
+    return tool_name
+
+
+def make_tool_result(tool_use: ToolUse, text: str, status: str = "success") -> ToolResult:
+    return {
+        "toolUseId": str(tool_use.get("toolUseId")),
+        "status": "error" if status == "error" else "success",
+        "content": [{"text": text}],
+    }
+
+
+def tool_result_text(result: ToolResult) -> str:
+    return "\n".join(block["text"] for block in result.get("content", []) if "text" in block)
+
+
+async def run_tool(
+    tool: AgentTool, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+) -> ToolResult:
+    """Runs a tool to completion and returns its final result."""
+    result: Any = None
+    async for event in tool.stream(tool_use, invocation_state, **kwargs):
+        result = event
+    if isinstance(result, ToolResultEvent):
+        return result.tool_result
+    if isinstance(result, dict) and "toolUseId" in result:
+        return result  # type: ignore[return-value]
+    raise RuntimeError(f"Tool {tool.tool_name} finished without a result")
+
+
+class ToolWrapper(AgentTool):
+    """Base class for tools that decorate another tool's execution.
+
+    Subclasses override `call` and get the wrapped tool's final `ToolResult` from
+    `super().call(...)`; intermediate stream events of the wrapped tool are dropped.
+    """
+
+    def __init__(self, tool: AgentTool) -> None:
+        super().__init__()
+        self.tool = tool
+
+    @property
+    def tool_name(self) -> str:
+        return self.tool.tool_name
+
+    @property
+    def base_name(self) -> str:
+        return base_tool_name(self.tool.tool_name)
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return self.tool.tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self.tool.tool_type
+
+    async def call(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolResult:
+        return await run_tool(self.tool, tool_use, invocation_state, **kwargs)
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        result = await self.call(tool_use, invocation_state, **kwargs)
+        yield ToolResultEvent(result)
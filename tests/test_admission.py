@@ -0,0 +1,256 @@
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+from agentcore_agents.admission import AdmissionController, AdmissionRejected
+from agentcore_agents.admission import admission as runtime_admission
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+
+
+def controller(
+    max_concurrent: int = 1,
+    max_queue: int = 8,
+    max_queue_wait: float = 5.0,
+    rate_per_second: float = 0.0,
+    burst: float = 1.0,
+    max_actors: int = 100,
+) -> AdmissionController:
+    return AdmissionController(
+        max_concurrent=max_concurrent,
+        max_queue=max_queue,
+        max_queue_wait=max_queue_wait,
+        rate_per_second=rate_per_second,
+        burst=burst,
+        max_actors=max_actors,
+    )
+
+
+def rejection(admission: AdmissionController, actor_id: str = "actor") -> AdmissionRejected:
+    try:
+        with admission.admit(actor_id):
+            pass
+    except AdmissionRejected as e:
+        return e
+    raise AssertionError("request was admitted")
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting"
+        time.sleep(0.001)
+
+
+def test_rate_limit_rejects_beyond_burst_per_actor() -> None:
+    admission = controller(max_concurrent=4, rate_per_second=0.5, burst=2)
+    for _ in range(2):
+        with admission.admit("alice"):
+            pass
+
+    rejected = rejection(admission, "alice")
+    assert rejected.reason == "rate_limited"
+    assert 1.0 < rejected.retry_after <= 2.0
+    # Another actor has its own bucket
+    with admission.admit("bob"):
+        pass
+
+
+def test_rate_limit_off_by_default_rate() -> None:
+    admission = controller(max_concurrent=4)
+    for _ in range(50):
+        with admission.admit("alice"):
+            pass
+    assert admission.active == 0
+
+
+def test_queued_requests_run_in_arrival_order() -> None:
+    admission = controller(max_concurrent=1)
+    order: list[int] = []
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with admission.admit("holder"):
+            holding.set()
+            release.wait()
+
+    def queued(i: int) -> None:
+        with admission.admit(f"actor-{i}"):
+            order.append(i)
+
+    threads = [threading.Thread(target=hold)]
+    threads[0].start()
+    holding.wait()
+    for i in range(3):
+        thread = threading.Thread(target=queued, args=(i,))
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: admission.queued == len(threads) - 1)
+
+    assert order == []
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2]
+    assert admission.active == 0
+    assert admission.queued == 0
+
+
+def test_queue_full_and_queue_timeout_reject() -> None:
+    admission = controller(max_concurrent=1, max_queue=1, max_queue_wait=0.05)
+    with admission.admit("holder"):
+        # One waiter fits and times out; with it queued, the next finds the queue full
+        result: list[AdmissionRejected] = []
+        waiter = threading.Thread(target=lambda: result.append(rejection(admission)))
+        waiter.start()
+        wait_until(lambda: admission.queued == 1)
+        assert rejection(admission).reason == "queue_full"
+        waiter.join()
+        assert result[0].reason == "queue_timeout"
+        assert admission.queued == 0
+
+    assert admission.active == 0
+    with admission.admit("actor"):
+        assert admission.active == 1
+
+
+def test_cancelled_waiter_leaves_the_queue() -> None:
+    async def scenario() -> None:
+        admission = controller(max_concurrent=1)
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with admission.admit_async("holder"):
+                entered.set()
+                await release.wait()
+
+        async def wait() -> None:
+            async with admission.admit_async("waiter"):
+                raise AssertionError("cancelled waiter was admitted")
+
+        holder = asyncio.create_task(hold())
+        await entered.wait()
+        waiter = asyncio.create_task(wait())
+        while admission.queued == 0:
+            await asyncio.sleep(0)
+        waiter.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await waiter
+        assert admission.queued == 0
+
+        release.set()
+        await holder
+        assert admission.active == 0
+        async with admission.admit_async("next"):
+            assert admission.active == 1
+
+    asyncio.run(scenario())
+
+
+def test_slot_granted_during_cancellation_goes_to_next_waiter() -> None:
+    async def scenario() -> None:
+        admission = controller(max_concurrent=1)
+        admitted: list[str] = []
+        release = asyncio.Event()
+
+        async def run(name: str) -> None:
+            async with admission.admit_async(name):
+                admitted.append(name)
+                if name == "holder":
+                    await release.wait()
+
+        holder = asyncio.create_task(run("holder"))
+        while not admitted:
+            await asyncio.sleep(0)
+        first = asyncio.create_task(run("first"))
+        while admission.queued < 1:
+            await asyncio.sleep(0)
+        second = asyncio.create_task(run("second"))
+        while admission.queued < 2:
+            await asyncio.sleep(0)
+
+        # The holder frees its slot to `first`, which is cancelled before it wakes
+        release.set()
+        first.cancel()
+        await asyncio.gather(holder, second, first, return_exceptions=True)
+        assert admitted == ["holder", "second"]
+        assert admission.active == 0
+        assert admission.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_time_is_recorded_per_actor() -> None:
+    admission = controller(max_concurrent=1)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with admission.admit("holder"):
+            holding.set()
+            release.wait()
+
+    def queued() -> None:
+        with admission.admit("waiter"):
+            pass
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait()
+    waiter = threading.Thread(target=queued)
+    waiter.start()
+    wait_until(lambda: admission.queued == 1)
+    time.sleep(0.05)
+    release.set()
+    holder.join()
+    waiter.join()
+    with admission.admit("waiter"):
+        pass
+
+    times = admission.queue_times(limit=10)
+    assert list(times) == ["waiter", "holder"]
+    assert times["waiter"]["count"] == 2
+    assert times["waiter"]["max_ms"] >= 50
+    assert times["holder"]["count"] == 1 and times["holder"]["max_ms"] < 50
+    assert list(admission.queue_times(limit=1)) == ["waiter"]
+
+
+def test_per_actor_queue_times_are_bounded_by_max_actors() -> None:
+    admission = controller(max_concurrent=4, rate_per_second=100, burst=10, max_actors=2)
+    for actor_id in ["alice", "bob", "alice", "carol"]:
+        with admission.admit(actor_id):
+            pass
+
+    # Bob was least recently seen, so his queue times went with his token bucket
+    assert set(admission.queue_times(limit=10)) == {"alice", "carol"}
+    assert admission.queue_times(limit=10)["alice"]["count"] == 2
+    with admission.admit("bob"):
+        pass
+    assert admission.queue_times(limit=10)["bob"]["count"] == 1
+
+
+def test_metrics_report_lists_queue_times_by_actor() -> None:
+    with runtime_admission.admit("report-actor"):
+        pass
+    report = metrics.report()["admission.queue_ms_by_actor"]
+    assert len(report) <= settings.admission.report_actors
+    assert all(set(times) == {"count", "sum_ms", "max_ms"} for times in report.values())
+    assert not any("actor=" in series for series in metrics.report()["summaries"])
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} admission tests passed")
+
+
+if __name__ == "__main__":
+    main()
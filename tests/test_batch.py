@@ -0,0 +1,130 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+from unittest import mock
+
+from loguru import logger
+
+from agentcore_agents import batch
+from agentcore_agents.batch import BatchJob, BatchResult, run_batch
+
+
+class FakeGatewayConnection:
+    def __init__(self, gateway_url: str, access_token: str) -> None:
+        self.gateway_url = gateway_url
+
+    def __enter__(self) -> "FakeGatewayConnection":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+class FakeAgent:
+    """Answers after a random delay; "fail" prompts raise and "broken" actors cannot start."""
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    history: dict[str, list[str]] = defaultdict(list)
+
+    def __init__(self, actor_id: str, session_id: str, use_gateway: bool, gateway: Any) -> None:
+        if actor_id == "broken":
+            raise RuntimeError("memory unavailable")
+        self.session_id = session_id
+
+    def __enter__(self) -> "FakeAgent":
+        with FakeAgent.lock:
+            FakeAgent.active += 1
+            FakeAgent.max_active = max(FakeAgent.max_active, FakeAgent.active)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        with FakeAgent.lock:
+            FakeAgent.active -= 1
+
+    def run(self, prompt: str, **run_options: bool) -> dict[str, Any]:
+        time.sleep(random.uniform(0, 0.01))
+        if prompt == "fail":
+            raise ValueError("model throttled")
+        seen = list(FakeAgent.history[self.session_id])
+        FakeAgent.history[self.session_id].append(prompt)
+        return {"prompt": prompt, "seen": seen}
+
+
+def run(jobs: list[BatchJob], max_concurrency: int) -> list[BatchResult]:
+    FakeAgent.active = FakeAgent.max_active = 0
+    FakeAgent.history.clear()
+    with (
+        mock.patch.object(batch, "GatewayConnection", FakeGatewayConnection),
+        mock.patch.object(batch, "StrandsAgentWrapper", FakeAgent),
+    ):
+        return list(run_batch(jobs, "https://gateway.example/mcp", "token", max_concurrency))
+
+
+def by_session(results: list[BatchResult]) -> dict[str, list[BatchResult]]:
+    sessions: dict[str, list[BatchResult]] = defaultdict(list)
+    for result in results:
+        sessions[result.session_id].append(result)
+    return sessions
+
+
+def test_each_session_comes_back_in_input_order_under_concurrency() -> None:
+    prompts = {f"session-{s}": [f"s{s} prompt {i}" for i in range(5)] for s in range(8)}
+    jobs = [BatchJob("actor", session_id, p) for session_id, p in prompts.items()]
+    results = run(jobs, max_concurrency=4)
+
+    assert len(results) == 40 and all(result.ok for result in results)
+    assert 1 < FakeAgent.max_active <= 4
+    for session_id, session_results in by_session(results).items():
+        assert [r.index for r in session_results] == list(range(5))
+        assert [r.prompt for r in session_results] == prompts[session_id]
+        # Each prompt ran after the ones before it, on the same session
+        for result in session_results:
+            assert result.response is not None
+            assert result.response["seen"] == prompts[session_id][: result.index]
+
+
+def test_jobs_of_one_session_are_merged_in_order() -> None:
+    jobs = [
+        BatchJob("actor", "session", ["first", "second"]),
+        BatchJob("actor", "other", ["elsewhere"]),
+        BatchJob("actor", "session", ["third"]),
+    ]
+    results = by_session(run(jobs, max_concurrency=2))
+    assert [r.prompt for r in results["session"]] == ["first", "second", "third"]
+    assert [r.index for r in results["session"]] == [0, 1, 2]
+
+
+def test_failures_do_not_abort_the_batch() -> None:
+    jobs = [
+        BatchJob("actor", "flaky", ["before", "fail", "after"]),
+        BatchJob("broken", "unstarted", ["one", "two"]),
+        BatchJob("actor", "healthy", ["fine"]),
+    ]
+    results = by_session(run(jobs, max_concurrency=3))
+
+    flaky = results["flaky"]
+    assert [r.ok for r in flaky] == [True, False, True]
+    assert flaky[1].error == "model throttled"
+    assert flaky[2].response is not None and flaky[2].response["seen"] == ["before"]
+    # An agent that cannot start fails each of its prompts, not the batch
+    assert [(r.index, r.error) for r in results["unstarted"]] == [
+        (0, "memory unavailable"),
+        (1, "memory unavailable"),
+    ]
+    assert [r.ok for r in results["healthy"]] == [True]
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} batch tests passed")
+
+
+if __name__ == "__main__":
+    main()
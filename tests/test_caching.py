@@ -0,0 +1,109 @@
+import threading
+import time
+
+from loguru import logger
+
+from agentcore_agents.caching import BoundedCache
+
+
+def cache(max_entries: int = 16, max_bytes: int = 100) -> BoundedCache[str, str]:
+    return BoundedCache[str, str](max_entries=max_entries, max_bytes=max_bytes)
+
+
+def keys(bounded: BoundedCache[str, str]) -> list[str]:
+    return [key for key, _ in bounded.items()]
+
+
+def test_least_recently_used_entry_is_evicted_past_max_entries() -> None:
+    bounded = cache(max_entries=2)
+    bounded.put("a", "1", size=1)
+    bounded.put("b", "2", size=1)
+    assert bounded.get("a") == "1"
+    bounded.put("c", "3", size=1)
+
+    assert bounded.get("b") is None
+    assert keys(bounded) == ["a", "c"]
+
+
+def test_byte_bound_evicts_the_oldest_entries_until_the_new_one_fits() -> None:
+    bounded = cache(max_bytes=100)
+    for key in "abcd":
+        bounded.put(key, key, size=25)
+    assert len(bounded) == 4
+
+    bounded.put("e", "e", size=60)
+    assert keys(bounded) == ["d", "e"]
+
+    # Replacing an entry accounts for its new size only
+    bounded.put("d", "d", size=40)
+    assert keys(bounded) == ["e", "d"]
+    bounded.put("f", "f", size=1)
+    assert keys(bounded) == ["d", "f"]
+
+
+def test_oversized_entry_is_skipped_without_evicting() -> None:
+    bounded = cache(max_bytes=100)
+    bounded.put("a", "a", size=50)
+    bounded.put("huge", "huge", size=101)
+    assert bounded.get("huge") is None
+    assert keys(bounded) == ["a"]
+
+    # An entry of exactly max_bytes fits, alone
+    bounded.put("full", "full", size=100)
+    assert keys(bounded) == ["full"]
+
+
+def test_entry_expires_after_its_ttl() -> None:
+    bounded = cache()
+    bounded.put("short", "s", size=1, ttl_seconds=0.05)
+    bounded.put("long", "l", size=1, ttl_seconds=60)
+    bounded.put("forever", "f", size=1)
+    assert bounded.get("short") == "s"
+
+    time.sleep(0.06)
+    assert keys(bounded) == ["long", "forever"]
+    assert bounded.get("short") is None
+    assert len(bounded) == 2
+    assert bounded.get("long") == "l" and bounded.get("forever") == "f"
+
+
+def test_items_do_not_touch_recency() -> None:
+    bounded = cache(max_entries=3)
+    for key in "abc":
+        bounded.put(key, key.upper(), size=1)
+    assert bounded.items() == [("a", "A"), ("b", "B"), ("c", "C")]
+
+    bounded.put("d", "D", size=1)
+    assert keys(bounded) == ["b", "c", "d"]
+    bounded.clear()
+    assert bounded.items() == [] and len(bounded) == 0
+
+
+def test_bounds_hold_under_concurrent_puts() -> None:
+    bounded = cache(max_entries=50, max_bytes=200)
+
+    def fill(worker: int) -> None:
+        for i in range(500):
+            bounded.put(f"{worker}-{i}", "x", size=1 + i % 7)
+            bounded.get(f"{worker}-{i // 2}")
+
+    threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 0 < len(bounded) <= 50
+    assert sum(1 + int(key.split("-")[1]) % 7 for key in keys(bounded)) <= 200
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} bounded cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from loguru import logger
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.config import settings
+from agentcore_agents.tools.executor import (
+    BoundedTool,
+    ToolConcurrencyLimiter,
+    bound_tools,
+    build_tool_executor,
+)
+from agentcore_agents.tools.wrappers import make_tool_result, tool_result_text
+
+
+class Overlap:
+    """Counts the calls running at once, across every tool sharing it."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+
+class SlowTool(AgentTool):
+    """Sleeps `delay` seconds per call and records overlapping calls; "raise" raises."""
+
+    def __init__(
+        self, name: str, delay: float, status: str = "success", overlap: Overlap | None = None
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.status = status
+        self.overlap = overlap or Overlap()
+        self.cancelled = 0
+
+    @property
+    def tool_name(self) -> str:
+        return f"AgentTools___{self.name}"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.tool_name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        self.overlap.active += 1
+        self.overlap.max_active = max(self.overlap.max_active, self.overlap.active)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.overlap.active -= 1
+        if self.status == "raise":
+            raise RuntimeError("tool crashed")
+        yield ToolResultEvent(make_tool_result(tool_use, "done", status=self.status))
+
+
+def call(tool: BoundedTool, number: int = 0) -> Coroutine[Any, Any, ToolResult]:
+    tool_use: ToolUse = {"toolUseId": str(number), "name": tool.tool_name, "input": {}}
+    return tool.call(tool_use, {})
+
+
+async def call_all(tools: list[BoundedTool], calls: int) -> list[ToolResult]:
+    return await asyncio.gather(*(call(tools[i % len(tools)], i) for i in range(calls)))
+
+
+def test_limiter_caps_concurrent_calls_across_tools() -> None:
+    limiter = ToolConcurrencyLimiter(max_parallel=2)
+    overlap = Overlap()
+    fakes = [
+        SlowTool("calculator", 0.02, overlap=overlap),
+        SlowTool("get_current_time", 0.02, overlap=overlap),
+    ]
+    tools = [BoundedTool(fake, limiter, timeout_seconds=5) for fake in fakes]
+
+    results = asyncio.run(call_all(tools, calls=8))
+    assert [result["status"] for result in results] == ["success"] * 8
+    assert [result["toolUseId"] for result in results] == [str(i) for i in range(8)]
+    assert overlap.max_active == 2
+
+
+def test_limit_applies_per_event_loop() -> None:
+    limiter = ToolConcurrencyLimiter(max_parallel=3)
+    fake = SlowTool("calculator", 0.01)
+    tool = BoundedTool(fake, limiter, timeout_seconds=5)
+    # A semaphore bound to a finished loop would fail in the next one
+    for _ in range(2):
+        results = asyncio.run(call_all([tool], calls=6))
+        assert all(result["status"] == "success" for result in results)
+        assert fake.overlap.max_active == 3
+
+
+def test_slow_call_times_out_with_an_error_result() -> None:
+    limiter = ToolConcurrencyLimiter(max_parallel=1)
+    slow = SlowTool("read_s3_document", delay=5)
+    tool = BoundedTool(slow, limiter, timeout_seconds=0.05)
+
+    async def time_out_then_call() -> tuple[ToolResult, ToolResult]:
+        timed_out = await call(tool)
+        # The timed-out call released its slot
+        slow.delay = 0
+        return timed_out, await asyncio.wait_for(call(tool, 1), timeout=1)
+
+    timed_out, result = asyncio.run(time_out_then_call())
+    assert timed_out["status"] == "error"
+    assert tool_result_text(timed_out) == (
+        "Error: tool read_s3_document timed out after 0.05 seconds"
+    )
+    assert slow.cancelled == 1
+    assert result["status"] == "success"
+
+
+def test_exception_becomes_an_error_result() -> None:
+    tool = BoundedTool(SlowTool("calculator", 0, "raise"), ToolConcurrencyLimiter(1), 5)
+    result = asyncio.run(call(tool))
+    assert result["status"] == "error"
+    assert tool_result_text(result) == "Error: tool crashed"
+
+
+def test_settings_pick_the_limit_and_the_executor() -> None:
+    max_parallel, timeout = settings.tools.max_parallel, settings.tools.timeout_seconds
+    try:
+        settings.tools.max_parallel, settings.tools.timeout_seconds = 4, 1.5
+        tools = bound_tools([SlowTool("calculator", 0), SlowTool("get_current_time", 0)])
+        assert all(isinstance(tool, BoundedTool) for tool in tools)
+        limiters = {tool.limiter for tool in tools if isinstance(tool, BoundedTool)}
+        assert len(limiters) == 1 and limiters.pop().max_parallel == 4
+        assert all(isinstance(tool, BoundedTool) and tool.timeout_seconds == 1.5 for tool in tools)
+        assert isinstance(build_tool_executor(), ConcurrentToolExecutor)
+
+        settings.tools.max_parallel = 1
+        assert isinstance(build_tool_executor(), SequentialToolExecutor)
+    finally:
+        settings.tools.max_parallel, settings.tools.timeout_seconds = max_parallel, timeout
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} tool executor tests passed")
+
+
+if __name__ == "__main__":
+    main()
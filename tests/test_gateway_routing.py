@@ -0,0 +1,253 @@
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.gateway import routing
+from agentcore_agents.gateway.connection import GatewayConnection
+from agentcore_agents.gateway.routing import GatewayRouter, clear_gateway_routers
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.tools.resilience import clear_tool_resilience
+from agentcore_agents.tools.selection import GatewayToolSearch
+from agentcore_agents.tools.wrappers import make_tool_result, run_tool, tool_result_text
+
+PRIMARY = "https://primary.example/mcp"
+SECONDARY = "https://secondary.example/mcp"
+TIME_TOOL = "AgentTools___get_current_time"
+DOCUMENT_TOOL = "AgentTools___read_s3_document"
+
+
+class FakeEndpoint:
+    def __init__(self, url: str, tools: list[str]) -> None:
+        self.url = url
+        self.tools = tools
+        self.down = False
+
+
+class FakeClient:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.closed = False
+        self.searches = 0
+
+    def call_tool_sync(self, tool_use_id: str, name: str, arguments: dict[str, Any]) -> Any:
+        self.searches += 1
+        tools = {"tools": [{"name": TIME_TOOL}]}
+        return {"status": "success", "content": [{"text": json.dumps(tools)}]}
+
+    def __exit__(self, *args: Any) -> None:
+        self.closed = True
+
+
+class EndpointTool(AgentTool):
+    """A Gateway tool of one endpoint; calls fail in transport while the endpoint is down."""
+
+    def __init__(self, name: str, endpoint: FakeEndpoint) -> None:
+        super().__init__()
+        self.name = name
+        self.endpoint = endpoint
+
+    @property
+    def tool_name(self) -> str:
+        return self.name
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        if self.endpoint.down:
+            raise ConnectionError("connection reset")
+        yield ToolResultEvent(make_tool_result(tool_use, f"served by {self.endpoint.url}"))
+
+
+class FakeGatewayConnection(GatewayConnection):
+    def __init__(self, endpoints: list[FakeEndpoint]) -> None:
+        self.fake_endpoints = {endpoint.url: endpoint for endpoint in endpoints}
+        self.clients: list[FakeClient] = []
+        super().__init__(list(self.fake_endpoints), "token")
+
+    def _connect(self, candidates: list[str], tracer: StageTracer) -> Any:
+        for url in candidates:
+            endpoint = self.fake_endpoints[url]
+            if endpoint.down:
+                self.router.record_result(url, False)
+                continue
+            self.router.record_result(url, True)
+            self.clients.append(FakeClient(url))
+            return (
+                url,
+                self.clients[-1],
+                {name: EndpointTool(name, endpoint) for name in endpoint.tools},
+            )
+        raise ConnectionError("No other Gateway endpoint to connect to")
+
+
+def quiet_router(endpoints: Sequence[str]) -> GatewayRouter:
+    """Registers the process-wide router of the endpoints without background probes."""
+    clear_gateway_routers()
+    clear_tool_resilience()
+    router = GatewayRouter(endpoints, alpha=0.5, min_health=0.5)
+    routing._routers[tuple(endpoints)] = router
+    return router
+
+
+def call(connection: GatewayConnection, tool_name: str) -> ToolResult:
+    tool = next(tool for tool in connection.tools if tool.tool_name == tool_name)
+    tool_use: ToolUse = {"toolUseId": "1", "name": tool_name, "input": {}}
+    return asyncio.run(run_tool(tool, tool_use, {}))
+
+
+def test_ranking_follows_latency_moving_average() -> None:
+    router = GatewayRouter([PRIMARY, SECONDARY], alpha=0.5, min_health=0.5)
+    # Unprobed endpoints keep the configured order
+    assert router.ranked() == [PRIMARY, SECONDARY]
+
+    router.record_latency(SECONDARY, 80)
+    assert router.ranked() == [SECONDARY, PRIMARY]
+
+    router.record_latency(PRIMARY, 40)
+    assert router.ranked() == [PRIMARY, SECONDARY]
+    router.record_latency(PRIMARY, 200)
+    assert router.stats[PRIMARY].latency_ms == 120
+    assert router.ranked() == [SECONDARY, PRIMARY]
+
+
+def test_unhealthy_endpoint_ranks_last_however_fast() -> None:
+    router = GatewayRouter([PRIMARY, SECONDARY], alpha=0.5, min_health=0.5)
+    router.record_latency(PRIMARY, 10)
+    router.record_latency(SECONDARY, 100)
+    router.record_result(PRIMARY, False)
+    # Health 0.5 is not below min_health; latency is divided by it
+    assert router.ranked() == [PRIMARY, SECONDARY]
+
+    router.record_result(PRIMARY, False)
+    assert router.stats[PRIMARY].health == 0.25
+    assert router.ranked() == [SECONDARY, PRIMARY]
+
+    for _ in range(3):
+        router.record_result(PRIMARY, True)
+    assert router.ranked() == [PRIMARY, SECONDARY]
+
+
+def test_connects_to_the_best_ranked_endpoint_that_answers() -> None:
+    router = quiet_router([PRIMARY, SECONDARY])
+    router.record_latency(SECONDARY, 10)
+    router.record_latency(PRIMARY, 50)
+    primary = FakeEndpoint(PRIMARY, [TIME_TOOL])
+    secondary = FakeEndpoint(SECONDARY, [TIME_TOOL])
+
+    assert FakeGatewayConnection([primary, secondary]).url == SECONDARY
+    secondary.down = True
+    assert FakeGatewayConnection([primary, secondary]).url == PRIMARY
+
+
+def test_transport_failure_fails_over_and_retries() -> None:
+    quiet_router([PRIMARY, SECONDARY])
+    primary = FakeEndpoint(PRIMARY, [TIME_TOOL])
+    connection = FakeGatewayConnection([primary, FakeEndpoint(SECONDARY, [TIME_TOOL])])
+    assert connection.url == PRIMARY
+    search = GatewayToolSearch(lambda: connection.client, "AgentTools___x_amz_bedrock_search")
+
+    primary.down = True
+    result = call(connection, TIME_TOOL)
+    assert result["status"] == "success"
+    assert tool_result_text(result) == f"served by {SECONDARY}"
+    assert connection.url == SECONDARY
+    old, new = connection.clients
+    assert old.closed and not new.closed
+
+    # Everything that resolves the client through the connection follows it
+    assert search.search("time", top_k=3) == [(TIME_TOOL, 1.0)]
+    assert (old.searches, new.searches) == (0, 1)
+    assert call(connection, TIME_TOOL)["status"] == "success"
+
+
+def test_tool_missing_after_failover_is_an_error_result() -> None:
+    quiet_router([PRIMARY, SECONDARY])
+    primary = FakeEndpoint(PRIMARY, [TIME_TOOL, DOCUMENT_TOOL])
+    connection = FakeGatewayConnection([primary, FakeEndpoint(SECONDARY, [TIME_TOOL])])
+
+    primary.down = True
+    for _ in range(2):
+        result = call(connection, DOCUMENT_TOOL)
+        assert result["status"] == "error"
+        assert "not available on Gateway endpoint" in tool_result_text(result)
+    assert connection.url == SECONDARY
+
+
+def test_no_endpoint_left_returns_the_transport_error() -> None:
+    quiet_router([PRIMARY, SECONDARY])
+    primary = FakeEndpoint(PRIMARY, [TIME_TOOL])
+    secondary = FakeEndpoint(SECONDARY, [TIME_TOOL])
+    connection = FakeGatewayConnection([primary, secondary])
+
+    primary.down = secondary.down = True
+    result = call(connection, TIME_TOOL)
+    assert result["status"] == "error"
+    assert tool_result_text(result).startswith("Tool execution failed:")
+    assert connection.url == PRIMARY
+
+
+def test_router_state_is_in_the_metrics_report() -> None:
+    router = quiet_router([PRIMARY, SECONDARY])
+    router.record_latency(PRIMARY, 80)
+    router.record_latency(SECONDARY, 20)
+    router.record_result(SECONDARY, False)
+
+    assert metrics.report()["gateway_routing"] == [
+        {
+            "ranking": [SECONDARY, PRIMARY],
+            "endpoints": {
+                PRIMARY: {"latency_ms": 80.0, "health": 1.0},
+                SECONDARY: {"latency_ms": 20.0, "health": 0.5},
+            },
+        }
+    ]
+
+
+def test_prober_logs_the_ranking_when_it_changes() -> None:
+    clear_gateway_routers()
+    # Nothing listens on these ports, so each probe fails at once
+    endpoints = ["http://127.0.0.1:9/mcp", "http://127.0.0.1:1/mcp"]
+    router = GatewayRouter(endpoints, alpha=0.5, min_health=0.5)
+    lines: list[str] = []
+    sink = logger.add(lambda message: lines.append(message.record["message"]), level="INFO")
+    try:
+        router.start(interval=0.01, timeout=0.2)
+        deadline = time.monotonic() + 2
+        while not lines and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+    finally:
+        router.stop()
+        logger.remove(sink)
+
+    rankings = [line for line in lines if line.startswith("Gateway endpoint ranking")]
+    # Both endpoints fail alike, so the ranking is logged once rather than on every probe
+    assert len(rankings) == 1
+    assert f"'ranking': {endpoints}" in rankings[0]
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} Gateway routing tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import contextlib
+import importlib
+import io
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from loguru import logger
+
+# The Lambda module creates its S3 client on import
+os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+handler = importlib.import_module("agentcore_agents.lambda.handler")
+
+DOCUMENT = b"Quarterly revenue grew in every region.\n" * 50
+UNITS = {"Milliseconds", "Bytes", "Count", "None"}
+
+
+class StubS3:
+    class exceptions:  # noqa: N801
+        NoSuchKey = type("NoSuchKey", (Exception,), {})
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if Key != "reports/q3.txt":
+            raise self.exceptions.NoSuchKey(Key)
+        return {"Body": io.BytesIO(DOCUMENT), "ContentType": "text/plain"}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str, Delimiter: str) -> dict[str, Any]:  # noqa: N803
+        return {"Contents": [{"Key": "reports/q3.txt", "Size": len(DOCUMENT)}]}
+
+
+def parse_emf_records(output: str) -> list[dict[str, Any]]:
+    """The EMF records in captured output, checked against the format; other lines are skipped."""
+    records = []
+    for line in output.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(record, dict) or "_aws" not in record:
+            continue
+        metadata = record["_aws"]
+        assert isinstance(metadata["Timestamp"], int)
+        assert metadata["CloudWatchMetrics"]
+        for directive in metadata["CloudWatchMetrics"]:
+            assert isinstance(directive["Namespace"], str) and directive["Namespace"]
+            for dimension_set in directive["Dimensions"]:
+                assert 0 < len(dimension_set) <= 30
+                for dimension in dimension_set:
+                    assert isinstance(record.get(dimension), str), f"dimension {dimension}"
+            assert 0 < len(directive["Metrics"]) <= 100
+            for metric in directive["Metrics"]:
+                assert metric["Unit"] in UNITS
+                value = record.get(metric["Name"])
+                assert isinstance(value, int | float), f"metric {metric['Name']}"
+        records.append(record)
+    return records
+
+
+@dataclass
+class ToolStats:
+    invocations: int = 0
+    cold_starts: int = 0
+    durations_ms: list[float] = field(default_factory=list)
+    bytes_returned: int = 0
+    s3_get_ms: list[float] = field(default_factory=list)
+
+
+def aggregate(records: list[dict[str, Any]]) -> dict[tuple[str, str], ToolStats]:
+    """Per (tool, status) totals, as CloudWatch would roll the records up."""
+    stats: dict[tuple[str, str], ToolStats] = defaultdict(ToolStats)
+    for record in records:
+        tool = stats[record["ToolName"], record["Status"]]
+        tool.invocations += 1
+        tool.cold_starts += record["ColdStart"]
+        tool.durations_ms.append(record["Duration"])
+        tool.bytes_returned += record["BytesReturned"]
+        if "S3GetLatency" in record:
+            tool.s3_get_ms.append(record["S3GetLatency"])
+    return dict(stats)
+
+
+def invoke(tool_name: str, event: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    context = SimpleNamespace(
+        aws_request_id="request-1",
+        client_context=SimpleNamespace(
+            custom={"bedrockAgentCoreToolName": f"AgentTools___{tool_name}"}
+        ),
+    )
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        response = handler.lambda_handler(event, context)
+    return response, output.getvalue()
+
+
+def setup() -> None:
+    setattr(handler, "s3_client", StubS3())  # noqa: B010
+    setattr(handler, "_cold_start", False)  # noqa: B010
+
+
+def test_each_invocation_prints_one_valid_record() -> None:
+    setup()
+    response, output = invoke("calculator", {"expression": "6 * 7"})
+    [record] = parse_emf_records(output)
+
+    assert response == {"result": "42"}
+    assert record["ToolName"] == "calculator"
+    assert record["Status"] == "success"
+    assert record["RequestId"] == "request-1"
+    assert record["BytesReturned"] == len(json.dumps(response).encode("utf-8"))
+    assert record["Duration"] >= 0
+    [directive] = record["_aws"]["CloudWatchMetrics"]
+    assert directive["Dimensions"] == [["ToolName", "Status"]]
+
+
+def test_s3_metrics_only_for_reads() -> None:
+    setup()
+    _, output = invoke("read_s3_document", {"bucket": "documents", "key": "reports/q3.txt"})
+    [record] = parse_emf_records(output)
+    assert record["S3BytesRead"] == len(DOCUMENT)
+    assert record["S3GetLatency"] >= 0
+    assert record["BytesReturned"] > len(DOCUMENT)
+
+    _, output = invoke("read_s3_document", {"bucket": "documents"})
+    [record] = parse_emf_records(output)
+    assert "S3GetLatency" not in record
+    names = {m["Name"] for m in record["_aws"]["CloudWatchMetrics"][0]["Metrics"]}
+    assert names == {"Duration", "BytesReturned", "ColdStart"}
+
+
+def test_failures_have_error_status() -> None:
+    setup()
+    cases = [
+        ("calculator", {}),
+        ("read_s3_document", {"bucket": "documents", "key": "missing.txt"}),
+        ("delete_everything", {}),
+        ("", {}),
+    ]
+    records = [parse_emf_records(invoke(tool, event)[1])[0] for tool, event in cases]
+    assert [r["Status"] for r in records] == ["error"] * len(cases)
+    assert [r["ToolName"] for r in records][-2:] == ["delete_everything", "unknown"]
+
+
+def test_cold_start_is_flagged_once() -> None:
+    setup()
+    setattr(handler, "_cold_start", True)  # noqa: B010
+    outputs = [invoke("get_current_time", {})[1] for _ in range(3)]
+    assert [parse_emf_records(o)[0]["ColdStart"] for o in outputs] == [1, 0, 0]
+
+
+def test_parser_skips_log_lines_and_rejects_incomplete_records() -> None:
+    setup()
+    _, output = invoke("get_current_time", {})
+    [record] = parse_emf_records(f"START RequestId: 1\n{output}not json {{\n[1, 2]\n")
+
+    del record["Duration"]
+    try:
+        parse_emf_records(json.dumps(record))
+    except AssertionError:
+        pass
+    else:
+        raise AssertionError("record without a declared metric value was accepted")
+
+
+def test_aggregate_groups_by_tool_and_status() -> None:
+    setup()
+    output = "".join(
+        invoke(tool, event)[1]
+        for tool, event in [
+            ("calculator", {"expression": "1 + 1"}),
+            ("calculator", {"expression": "2 + 2"}),
+            ("calculator", {}),
+            ("read_s3_document", {"bucket": "documents", "key": "reports/q3.txt"}),
+            ("read_s3_document", {"bucket": "documents", "key": "reports/q3.txt"}),
+        ]
+    )
+    stats = aggregate(parse_emf_records(output))
+
+    assert set(stats) == {
+        ("calculator", "success"),
+        ("calculator", "error"),
+        ("read_s3_document", "success"),
+    }
+    assert stats["calculator", "success"].invocations == 2
+    assert stats["calculator", "error"].invocations == 1
+    reads = stats["read_s3_document", "success"]
+    assert len(reads.s3_get_ms) == 2
+    assert reads.bytes_returned > 2 * len(DOCUMENT)
+    assert sum(s.cold_starts for s in stats.values()) == 0
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} Lambda metrics tests passed")
+
+
+if __name__ == "__main__":
+    main()
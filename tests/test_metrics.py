@@ -0,0 +1,117 @@
+import asyncio
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import MetricsRegistry, metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.tools.cache import CachedTool, CachePolicy, ToolResultCache
+from agentcore_agents.tools.wrappers import make_tool_result
+
+# Importing the runtime would otherwise pre-warm the real Gateway, memory and models
+settings.runtime.prewarm_on_start = False
+sys.path.insert(0, str(Path(__file__).parent.parent))
+runtime_handler = importlib.import_module("runtime_handler")
+
+
+class Calculator(AgentTool):
+    @property
+    def tool_name(self) -> str:
+        return "AgentTools___calculator"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.tool_name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        yield ToolResultEvent(make_tool_result(tool_use, "42"))
+
+
+def calculate(tool: CachedTool, expression: str) -> None:
+    tool_use: ToolUse = {"toolUseId": "1", "name": tool.tool_name, "input": {"e": expression}}
+    asyncio.run(tool.call(tool_use, {}))
+
+
+def finish() -> dict[str, Any]:
+    started = time.perf_counter()
+    return runtime_handler.finish_invocation({}, StageTracer(enabled=False), started)
+
+
+def cache_traffic() -> None:
+    metrics.reset()
+    tool = CachedTool(Calculator(), CachePolicy("always"), ToolResultCache(16, 1024 * 1024))
+    for expression in ["6 * 7", "6 * 7", "6 * 7", "6 * 8"]:
+        calculate(tool, expression)
+
+
+def test_invocation_returns_the_cache_hit_rate_with_its_timings() -> None:
+    cache_traffic()
+    return_timings = settings.tracing.return_timings
+    settings.tracing.return_timings = True
+    try:
+        report = finish()["timings"]["metrics"]
+    finally:
+        settings.tracing.return_timings = return_timings
+
+    assert report["tool_cache"]["calculator"] == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+    assert report["counters"]["tool_cache.hits{tool=calculator}"] == 2
+    assert "timings" not in finish()
+
+
+def test_invocation_logs_the_report_at_most_once_per_interval() -> None:
+    cache_traffic()
+    lines: list[str] = []
+    sink = logger.add(lambda message: lines.append(message.record["message"]), level="INFO")
+    interval = settings.tracing.metrics_log_interval_seconds
+    settings.tracing.metrics_log_interval_seconds = 0.05
+    try:
+        time.sleep(0.06)
+        for _ in range(3):
+            finish()
+        time.sleep(0.06)
+        finish()
+    finally:
+        settings.tracing.metrics_log_interval_seconds = interval
+        logger.remove(sink)
+
+    reports = [json.loads(line.removeprefix("Metrics: ")) for line in lines if "Metrics: " in line]
+    assert len(reports) == 2
+    assert reports[0]["tool_cache"]["calculator"]["hit_rate"] == 0.5
+
+
+def test_export_is_off_with_a_zero_interval() -> None:
+    registry = MetricsRegistry()
+    assert not registry.export_due(0)
+    registry.add_reporter("answer", lambda: 42)
+    registry.increment("requests", route="fast")
+    assert registry.report() == {
+        "counters": {"requests{route=fast}": 1},
+        "summaries": {},
+        "answer": 42,
+    }
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} metrics tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest import mock
+
+from loguru import logger
+from strands import Agent
+from strands.models import Model
+from strands.types._events import ToolResultEvent
+from strands.types.content import Messages
+from strands.types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+
+from agentcore_agents import agent as agent_module
+from agentcore_agents.agent import StrandsAgentWrapper
+from agentcore_agents.config import settings
+from agentcore_agents.memory.hooks import MemoryHookProvider
+from agentcore_agents.model_router import FAST_ROUTE, STRONG_ROUTE, ModelRouter
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.tools.wrappers import make_tool_result
+
+CATALOG = {
+    "calculator": "Evaluates a mathematical expression",
+    "get_current_time": "Returns the current date and time in a time zone",
+    "read_s3_document": "Reads a document from an S3 bucket",
+    "get_weather": "Returns the weather forecast for a city",
+}
+HISTORY: Messages = [
+    {"role": "user", "content": [{"text": "Hello"}]},
+    {"role": "assistant", "content": [{"text": "Hi, how can I help?"}]},
+]
+
+
+class GatewayTool(AgentTool):
+    def __init__(self, name: str, description: str) -> None:
+        super().__init__()
+        self.name = name
+        self.description = description
+
+    @property
+    def tool_name(self) -> str:
+        return f"AgentTools___{self.name}"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {
+            "name": self.tool_name,
+            "description": self.description,
+            "inputSchema": {"json": {"type": "object", "properties": {}}},
+        }
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        yield ToolResultEvent(make_tool_result(tool_use, "42"))
+
+
+class ScriptedModel(Model):
+    """Calls the calculator, then answers; with `fail` the call after the tool raises."""
+
+    def __init__(self, model_id: str, fail: bool = False) -> None:
+        self.config = {"model_id": model_id}
+        self.fail = fail
+        self.calls = 0
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        return self.config
+
+    def structured_output(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def stream(
+        self,
+        messages: Any,
+        tool_specs: list[Any] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        self.calls += 1
+        answered = any("toolResult" in block for block in messages[-1]["content"])
+        if answered and self.fail:
+            raise RuntimeError("fast model throttled")
+
+        yield {"messageStart": {"role": "assistant"}}
+        if answered:
+            answer = f"{self.config['model_id']} says 42"
+            yield {"contentBlockDelta": {"delta": {"text": answer}}}
+        else:
+            start = {"toolUse": {"toolUseId": "calc-1", "name": "AgentTools___calculator"}}
+            yield {"contentBlockStart": {"start": start}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": "{}"}}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn" if answered else "tool_use"}}
+        yield {
+            "metadata": {
+                "usage": {"inputTokens": 10, "outputTokens": 5, "totalTokens": 15},
+                "metrics": {"latencyMs": 0},
+            }
+        }
+
+
+def catalog() -> list[AgentTool]:
+    return [GatewayTool(name, description) for name, description in CATALOG.items()]
+
+
+@contextmanager
+def routing(**overrides: Any) -> Iterator[None]:
+    config = settings.routing
+    saved = {name: getattr(config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def route(prompt: str, history_turns: int = 0) -> tuple[str, str]:
+    decision = ModelRouter(catalog()).route(prompt, history_turns)
+    return decision.route, decision.reason
+
+
+def test_simple_prompt_goes_to_the_fast_model() -> None:
+    decision = ModelRouter(catalog()).route("What is 6 times 7?", history_turns=0)
+    assert (decision.route, decision.reason) == (FAST_ROUTE, "simple")
+    assert decision.model_id == settings.routing.fast_model_id
+    assert decision.can_escalate
+    # Without tools nothing counts as multi-tool
+    assert ModelRouter([]).likely_tool_count("weather, time and a document") == 0
+
+
+def test_each_rule_sends_the_prompt_to_the_strong_model() -> None:
+    with routing(max_fast_prompt_chars=50, max_fast_history_turns=2, max_fast_tools=1):
+        assert route("What is 6 times 7? " * 5) == (STRONG_ROUTE, "long_prompt")
+        assert route("Explain the quarterly report") == (STRONG_ROUTE, "reasoning")
+        assert route("Why is the sky blue?") == (STRONG_ROUTE, "reasoning")
+        assert route("What is 6 times 7?", history_turns=3) == (STRONG_ROUTE, "long_history")
+        assert route("What is 6 times 7?", history_turns=2) == (FAST_ROUTE, "simple")
+        assert route("Weather forecast and current date time?") == (STRONG_ROUTE, "multi_tool")
+        assert route("Weather forecast for Paris?") == (FAST_ROUTE, "simple")
+
+    # Rules are checked in order, and keywords ignore case
+    with routing(max_fast_prompt_chars=10):
+        assert route("ANALYZE it") == (STRONG_ROUTE, "reasoning")
+        assert route("Please ANALYZE it") == (STRONG_ROUTE, "long_prompt")
+
+
+def test_strong_route_does_not_escalate() -> None:
+    decision = ModelRouter(catalog()).route("Compare these two reports", history_turns=0)
+    assert decision.model_id == settings.routing.strong_model_id
+    assert not decision.can_escalate
+    with routing(escalate_on_error=False):
+        assert not ModelRouter(catalog()).route("Hello", history_turns=0).can_escalate
+
+
+def wrapper(models: dict[str, ScriptedModel]) -> StrandsAgentWrapper:
+    tools: list[Any] = catalog()
+    agent_wrapper = StrandsAgentWrapper.__new__(StrandsAgentWrapper)
+    agent_wrapper.actor_id = "actor"
+    agent_wrapper.tracer = StageTracer(enabled=False)
+    agent_wrapper.tool_selector = None
+    agent_wrapper.router = ModelRouter(tools)
+    agent_wrapper.memory_hook = MemoryHookProvider(mock.Mock(), "actor", "session")
+    agent_wrapper.agent = Agent(
+        model=models[settings.routing.fast_model_id],
+        tools=tools,
+        messages=list(HISTORY),
+        callback_handler=None,
+    )
+    return agent_wrapper
+
+
+def test_fast_model_error_rolls_back_and_escalates() -> None:
+    for run_async in (False, True):
+        fast, strong = settings.routing.fast_model_id, settings.routing.strong_model_id
+        models = {fast: ScriptedModel(fast, fail=True), strong: ScriptedModel(strong)}
+        agent_wrapper = wrapper(models)
+        metrics.reset()
+        prompt = "What is 6 times 7?"
+        with mock.patch.object(agent_module, "get_model", models.__getitem__):
+            if run_async:
+                response = asyncio.run(agent_wrapper.run_async(prompt, use_response_cache=False))
+            else:
+                response = agent_wrapper.run(prompt, use_response_cache=False)
+
+        assert response["response"]["content"] == [{"text": f"{strong} says 42"}]
+        assert models[fast].calls == 2 and models[strong].calls == 2
+        # The failed attempt's prompt, tool use and tool result are gone; the retry's stay
+        messages = agent_wrapper.agent.messages
+        assert messages[: len(HISTORY)] == HISTORY
+        turn = messages[len(HISTORY) :]
+        assert [message["role"] for message in turn] == ["user", "assistant", "user", "assistant"]
+        assert turn[0]["content"] == [{"text": prompt}]
+        assert agent_wrapper.agent.model is models[strong]
+        assert metrics.counter("model_router.escalations", route=FAST_ROUTE) == 1
+
+
+def test_error_without_escalation_is_raised() -> None:
+    fast, strong = settings.routing.fast_model_id, settings.routing.strong_model_id
+    models = {fast: ScriptedModel(fast, fail=True), strong: ScriptedModel(strong)}
+    agent_wrapper = wrapper(models)
+    with (
+        routing(escalate_on_error=False),
+        mock.patch.object(agent_module, "get_model", models.__getitem__),
+    ):
+        try:
+            agent_wrapper.run("What is 6 times 7?", use_response_cache=False)
+            raise AssertionError("the fast model's error should be raised")
+        except Exception as e:
+            # Strands wraps the model's error in an EventLoopException
+            assert "throttled" in str(e)
+    assert models[strong].calls == 0
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} model router tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+from loguru import logger
+
+from agentcore_agents import models
+from agentcore_agents.config import settings
+from agentcore_agents.models import clear_models, configured_model_ids, get_model, warm_up_models
+from agentcore_agents.startup import StartupWarmer
+
+
+class FakeBedrockClient:
+    """Answers ListAsyncInvokes with `error` raised, or an empty page."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+
+    def list_async_invokes(self, maxResults: int) -> dict[str, Any]:  # noqa: N803
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return {"asyncInvokeSummaries": []}
+
+
+@contextmanager
+def routed(fast: str, strong: str) -> Iterator[None]:
+    config = settings.routing
+    saved = config.enabled, config.fast_model_id, config.strong_model_id
+    config.enabled, config.fast_model_id, config.strong_model_id = True, fast, strong
+    try:
+        yield
+    finally:
+        config.enabled, config.fast_model_id, config.strong_model_id = saved
+
+
+def test_pool_reuses_one_model_per_id_and_config() -> None:
+    clear_models()
+    try:
+        first = get_model("fast-model")
+        assert get_model("fast-model") is first
+        assert get_model("strong-model") is not first
+
+        temperature = settings.model.temperature
+        try:
+            settings.model.temperature = temperature + 0.5
+            hotter = get_model("fast-model")
+            assert hotter is not first
+            assert hotter.get_config()["temperature"] == temperature + 0.5
+        finally:
+            settings.model.temperature = temperature
+        assert get_model("fast-model") is first
+    finally:
+        clear_models()
+    assert get_model("fast-model") is not first
+    clear_models()
+
+
+def test_concurrent_first_calls_share_one_model() -> None:
+    clear_models()
+    barrier = threading.Barrier(8)
+    created: list[object] = []
+
+    def resolve() -> None:
+        barrier.wait()
+        created.append(get_model("fast-model"))
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(created) == 8 and all(model is created[0] for model in created)
+    finally:
+        clear_models()
+
+
+def test_warm_up_tolerates_errors_of_every_model() -> None:
+    denied = ClientError({"Error": {"Code": "AccessDeniedException"}}, "ListAsyncInvokes")
+    clients = {
+        "fast-model": FakeBedrockClient(denied),
+        "strong-model": FakeBedrockClient(EndpointConnectionError(endpoint_url="https://x")),
+    }
+    lines: list[str] = []
+    sink = logger.add(lambda message: lines.append(message.record["message"]), level="WARNING")
+    try:
+        with (
+            routed("fast-model", "strong-model"),
+            mock.patch.object(
+                models, "get_model", lambda model_id: SimpleNamespace(client=clients[model_id])
+            ),
+        ):
+            assert configured_model_ids() == ["fast-model", "strong-model"]
+            warm_up_models()
+    finally:
+        logger.remove(sink)
+
+    assert [client.calls for client in clients.values()] == [1, 1]
+    # An access error still means the connection is open; only the unreachable one warns
+    assert len(lines) == 1 and "strong-model" in lines[0]
+
+
+def test_failed_warm_up_does_not_hold_up_startup() -> None:
+    def unreachable(model_id: str) -> Any:
+        if model_id == "strong-model":
+            raise ConnectionError("no route to Bedrock")
+        # A model without a client is skipped
+        return SimpleNamespace()
+
+    warmer = StartupWarmer(started_at=time.perf_counter())
+    with (
+        routed("fast-model", "strong-model"),
+        mock.patch.object(models, "get_model", unreachable),
+    ):
+        warmer.start({"models": warm_up_models})
+        assert warmer.wait(5)
+    assert warmer.ready
+    assert warmer.errors == {"models": "no route to Bedrock"}
+    assert "models" in warmer.stages
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} model pool tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from agentcore_agents.config import settings
+from agentcore_agents.provisioning import Outputs, ProvisionState, Step, poll, run_steps
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import provision  # noqa: E402
+
+
+class FakeAccount:
+    """In-memory stand-in for the AWS resources the setup scripts create.
+
+    Like IAM, a new role only becomes assumable by Lambda after a few more calls.
+    """
+
+    def __init__(self, propagation_calls: int = 3) -> None:
+        self.propagation_calls = propagation_calls
+        self.buckets: set[str] = set()
+        self.roles: dict[str, int] = {}
+        self.functions: dict[str, str] = {}
+        self.gateways: dict[str, dict[str, Any]] = {}
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def create_bucket(self, name: str) -> str:
+        with self._lock:
+            self.calls.append("create_bucket")
+            self.buckets.add(name)
+            return name
+
+    def create_role(self, name: str) -> str:
+        with self._lock:
+            self.calls.append("create_role")
+            self.roles.setdefault(name, 0)
+            return f"arn:aws:iam::123456789012:role/{name}"
+
+    def create_function(self, name: str, role_arn: str) -> str:
+        with self._lock:
+            self.calls.append("create_function")
+            role = role_arn.split("/")[-1]
+            self.roles[role] += 1
+            if self.roles[role] <= self.propagation_calls:
+                raise ClientError(
+                    {
+                        "Error": {
+                            "Code": "InvalidParameterValueException",
+                            "Message": "cannot assume",
+                        }
+                    },
+                    "CreateFunction",
+                )
+            arn = f"arn:aws:lambda:eu-central-1:123456789012:function:{name}"
+            self.functions[name] = arn
+            return arn
+
+    def create_gateway(self, name: str, authorizer: str) -> dict[str, Any]:
+        with self._lock:
+            self.calls.append("create_gateway")
+            gateway = {"gatewayId": f"{name}-id", "authorizer": authorizer, "targets": []}
+            self.gateways[name] = gateway
+            return gateway
+
+
+def role_not_assumable(e: Exception) -> bool:
+    return (
+        isinstance(e, ClientError)
+        and e.response.get("Error", {}).get("Code") == "InvalidParameterValueException"
+    )
+
+
+def build_steps(account: FakeAccount, barrier: threading.Barrier | None = None) -> list[Step]:
+    """The real provisioning graph, with each step acting on the fake account."""
+
+    def root(action: Any) -> Any:
+        def run(completed: dict[str, Outputs]) -> Outputs:
+            if barrier is not None:
+                # Only returns once all three root steps are running at the same time
+                barrier.wait()
+            return action()
+
+        return run
+
+    def lambda_function(completed: dict[str, Outputs]) -> Outputs:
+        arn = poll(
+            lambda: account.create_function("tools", completed["lambda_role"]["role_arn"]),
+            "the Lambda role",
+            retry_if=role_not_assumable,
+            base_delay=0.001,
+            timeout=5,
+        )
+        return {"lambda_arn": arn}
+
+    def gateway(completed: dict[str, Outputs]) -> Outputs:
+        authorizer = completed["cognito_authorizer"]["authorizer"]
+        return {"gateway_id": account.create_gateway("gw", authorizer)["gatewayId"]}
+
+    def lambda_target(completed: dict[str, Outputs]) -> Outputs:
+        account.gateways["gw"]["targets"].append(completed["lambda_function"]["lambda_arn"])
+        return {"target": "tools"}
+
+    def user_auth(completed: dict[str, Outputs]) -> Outputs:
+        return {"authorizer": account.gateways["gw"]["authorizer"]}
+
+    actions = {
+        "s3_bucket": root(lambda: {"bucket": account.create_bucket("docs")}),
+        "lambda_role": root(lambda: {"role_arn": account.create_role("tools-role")}),
+        "cognito_authorizer": root(lambda: {"authorizer": "pool-1"}),
+        "lambda_function": lambda_function,
+        "gateway": gateway,
+        "lambda_target": lambda_target,
+        "user_auth": user_auth,
+    }
+    return [
+        Step(step.name, actions[step.name], step.requires) for step in provision.build_steps(None)
+    ]
+
+
+def test_real_graph_orders_gateway_steps_after_the_gateway() -> None:
+    requires = {step.name: set(step.requires) for step in provision.build_steps(None)}
+    assert requires == {
+        "s3_bucket": set(),
+        "lambda_role": set(),
+        "cognito_authorizer": set(),
+        "lambda_function": {"lambda_role"},
+        "gateway": {"cognito_authorizer"},
+        "lambda_target": {"gateway", "lambda_function"},
+        "user_auth": {"gateway"},
+    }
+    steps = provision.build_steps("RuntimeRole")
+    assert [step.name for step in steps][-1] == "runtime_permissions"
+    assert steps[-1].requires == ()
+
+
+def test_user_auth_waits_until_the_gateway_is_listed() -> None:
+    lookups: list[str | None] = []
+    authorized: list[int] = []
+
+    class FakeGatewaySetup:
+        def find_gateway(self, name: str | None) -> dict | None:
+            lookups.append(name)
+            # A freshly created gateway is missing from the first listing
+            return {"gatewayId": "gw-id"} if len(lookups) > 1 else None
+
+    def setup_user_auth(setup: Any, gateway_name: str) -> Path:
+        authorized.append(len(lookups))
+        return Path("user_auth_config.json")
+
+    saved = provision.GatewaySetup, provision.setup_user_auth
+    provision.GatewaySetup, provision.setup_user_auth = FakeGatewaySetup, setup_user_auth
+    try:
+        outputs = provision.user_auth({"gateway": {"gateway_id": "gw-id"}})
+    finally:
+        provision.GatewaySetup, provision.setup_user_auth = saved
+    assert lookups == [settings.gateway.name] * 2
+    assert authorized == [2]
+    assert outputs == {"config_path": "user_auth_config.json"}
+
+
+def test_existing_gateway_keeps_its_authorizer() -> None:
+    authorizer = {"customJWTAuthorizer": {"discoveryUrl": "https://cognito.example"}}
+
+    class FakeGatewaySetup:
+        def find_gateway(self, name: str | None) -> dict | None:
+            assert name == settings.gateway.name
+            return {"gatewayId": "gw-id", "authorizerConfiguration": authorizer}
+
+    def create_authorizer(setup: Any, gateway_name: str) -> dict:
+        raise AssertionError("a second authorizer would orphan a user pool")
+
+    saved = provision.GatewaySetup, provision.create_authorizer
+    provision.GatewaySetup, provision.create_authorizer = FakeGatewaySetup, create_authorizer
+    try:
+        outputs = provision.cognito_authorizer({})
+    finally:
+        provision.GatewaySetup, provision.create_authorizer = saved
+    assert outputs == {"authorizer_config": authorizer}
+
+
+def test_independent_steps_run_concurrently_and_dependents_wait() -> None:
+    account = FakeAccount()
+    with tempfile.TemporaryDirectory() as tmp:
+        state = ProvisionState(Path(tmp) / "state.json")
+        run_steps(build_steps(account, threading.Barrier(3, timeout=5)), state)
+
+    assert account.buckets == {"docs"}
+    assert account.gateways["gw"]["targets"] == [account.functions["tools"]]
+    assert account.calls.index("create_role") < account.calls.index("create_function")
+    # The role was retried until it propagated, instead of after a fixed sleep
+    assert account.calls.count("create_function") == account.propagation_calls + 1
+
+
+def test_state_file_lets_a_rerun_skip_completed_steps() -> None:
+    account = FakeAccount()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "state.json"
+        steps = build_steps(account)
+        run_steps(steps, ProvisionState(path))
+        calls = len(account.calls)
+
+        state = run_steps(steps, ProvisionState.load(path))
+        assert len(account.calls) == calls
+        assert state.completed["lambda_function"]["lambda_arn"] == account.functions["tools"]
+
+        state = ProvisionState.load(path)
+        state.forget(["gateway"])
+        run_steps(steps, state)
+        assert account.calls[calls:] == ["create_gateway"]
+
+
+def test_failed_step_blocks_only_its_dependents_and_resumes() -> None:
+    account = FakeAccount()
+    failing = {"gateway": True}
+    steps = build_steps(account)
+    gateway_step = next(step for step in steps if step.name == "gateway")
+
+    def flaky_gateway(completed: dict[str, Outputs]) -> Outputs | None:
+        if failing["gateway"]:
+            raise RuntimeError("gateway quota exceeded")
+        return gateway_step.run(completed)
+
+    steps = [
+        Step("gateway", flaky_gateway, gateway_step.requires) if s is gateway_step else s
+        for s in steps
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "state.json"
+        try:
+            run_steps(steps, ProvisionState(path))
+            raise AssertionError("run_steps should have failed")
+        except RuntimeError as e:
+            assert all(name in str(e) for name in ("gateway", "lambda_target", "user_auth"))
+
+        state = ProvisionState.load(path)
+        assert set(state.completed) == {
+            "s3_bucket",
+            "lambda_role",
+            "cognito_authorizer",
+            "lambda_function",
+        }
+
+        failing["gateway"] = False
+        calls = len(account.calls)
+        state = run_steps(steps, state)
+        assert account.calls[calls:] == ["create_gateway"]
+        assert "lambda_target" in state.completed
+
+
+def test_invalid_graphs_are_rejected() -> None:
+    def noop(completed: dict[str, Outputs]) -> Outputs:
+        return {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state = ProvisionState(Path(tmp) / "state.json")
+        for steps in (
+            [Step("a", noop, requires=("missing",))],
+            [Step("a", noop, requires=("b",)), Step("b", noop, requires=("a",))],
+            [Step("a", noop), Step("a", noop)],
+        ):
+            try:
+                run_steps(steps, state)
+                raise AssertionError(f"{steps} should be rejected")
+            except ValueError:
+                pass
+
+
+def test_poll_backs_off_with_jitter_and_times_out() -> None:
+    attempts: list[float] = []
+
+    def ready_on_fourth() -> str | None:
+        attempts.append(time.monotonic())
+        return "ready" if len(attempts) == 4 else None
+
+    assert poll(ready_on_fourth, "ready", base_delay=0.01, max_delay=0.05) == "ready"
+    assert len(attempts) == 4
+
+    started = time.monotonic()
+    try:
+        poll(lambda: None, "never", base_delay=0.01, max_delay=0.02, timeout=0.2)
+        raise AssertionError("poll should have timed out")
+    except TimeoutError:
+        assert time.monotonic() - started < 0.5
+
+    def not_retryable() -> None:
+        raise KeyError("boom")
+
+    try:
+        poll(not_retryable, "boom", retry_if=role_not_assumable)
+        raise AssertionError("poll should have raised")
+    except KeyError:
+        pass
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} provisioning tests passed")
+
+
+if __name__ == "__main__":
+    main()
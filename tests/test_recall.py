@@ -0,0 +1,196 @@
+from typing import Any
+
+import numpy as np
+from loguru import logger
+from strands import Agent
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands.types.content import Messages
+
+from agentcore_agents.memory.hooks import MemoryHookProvider
+from agentcore_agents.memory.recall import HashingEmbedder, RecallIndex
+
+TURNS = [
+    ("What is 12 times 7?", "12 times 7 is 84."),
+    ("Which documents are in the S3 bucket?", "The bucket holds report.pdf and notes.txt."),
+    ("What time is it in Tokyo?", "It is 21:00 in Tokyo."),
+    ("Tell me a joke", "Why did the developer go broke? Because he used up all his cache."),
+    ("How are you today?", "I am doing well, thanks."),
+]
+
+
+def build_index(max_turns: int = 100) -> RecallIndex:
+    index = RecallIndex(HashingEmbedder(dim=256), max_turns=max_turns)
+    for user_text, assistant_text in TURNS:
+        index.add_message("USER", user_text)
+        index.add_message("ASSISTANT", assistant_text)
+    return index
+
+
+def user_texts(turns: list[list[dict[str, Any]]]) -> list[str]:
+    return [turn[0]["content"]["text"] for turn in turns]
+
+
+class FakeMemorySession:
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+
+    def add_turns(self, messages: list[Any]) -> dict[str, str]:
+        self.events.extend(messages)
+        return {"eventId": str(len(self.events))}
+
+    def get_last_k_turns(self, k: int) -> list[list[dict[str, Any]]]:
+        return []
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+
+def test_hashing_embedder_is_deterministic_and_normalized() -> None:
+    embedder = HashingEmbedder(dim=64)
+    first = embedder.embed(["Read the quarterly report", ""])
+    second = HashingEmbedder(dim=64).embed(["Read the quarterly report", ""])
+
+    assert first.dtype == np.float32
+    assert np.array_equal(first, second)
+    assert np.isclose(np.linalg.norm(first[0]), 1.0)
+    assert not first[1].any()
+
+
+def test_search_returns_most_similar_turns_in_session_order() -> None:
+    index = build_index()
+
+    turns = index.search("Summarize the documents in my bucket", top_k=1, min_score=0.1)
+    assert user_texts(turns) == ["Which documents are in the S3 bucket?"]
+
+    turns = index.search("And the time in Tokyo now?", top_k=1, keep_last=1, min_score=0.1)
+    assert user_texts(turns) == ["What time is it in Tokyo?", "How are you today?"]
+
+
+def test_search_skips_turns_below_min_score() -> None:
+    index = build_index()
+    assert index.search("quantum chromodynamics", top_k=3, min_score=0.3) == []
+
+
+def test_assistant_message_extends_the_open_turn() -> None:
+    index = build_index()
+    assert len(index) == len(TURNS)
+    assert [m["role"] for m in index.turns[0]] == ["USER", "ASSISTANT"]
+
+    # The answer is embedded with its question, so it is searchable too
+    turns = index.search("report.pdf notes.txt", top_k=1, min_score=0.1)
+    assert user_texts(turns) == ["Which documents are in the S3 bucket?"]
+
+
+def test_oldest_turns_are_dropped_past_max_turns() -> None:
+    index = build_index(max_turns=3)
+    assert len(index) == 3
+    assert index.dropped == 2
+    assert index.total_turns == len(TURNS)
+    assert "What is 12 times 7?" not in user_texts(index.search("12 times 7", top_k=3))
+    assert user_texts(index.search("time in Tokyo", top_k=1, min_score=0.1)) == [
+        "What time is it in Tokyo?"
+    ]
+
+
+def test_search_before_excludes_later_turns() -> None:
+    index = build_index()
+    turns = index.search("How are you today?", top_k=5, min_score=0.1, before=4)
+    assert "How are you today?" not in user_texts(turns)
+
+
+def test_load_indexes_memory_turns() -> None:
+    index = RecallIndex(HashingEmbedder(dim=256), max_turns=100)
+    index.load(
+        [
+            [
+                {"role": "USER", "content": {"text": "What is 12 times 7?"}},
+                {"role": "ASSISTANT", "content": {"text": "84"}},
+            ],
+            [{"role": "OTHER", "content": {"text": "ignored"}}],
+        ]
+    )
+    assert len(index) == 1
+    assert user_texts(index.search("12 times 7", top_k=1)) == ["What is 12 times 7?"]
+
+
+def test_hook_replaces_recalled_history_per_prompt() -> None:
+    index = build_index()
+    hook = MemoryHookProvider(
+        memory_session=FakeMemorySession(),
+        actor_id="actor",
+        session_id="session",
+        recall_index=index,
+    )
+    hook._recall_before = index.total_turns
+    agent = FakeAgent()
+
+    hook.recall_history(agent, "Which documents are in the bucket?")
+    first = [block["text"] for m in agent.messages for block in m["content"]]
+    assert first[0] == "Which documents are in the S3 bucket?"
+
+    agent.messages.append({"role": "user", "content": [{"text": "live prompt"}]})
+    hook.recall_history(agent, "What is 12 times 7?")
+    texts = [block["text"] for m in agent.messages for block in m["content"]]
+    assert "What is 12 times 7?" in texts
+    assert "Which documents are in the S3 bucket?" not in texts
+    assert agent.messages[-1]["content"][0]["text"] == "live prompt"
+
+    hook.save_turn("What is the capital of France?", "Paris.")
+    assert len(index) == len(TURNS) + 1
+    assert index.turns[-1][1]["content"]["text"] == "Paris."
+
+
+def test_recall_after_the_window_trims_keeps_the_live_messages() -> None:
+    index = build_index()
+    hook = MemoryHookProvider(
+        memory_session=FakeMemorySession(),
+        actor_id="actor",
+        session_id="session",
+        recall_index=index,
+    )
+    hook._recall_before = index.total_turns
+    window = SlidingWindowConversationManager(window_size=6, should_truncate_results=False)
+    agent = Agent(conversation_manager=window, callback_handler=None)
+    live: Messages = []
+    for number in range(4):
+        hook.recall_history(agent, "Which documents are in the bucket?")
+        recalled = list(hook._history)
+        assert recalled and agent.messages[: len(recalled)] == recalled
+
+        turn: Messages = [
+            {"role": "user", "content": [{"text": f"live prompt {number}"}]},
+            {"role": "assistant", "content": [{"text": f"live answer {number}"}]},
+        ]
+        agent.messages.extend(turn)
+        live.extend(turn)
+        # Trims the oldest messages, recalled ones first, then the oldest live ones
+        window.apply_management(agent)
+        live = [message for message in live if any(message is m for m in agent.messages)]
+
+    hook.recall_history(agent, "What is 12 times 7?")
+    texts = [block["text"] for m in agent.messages for block in m["content"]]
+    assert "What is 12 times 7?" in texts
+    assert "Which documents are in the S3 bucket?" not in texts
+    assert agent.messages[len(hook._history) :] == live
+    assert [m["content"][0]["text"] for m in live] == [
+        "live prompt 1",
+        "live answer 1",
+        "live prompt 2",
+        "live answer 2",
+        "live prompt 3",
+        "live answer 3",
+    ]
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} recall tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from replay import Checkpoint, replay  # noqa: E402
+
+RECORDS = 201
+
+
+class FakeInvoke:
+    """Echoes the prompt; the prompt `interrupt_at` is interrupted like a Ctrl-C."""
+
+    def __init__(self, interrupt_at: int | None = None) -> None:
+        self.interrupt_at = interrupt_at
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, payload: dict[str, Any], context: Any) -> dict[str, Any]:
+        if payload["prompt"] == f"prompt {self.interrupt_at}":
+            raise KeyboardInterrupt
+        with self._lock:
+            self.prompts.append(payload["prompt"])
+        assert payload["bearer_token"] == "secret"
+        return {"result": payload["prompt"].upper()}
+
+
+def write_payloads(path: Path) -> None:
+    with path.open("w") as f:
+        for i in range(RECORDS):
+            f.write(json.dumps({"prompt": f"prompt {i}", "session_id": "s", "token": "secret"}))
+            f.write("\n")
+            if i == 100:
+                # Blank lines are skipped but still counted
+                f.write("\n")
+
+
+def run(tmp: Path, invoke: FakeInvoke) -> Checkpoint:
+    return replay(
+        tmp / "payloads.jsonl",
+        tmp / "results.jsonl",
+        tmp / "results.jsonl.checkpoint",
+        concurrency=4,
+        invoke=invoke,
+        checkpoint_every=50,
+    )
+
+
+def interrupted(tmp: Path, at: int) -> None:
+    try:
+        run(tmp, FakeInvoke(interrupt_at=at))
+        raise AssertionError("replay should have been interrupted")
+    except KeyboardInterrupt:
+        pass
+
+
+def results(tmp: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in (tmp / "results.jsonl").read_text().splitlines()]
+
+
+def assert_complete(tmp: Path) -> None:
+    records = results(tmp)
+    assert [record["prompt"] for record in records] == [f"prompt {i}" for i in range(RECORDS)]
+    assert [record["line"] for record in records] == [
+        i + 1 if i <= 100 else i + 2 for i in range(RECORDS)
+    ]
+    assert all(record["ok"] and "token" not in record for record in records)
+    assert records[-1]["response"] == {"result": f"PROMPT {RECORDS - 1}"}
+
+
+def test_interrupted_run_resumes_in_order_without_duplicates() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        write_payloads(tmp / "payloads.jsonl")
+        interrupted(tmp, at=120)
+
+        checkpoint = Checkpoint.load(tmp / "results.jsonl.checkpoint")
+        assert not checkpoint.done
+        assert checkpoint.records == len(results(tmp)) == 120
+
+        invoke = FakeInvoke()
+        checkpoint = run(tmp, invoke)
+        assert checkpoint.done and checkpoint.records == RECORDS
+        # Only the payloads without a written result run again
+        assert sorted(invoke.prompts) == sorted(f"prompt {i}" for i in range(120, RECORDS))
+        assert_complete(tmp)
+
+        # A finished replay is not run again
+        invoke = FakeInvoke()
+        run(tmp, invoke)
+        assert invoke.prompts == []
+        assert_complete(tmp)
+
+
+def test_results_written_after_the_last_checkpoint_are_dropped() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        write_payloads(tmp / "payloads.jsonl")
+        interrupted(tmp, at=80)
+        # A killed run can leave results, and a partial line, past the checkpoint
+        with (tmp / "results.jsonl").open("a") as output:
+            output.write(json.dumps({"prompt": "prompt 80", "line": 81}) + "\n")
+            output.write('{"prompt": "prom')
+
+        run(tmp, FakeInvoke())
+        assert_complete(tmp)
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} replay tests passed")
+
+
+if __name__ == "__main__":
+    main()
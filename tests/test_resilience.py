@@ -0,0 +1,218 @@
+import asyncio
+import contextlib
+import json
+import time
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.tools.resilience import (
+    CircuitBreaker,
+    ResilientTool,
+    clear_tool_resilience,
+)
+from agentcore_agents.tools.wrappers import make_tool_result, tool_result_text
+
+TOOL_USE: ToolUse = {"toolUseId": "1", "name": "AgentTools___calculator", "input": {}}
+
+
+class FakeTool(AgentTool):
+    """Each call takes the next (delay, status) of its script; "raise" raises."""
+
+    def __init__(self, script: list[tuple[float, str]]) -> None:
+        super().__init__()
+        self.script = script
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def tool_name(self) -> str:
+        return "AgentTools___calculator"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.tool_name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        call = self.calls
+        delay, status = self.script[min(call, len(self.script) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if status == "raise":
+            raise RuntimeError("tool crashed")
+        yield ToolResultEvent(make_tool_result(tool_use, f"call {call}", status=status))
+
+
+class QuickHedge(ResilientTool):
+    def hedge_delay(self) -> float:
+        return 0.02
+
+
+def run(tool: ResilientTool) -> ToolResult:
+    return asyncio.run(tool.call(TOOL_USE, {}))
+
+
+def open_breaker(breaker: CircuitBreaker, open_seconds: float = 0.05) -> None:
+    breaker.open_seconds = open_seconds
+    for _ in range(breaker.failure_threshold):
+        breaker.record(ok=False)
+    assert breaker.state == "open"
+
+
+def test_breaker_opens_half_opens_and_closes() -> None:
+    breaker = CircuitBreaker("calculator", failure_threshold=3, open_seconds=0.05)
+    for _ in range(2):
+        breaker.record(ok=False)
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record(ok=False)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    # One trial at a time
+    assert not breaker.allow()
+    breaker.record(ok=True)
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_failed_trial_opens_the_circuit_again() -> None:
+    breaker = CircuitBreaker("calculator", failure_threshold=2, open_seconds=0.05)
+    open_breaker(breaker)
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(ok=False)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_open_circuit_fails_fast_with_a_structured_error() -> None:
+    clear_tool_resilience()
+    fake = FakeTool([(0, "error")])
+    tool = ResilientTool(fake, hedged=False)
+    for _ in range(tool.breaker.failure_threshold):
+        assert run(tool)["status"] == "error"
+
+    result = run(tool)
+    assert fake.calls == tool.breaker.failure_threshold
+    assert json.loads(tool_result_text(result))["error"] == "tool_unavailable"
+
+
+def test_exception_counts_as_failure() -> None:
+    clear_tool_resilience()
+    tool = ResilientTool(FakeTool([(0, "raise")]), hedged=False)
+    with contextlib.suppress(RuntimeError):
+        run(tool)
+    assert tool.breaker.failures == 1
+
+
+def test_cancelled_trial_releases_the_half_open_circuit() -> None:
+    clear_tool_resilience()
+    fake = FakeTool([(10, "success"), (0, "success")])
+    tool = ResilientTool(fake, hedged=False)
+    open_breaker(tool.breaker)
+    time.sleep(0.06)
+
+    async def cancel_trial() -> None:
+        trial = asyncio.create_task(tool.call(TOOL_USE, {}))
+        while not fake.calls:
+            await asyncio.sleep(0)
+        trial.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await trial
+
+    asyncio.run(cancel_trial())
+    assert fake.cancelled == 1
+    assert tool.breaker.state == "half_open"
+    # The next call is the trial, and its success closes the circuit
+    assert run(tool)["status"] == "success"
+    assert tool.breaker.state == "closed"
+
+
+def test_hedge_wins_and_the_slow_call_is_cancelled() -> None:
+    clear_tool_resilience()
+    fake = FakeTool([(10, "success"), (0, "success")])
+    tool = QuickHedge(fake, hedged=True)
+    wins = metrics.counter("tool.hedge_wins", tool="calculator")
+
+    result = run(tool)
+    assert tool_result_text(result) == "call 1"
+    assert fake.calls == 2
+    assert fake.cancelled == 1
+    assert metrics.counter("tool.hedge_wins", tool="calculator") == wins + 1
+    assert len(tool.latencies) == 1
+
+
+def test_fast_call_is_not_hedged() -> None:
+    clear_tool_resilience()
+    fake = FakeTool([(0, "success")])
+    assert tool_result_text(run(QuickHedge(fake, hedged=True))) == "call 0"
+    assert fake.calls == 1
+
+
+def test_cancelling_a_hedged_call_cancels_both_calls() -> None:
+    clear_tool_resilience()
+    fake = FakeTool([(10, "success")])
+    tool = QuickHedge(fake, hedged=True)
+    open_breaker(tool.breaker)
+    time.sleep(0.06)
+
+    async def cancel() -> None:
+        call = asyncio.create_task(tool.call(TOOL_USE, {}))
+        while fake.calls < 2:
+            await asyncio.sleep(0.005)
+        call.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await call
+
+    asyncio.run(cancel())
+    assert fake.cancelled == 2
+    assert tool.breaker.allow()
+
+
+def test_metrics_report_shows_circuits_and_hedging() -> None:
+    clear_tool_resilience()
+    metrics.reset()
+    slow_then_fast = FakeTool([(10, "success"), (0, "success"), (0, "success")])
+    tool = QuickHedge(slow_then_fast, hedged=True)
+    run(tool)
+    run(tool)
+
+    stats = metrics.report()["tool_resilience"]["calculator"]
+    assert stats["calls"] == 2 and stats["hedges"] == 1 and stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == 0.5 and stats["hedge_win_rate"] == 1.0
+    assert stats["circuit"] == "closed"
+
+    open_breaker(tool.breaker)
+    assert run(tool)["status"] == "error"
+    stats = metrics.report()["tool_resilience"]["calculator"]
+    assert stats["circuit"] == "open"
+    assert stats["circuit_opened"] == 1 and stats["circuit_rejections"] == 1
+    assert stats["calls"] == 2
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} resilience tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import time
+from typing import Any
+
+from loguru import logger
+from strands.types.content import Message, Messages
+
+from agentcore_agents.config import settings
+from agentcore_agents.response_cache import ResponseCache, response_ttl
+
+HISTORY: Messages = [
+    {"role": "user", "content": [{"text": "What is 6 times 7?"}]},
+    {"role": "assistant", "content": [{"text": "6 times 7 is 42."}]},
+]
+
+
+def answer(text: str) -> Message:
+    return {"role": "assistant", "content": [{"text": text}]}
+
+
+def key(
+    prompt: str = "What time is it in Tokyo?",
+    actor_id: str = "alice",
+    history: Messages = HISTORY,
+    catalog: str = "catalog-1",
+) -> tuple[str, str]:
+    return ResponseCache.make_key(actor_id, prompt, history, catalog)
+
+
+def tool_turn(tool_name: str, status: str = "success") -> Messages:
+    tool_use: Any = {"toolUseId": "1", "name": f"AgentTools___{tool_name}", "input": {}}
+    tool_result: Any = {"toolUseId": "1", "status": status, "content": [{"text": "ok"}]}
+    return [
+        {"role": "assistant", "content": [{"toolUse": tool_use}]},
+        {"role": "user", "content": [{"toolResult": tool_result}]},
+        answer("done"),
+    ]
+
+
+def test_key_ignores_case_and_whitespace_of_the_prompt() -> None:
+    assert key("What time is it in Tokyo?") == key("  what TIME is it\nin tokyo? ")
+    assert key("What time is it in Tokyo?") != key("What time is it in Paris?")
+
+
+def test_key_is_scoped_per_actor() -> None:
+    assert key(actor_id="alice")[0] == "alice"
+    assert key(actor_id="alice") != key(actor_id="bob")
+    # The same question with the same history gets the same digest for every actor
+    assert key(actor_id="alice")[1] == key(actor_id="bob")[1]
+
+
+def test_key_changes_with_history_catalog_and_model() -> None:
+    base = key()
+    assert key(history=[]) != base
+    assert key(catalog="catalog-2") != base
+
+    model_id, temperature = settings.model.model_id, settings.model.temperature
+    try:
+        settings.model.model_id = "another-model"
+        assert key() != base
+        settings.model.model_id = model_id
+        settings.model.temperature = temperature + 0.5
+        assert key() != base
+    finally:
+        settings.model.model_id, settings.model.temperature = model_id, temperature
+    assert key() == base
+
+
+def test_entry_expires_after_its_ttl() -> None:
+    cache = ResponseCache(max_entries=16, max_bytes=1024 * 1024)
+    cache.put_response(key(), answer("It is 21:00 in Tokyo."), ttl_seconds=0.05)
+    assert cache.get(key()) == answer("It is 21:00 in Tokyo.")
+    assert cache.get(key(actor_id="bob")) is None
+
+    time.sleep(0.06)
+    assert cache.get(key()) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=1024 * 1024)
+    keys = [key(f"question {i}") for i in range(3)]
+    for i, entry_key in enumerate(keys[:2]):
+        cache.put_response(entry_key, answer(f"answer {i}"), ttl_seconds=60)
+    cache.get(keys[0])
+    cache.put_response(keys[2], answer("answer 2"), ttl_seconds=60)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == answer("answer 0")
+    assert cache.get(keys[2]) == answer("answer 2")
+
+
+def test_size_bound_evicts_and_skips_oversized_answers() -> None:
+    cache = ResponseCache(max_entries=16, max_bytes=200)
+    cache.put_response(key("small"), answer("x" * 50), ttl_seconds=60)
+    cache.put_response(key("too big"), answer("x" * 500), ttl_seconds=60)
+    assert cache.get(key("too big")) is None
+    assert cache.get(key("small")) is not None
+
+    cache.put_response(key("medium"), answer("x" * 100), ttl_seconds=60)
+    assert cache.get(key("small")) is None
+    assert cache.get(key("medium")) is not None
+
+
+def test_turn_ttl_follows_the_tools_it_called() -> None:
+    assert response_ttl([answer("Hello!")]) == settings.response_cache.ttl_seconds
+    assert response_ttl(tool_turn("calculator")) == settings.response_cache.ttl_seconds
+    assert (
+        response_ttl(tool_turn("read_s3_document"))
+        == settings.tool_cache.ttl_seconds["read_s3_document"]
+    )
+    assert response_ttl(tool_turn("get_current_time")) is None
+    assert response_ttl(tool_turn("calculator", status="error")) is None
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} response cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
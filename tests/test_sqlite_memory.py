@@ -0,0 +1,211 @@
+import inspect
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage, MessageRole
+from bedrock_agentcore.memory.models.filters import EventMetadataFilter, OperatorType
+from loguru import logger
+
+from agentcore_agents.memory.backend import MemoryBackend, SessionMemory
+from agentcore_agents.memory.sqlite import (
+    SQLiteMemoryBackend,
+    SQLiteMemorySession,
+    clear_sqlite_backends,
+    get_sqlite_backend,
+)
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@contextmanager
+def database() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp) / "memory.db"
+
+
+def user(text: str) -> ConversationalMessage:
+    return ConversationalMessage(text, MessageRole.USER)
+
+
+def assistant(text: str) -> ConversationalMessage:
+    return ConversationalMessage(text, MessageRole.ASSISTANT)
+
+
+def texts(turns: list[list[dict[str, Any]]]) -> list[list[str]]:
+    return [[message["content"]["text"] for message in turn] for turn in turns]
+
+
+def metadata_filter(
+    operator: OperatorType | str, key: str, value: str | None = None
+) -> EventMetadataFilter:
+    expression: Any = {"left": {"metadataKey": key}, "operator": operator}
+    if value is not None:
+        expression["right"] = {"metadataValue": {"stringValue": value}}
+    return expression
+
+
+def test_last_k_turns_are_oldest_first_and_start_at_user_messages() -> None:
+    with database() as path:
+        session = SQLiteMemoryBackend(path).get_or_create_session("actor", "session")
+        session.add_turns([user("q1"), assistant("a1")], event_timestamp=START)
+        # One turn can span several events, and blobs are not part of the history
+        session.add_turns([user("q2")], event_timestamp=START + timedelta(seconds=1))
+        session.add_turns([BlobMessage({"kind": "state"})], event_timestamp=START)
+        session.add_turns(
+            [assistant("a2 calling a tool"), assistant("a2")],
+            event_timestamp=START + timedelta(seconds=2),
+        )
+        # Ordered by timestamp, not by insertion
+        session.add_turns([user("q3"), assistant("a3")], event_timestamp=START + timedelta(hours=1))
+        session.add_turns([user("q0"), assistant("a0")], event_timestamp=START - timedelta(hours=1))
+
+        assert texts(session.get_last_k_turns(2)) == [
+            ["q2", "a2 calling a tool", "a2"],
+            ["q3", "a3"],
+        ]
+        assert texts(session.get_last_k_turns(10)) == [
+            ["q0", "a0"],
+            ["q1", "a1"],
+            ["q2", "a2 calling a tool", "a2"],
+            ["q3", "a3"],
+        ]
+        assert session.get_last_k_turns(0) == []
+        assert session.get_last_k_turns(1)[0][0] == {"content": {"text": "q3"}, "role": "USER"}
+
+
+def test_events_with_the_same_timestamp_keep_insertion_order() -> None:
+    with database() as path:
+        session = SQLiteMemoryBackend(path).get_or_create_session("actor", "session")
+        for i in range(3):
+            session.add_turns([user(f"q{i}"), assistant(f"a{i}")], event_timestamp=START)
+        assert texts(session.get_last_k_turns(3)) == [["q0", "a0"], ["q1", "a1"], ["q2", "a2"]]
+        questions = [
+            event["payload"][0]["conversational"]["content"]["text"]
+            for event in session.list_events()
+        ]
+        assert questions == ["q2", "q1", "q0"]
+
+
+def test_list_events_filters_on_metadata() -> None:
+    with database() as path:
+        session = SQLiteMemoryBackend(path).get_or_create_session("actor", "session")
+        summary = session.add_turns(
+            [BlobMessage({"summary": "old turns"})],
+            metadata={"kind": {"stringValue": "summary"}},
+            event_timestamp=START,
+        )
+        note = session.add_turns(
+            [BlobMessage({"note": "pinned"})],
+            metadata={"kind": {"stringValue": "note"}},
+            event_timestamp=START + timedelta(seconds=1),
+        )
+        turn = session.add_turns(
+            [user("q1"), assistant("a1")], event_timestamp=START + timedelta(seconds=2)
+        )
+
+        def ids(*filters: EventMetadataFilter, max_results: int = 100) -> list[str]:
+            events = session.list_events(eventMetadata=list(filters), max_results=max_results)
+            return [event["eventId"] for event in events]
+
+        assert ids() == [turn["eventId"], note["eventId"], summary["eventId"]]
+        assert ids(max_results=1) == [turn["eventId"]]
+        assert ids(metadata_filter(OperatorType.EQUALS_TO, "kind", "summary")) == [
+            summary["eventId"]
+        ]
+        # ListEvents also takes the operator's string value
+        assert ids(metadata_filter("EQUALS_TO", "kind", "note")) == [note["eventId"]]
+        assert ids(metadata_filter(OperatorType.EXISTS, "kind")) == [
+            note["eventId"],
+            summary["eventId"],
+        ]
+        assert ids(metadata_filter(OperatorType.NOT_EXISTS, "kind")) == [turn["eventId"]]
+        assert ids(
+            metadata_filter(OperatorType.EXISTS, "kind"),
+            metadata_filter(OperatorType.EQUALS_TO, "kind", "note"),
+        ) == [note["eventId"]]
+
+        event = session.list_events(eventMetadata=[metadata_filter("EXISTS", "kind")])[0]
+        assert event["metadata"] == {"kind": {"stringValue": "note"}}
+        assert event["eventTimestamp"] == START + timedelta(seconds=1)
+        assert (event["actorId"], event["sessionId"]) == ("actor", "session")
+
+        try:
+            session.list_events(eventMetadata=[metadata_filter("GREATER_THAN", "kind", "a")])
+            raise AssertionError("unsupported operator should be rejected")
+        except ValueError:
+            pass
+
+
+def test_sessions_are_isolated_and_delete_is_scoped() -> None:
+    with database() as path:
+        backend = SQLiteMemoryBackend(path)
+        alice = backend.get_or_create_session("alice", "session")
+        bob = backend.get_or_create_session("bob", "session")
+        other = backend.get_or_create_session("alice", "other")
+        event = alice.add_turns([user("q1"), assistant("a1")])
+        bob.add_turns([user("bob q1"), assistant("bob a1")])
+
+        assert texts(bob.get_last_k_turns(5)) == [["bob q1", "bob a1"]]
+        assert other.list_events() == []
+
+        bob.delete_event(event["eventId"])
+        assert len(alice.list_events()) == 1
+        alice.delete_event(event["eventId"])
+        assert alice.list_events() == []
+        assert alice.get_last_k_turns(5) == []
+
+
+def test_events_persist_and_expire_when_the_backend_opens() -> None:
+    with database() as path:
+        session = SQLiteMemoryBackend(path).get_or_create_session("actor", "session")
+        session.add_turns([user("old")], event_timestamp=datetime.now(UTC) - timedelta(days=40))
+        session.add_turns([user("new")])
+
+        reopened = SQLiteMemoryBackend(path).get_or_create_session("actor", "session")
+        assert texts(reopened.get_last_k_turns(5)) == [["old"], ["new"]]
+
+        expired = SQLiteMemoryBackend(path, expiry_days=30).get_or_create_session(
+            "actor", "session"
+        )
+        assert texts(expired.get_last_k_turns(5)) == [["new"]]
+
+        clear_sqlite_backends()
+        assert get_sqlite_backend(path) is get_sqlite_backend(str(path))
+        clear_sqlite_backends()
+
+
+def test_backend_implements_the_memory_protocols() -> None:
+    with database() as path:
+        backend: MemoryBackend = SQLiteMemoryBackend(path)
+        session: SessionMemory = backend.get_or_create_session("actor", "session")
+        assert isinstance(session, SQLiteMemorySession)
+
+    for protocol, implementation in [
+        (SessionMemory, SQLiteMemorySession),
+        (MemoryBackend, SQLiteMemoryBackend),
+    ]:
+        for name, method in vars(protocol).items():
+            if name.startswith("_") or not callable(method):
+                continue
+            expected = inspect.signature(method).parameters
+            actual = inspect.signature(getattr(implementation, name)).parameters
+            for parameter in expected.values():
+                assert parameter.name in actual, f"{implementation.__name__}.{name}"
+                assert actual[parameter.name].kind == parameter.kind
+                assert actual[parameter.name].default == parameter.default
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} SQLite memory tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import importlib
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+from bedrock_agentcore.runtime.models import PingStatus
+from loguru import logger
+from starlette.testclient import TestClient
+
+from agentcore_agents.config import settings
+from agentcore_agents.startup import StartupWarmer
+
+# Importing the runtime would otherwise pre-warm the real Gateway, memory and models
+settings.runtime.prewarm_on_start = False
+sys.path.insert(0, str(Path(__file__).parent.parent))
+runtime_handler = importlib.import_module("runtime_handler")
+
+
+def gated(release: threading.Event) -> Callable[[], None]:
+    def task() -> None:
+        assert release.wait(5)
+
+    return task
+
+
+def test_ping_is_busy_until_warm_up_finishes() -> None:
+    release = threading.Event()
+    warmer = StartupWarmer(started_at=time.perf_counter())
+    warmer.start({"models": gated(release), "gateway_url": lambda: None})
+    with mock.patch.object(runtime_handler, "warmer", warmer):
+        assert runtime_handler.ping() == PingStatus.HEALTHY_BUSY
+        release.set()
+        assert warmer.wait(5)
+        assert runtime_handler.ping() is None
+    assert set(warmer.stages) == {"models", "gateway_url"}
+
+
+def test_failed_task_still_makes_the_process_warm() -> None:
+    def unreachable() -> None:
+        raise ConnectionError("no route to the Gateway")
+
+    warmer = StartupWarmer(started_at=time.perf_counter())
+    warmer.start({"gateway_url": unreachable, "models": lambda: None})
+    assert warmer.wait(5)
+    assert warmer.errors == {"gateway_url": "no route to the Gateway"}
+
+
+def test_ping_endpoint_is_busy_while_the_app_serves_cold() -> None:
+    release = threading.Event()
+    warmer = StartupWarmer(started_at=time.perf_counter())
+    warmer.start({"models": gated(release)})
+    timeout = settings.runtime.prewarm_timeout_seconds
+    settings.runtime.prewarm_timeout_seconds = 0.2
+    try:
+        with (
+            mock.patch.object(runtime_handler, "warmer", warmer),
+            TestClient(runtime_handler.app) as client,
+        ):
+            assert client.get("/ping").json()["status"] == PingStatus.HEALTHY_BUSY.value
+            release.set()
+            assert warmer.wait(5)
+            assert client.get("/ping").json()["status"] == PingStatus.HEALTHY.value
+    finally:
+        settings.runtime.prewarm_timeout_seconds = timeout
+        release.set()
+
+
+def test_lifespan_returns_once_warm_or_timed_out() -> None:
+    release = threading.Event()
+    warmer = StartupWarmer(started_at=time.perf_counter())
+    warmer.start({"models": gated(release)})
+    timeout = settings.runtime.prewarm_timeout_seconds
+    settings.runtime.prewarm_timeout_seconds = 0.2
+    try:
+        with mock.patch.object(runtime_handler, "warmer", warmer):
+            started = time.perf_counter()
+            with TestClient(runtime_handler.app):
+                waited = time.perf_counter() - started
+            assert 0.2 <= waited < 2
+            assert not warmer.ready
+
+            release.set()
+            assert warmer.wait(5)
+            started = time.perf_counter()
+            with TestClient(runtime_handler.app):
+                waited = time.perf_counter() - started
+            assert waited < 0.2
+    finally:
+        settings.runtime.prewarm_timeout_seconds = timeout
+        release.set()
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} startup tests passed")
+
+
+if __name__ == "__main__":
+    main()
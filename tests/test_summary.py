@@ -0,0 +1,200 @@
+import itertools
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from bedrock_agentcore.memory.constants import BlobMessage, ConversationalMessage, MessageRole
+from loguru import logger
+
+from agentcore_agents.config import settings
+from agentcore_agents.memory.hooks import MemoryHookProvider
+from agentcore_agents.memory.summary import ConversationSummarizer, Turn, load_summary
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeMemorySession:
+    """Events with increasing timestamps, listed newest first like ListEvents."""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._ids = itertools.count()
+
+    def add_turns(
+        self,
+        messages: list[ConversationalMessage | BlobMessage],
+        *,
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        payload = [
+            {"blob": m.data}
+            if isinstance(m, BlobMessage)
+            else {"conversational": {"role": m.role.value, "content": {"text": m.text}}}
+            for m in messages
+        ]
+        event_id = str(next(self._ids))
+        self.events.append(
+            {
+                "eventId": event_id,
+                "eventTimestamp": START + timedelta(seconds=int(event_id)),
+                "payload": payload,
+                "metadata": metadata or {},
+            }
+        )
+        return {"eventId": event_id}
+
+    def list_events(
+        self, *, eventMetadata: list[Any] | None = None, max_results: int = 100
+    ) -> list[dict[str, Any]]:
+        wanted = {
+            f["left"]["metadataKey"]: f["right"]["metadataValue"]["stringValue"]
+            for f in eventMetadata or []
+        }
+        events = [
+            event
+            for event in reversed(self.events)
+            if all(
+                event["metadata"].get(key, {}).get("stringValue") == value
+                for key, value in wanted.items()
+            )
+        ]
+        return events[:max_results]
+
+    def get_last_k_turns(self, k: int = 5) -> list[list[Any]]:
+        raise AssertionError("history with a summarizer is read from the events")
+
+    def delete_event(self, event_id: str) -> None:
+        self.events = [event for event in self.events if event["eventId"] != event_id]
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+
+def summarize(previous: str, turns: list[Turn]) -> str:
+    # Keeps the folded questions, so the test can see which turns the summary covers
+    return " ".join([previous, *(turn[0][2] for turn in turns)]).strip()
+
+
+def store_turn(memory: FakeMemorySession, number: int) -> None:
+    memory.add_turns(
+        [
+            ConversationalMessage(f"q{number}", MessageRole.USER),
+            ConversationalMessage(f"a{number}", MessageRole.ASSISTANT),
+        ]
+    )
+
+
+def loaded_questions(memory: FakeMemorySession, summarizer: ConversationSummarizer) -> list[str]:
+    hook = MemoryHookProvider(
+        memory_session=memory,
+        actor_id="actor",
+        session_id="session",
+        summarizer=summarizer,
+    )
+    agent = FakeAgent()
+    hook._load_conversation_history(SimpleNamespace(agent=agent))
+    return [
+        block["text"]
+        for message in agent.messages
+        if message["role"] == "user"
+        for block in message["content"]
+        if block["text"].startswith("q")
+    ]
+
+
+def test_history_and_summary_cover_every_turn_across_folds() -> None:
+    memory = FakeMemorySession()
+    summarizer = ConversationSummarizer(summarize=summarize, workers=1)
+    config = settings.summary
+    folds = 0
+    for number in range(1, 3 * (config.recent_turns + config.fold_turns)):
+        store_turn(memory, number)
+        folds += summarizer.fold(memory) is not None
+
+        summary = load_summary(memory)
+        summarized = summary.text.split() if summary else []
+        history = loaded_questions(memory, summarizer)
+        assert summarized + history == [f"q{i}" for i in range(1, number + 1)], number
+        assert len(history) < config.recent_turns + config.fold_turns
+    assert folds >= 2
+
+
+def test_fold_waits_for_fold_turns_beyond_recent_turns() -> None:
+    memory = FakeMemorySession()
+    summarizer = ConversationSummarizer(summarize=summarize, workers=1)
+    config = settings.summary
+    threshold = config.recent_turns + config.fold_turns
+    for number in range(1, threshold):
+        store_turn(memory, number)
+        assert summarizer.fold(memory) is None
+
+    store_turn(memory, threshold)
+    summary = summarizer.fold(memory)
+    assert summary is not None
+    assert summary.folded_turns == config.fold_turns
+    assert loaded_questions(memory, summarizer) == [
+        f"q{i}" for i in range(config.fold_turns + 1, threshold + 1)
+    ]
+
+
+class CountingSummarizer(ConversationSummarizer):
+    def __init__(self) -> None:
+        super().__init__(summarize=summarize, workers=1)
+        self.saved = 0
+
+    def turn_saved(self, memory_session: Any, actor_id: str, session_id: str) -> None:
+        self.saved += 1
+
+
+def test_turn_counted_once_when_the_agent_calls_tools() -> None:
+    summarizer = CountingSummarizer()
+    hook = MemoryHookProvider(
+        memory_session=FakeMemorySession(),
+        actor_id="actor",
+        session_id="session",
+        summarizer=summarizer,
+    )
+    agent = FakeAgent()
+    tool_use = {"toolUseId": "1", "name": "calculator", "input": {"expression": "6 * 7"}}
+    messages: list[dict[str, Any]] = [
+        {"role": "user", "content": [{"text": "What is 6 times 7?"}]},
+        {"role": "assistant", "content": [{"text": "Let me calculate."}, {"toolUse": tool_use}]},
+        {"role": "user", "content": [{"toolResult": {"toolUseId": "1", "content": []}}]},
+        {"role": "assistant", "content": [{"text": "6 times 7 is 42."}]},
+    ]
+    for message in messages:
+        agent.messages.append(message)
+        hook._save_message(SimpleNamespace(agent=agent))
+
+    assert summarizer.saved == 1
+
+
+def test_worker_pool_starts_with_the_first_fold() -> None:
+    memory = FakeMemorySession()
+    summarizer = ConversationSummarizer(summarize=summarize, workers=1)
+    config = settings.summary
+    for number in range(1, config.recent_turns + config.fold_turns + 1):
+        store_turn(memory, number)
+    # A summarizer that is built but never used, like a disabled one, starts no threads
+    assert summarizer._executor is None
+
+    summarizer.turn_saved(memory, "actor", "session")
+    executor = summarizer._executor
+    assert executor is not None
+    executor.shutdown(wait=True)
+    summary = load_summary(memory)
+    assert summary is not None and summary.folded_turns == config.fold_turns
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} summary tests passed")
+
+
+if __name__ == "__main__":
+    main()
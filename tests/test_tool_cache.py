@@ -0,0 +1,160 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.tools.cache import (
+    USE_TOOL_CACHE,
+    CachedTool,
+    CachePolicy,
+    ToolResultCache,
+    cache_tools,
+    get_cache_policy,
+)
+from agentcore_agents.tools.wrappers import make_tool_result, tool_result_text
+
+
+class FakeTool(AgentTool):
+    """Answers each call with the next text of its script, or the last one once it runs out."""
+
+    def __init__(self, name: str, script: list[tuple[str, str]]) -> None:
+        super().__init__()
+        self.name = name
+        self.script = script
+        self.calls = 0
+
+    @property
+    def tool_name(self) -> str:
+        return f"AgentTools___{self.name}"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.tool_name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        text, status = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        yield ToolResultEvent(make_tool_result(tool_use, text, status=status))
+
+
+def cache() -> ToolResultCache:
+    return ToolResultCache(max_entries=16, max_bytes=1024 * 1024)
+
+
+def call(
+    tool: CachedTool,
+    tool_input: dict[str, Any],
+    tool_use_id: str = "1",
+    invocation_state: dict[str, Any] | None = None,
+) -> ToolResult:
+    tool_use: ToolUse = {"toolUseId": tool_use_id, "name": tool.tool_name, "input": tool_input}
+    return asyncio.run(tool.call(tool_use, invocation_state or {}))
+
+
+def test_key_is_stable_across_argument_order() -> None:
+    first = ToolResultCache.make_key("calculator", {"a": 1, "b": {"y": 2, "x": 3}})
+    second = ToolResultCache.make_key("calculator", {"b": {"x": 3, "y": 2}, "a": 1})
+    assert first == second
+    assert first != ToolResultCache.make_key("calculator", {"a": 1, "b": {"x": 3, "y": 4}})
+    assert first != ToolResultCache.make_key("other", {"a": 1, "b": {"x": 3, "y": 2}})
+
+
+def test_repeated_call_is_served_from_the_cache() -> None:
+    fake = FakeTool("calculator", [("42", "success"), ("43", "success")])
+    tool = CachedTool(fake, CachePolicy("always"), cache())
+    hits = metrics.counter("tool_cache.hits", tool="calculator")
+
+    assert tool_result_text(call(tool, {"expression": "6 * 7", "precision": 2})) == "42"
+    result = call(tool, {"precision": 2, "expression": "6 * 7"}, tool_use_id="2")
+    assert tool_result_text(result) == "42"
+    # The cached result answers the new tool use
+    assert result["toolUseId"] == "2"
+    assert fake.calls == 1
+    assert metrics.counter("tool_cache.hits", tool="calculator") == hits + 1
+
+    assert tool_result_text(call(tool, {"expression": "6 * 8"})) == "43"
+    assert fake.calls == 2
+
+
+def test_ttl_entry_expires() -> None:
+    fake = FakeTool("read_s3_document", [("v1", "success"), ("v2", "success")])
+    tool = CachedTool(fake, CachePolicy("ttl", 0.05), cache())
+
+    assert tool_result_text(call(tool, {"key": "report.txt"})) == "v1"
+    assert tool_result_text(call(tool, {"key": "report.txt"})) == "v1"
+    time.sleep(0.06)
+    assert tool_result_text(call(tool, {"key": "report.txt"})) == "v2"
+    assert fake.calls == 2
+
+
+def test_error_results_are_not_cached() -> None:
+    for text, status in [
+        ("Tool execution failed: timeout", "error"),
+        (json.dumps({"error": "NoSuchKey"}), "success"),
+        (json.dumps({"result": "Error: division by zero"}), "success"),
+        ("Error: division by zero", "success"),
+    ]:
+        fake = FakeTool("calculator", [(text, status), ("42", "success")])
+        tool = CachedTool(fake, CachePolicy("always"), cache())
+        assert tool_result_text(call(tool, {"expression": "6 * 7"})) == text
+        assert tool_result_text(call(tool, {"expression": "6 * 7"})) == "42"
+        assert tool_result_text(call(tool, {"expression": "6 * 7"})) == "42"
+        assert fake.calls == 2, text
+
+
+def test_invocation_can_bypass_the_cache() -> None:
+    fake = FakeTool("calculator", [("42", "success"), ("43", "success")])
+    tool = CachedTool(fake, CachePolicy("always"), cache())
+    call(tool, {"expression": "6 * 7"})
+
+    result = call(tool, {"expression": "6 * 7"}, invocation_state={USE_TOOL_CACHE: False})
+    assert tool_result_text(result) == "43"
+    # A bypassed call neither reads nor refreshes the cache
+    assert tool_result_text(call(tool, {"expression": "6 * 7"})) == "42"
+
+
+def test_policies_decide_which_tools_are_wrapped() -> None:
+    assert get_cache_policy("calculator") == CachePolicy("always")
+    assert get_cache_policy("read_s3_document") == CachePolicy("ttl", 300.0)
+    assert not get_cache_policy("get_current_time").cacheable
+    assert not get_cache_policy("unlisted_tool").cacheable
+
+    tools = [FakeTool(name, [("", "success")]) for name in ("calculator", "get_current_time")]
+    wrapped = cache_tools(list(tools))
+    assert isinstance(wrapped[0], CachedTool)
+    assert wrapped[1] is tools[1]
+
+
+def test_cache_evicts_least_recently_used_results() -> None:
+    results = ToolResultCache(max_entries=2, max_bytes=1024 * 1024)
+    keys = [results.make_key("calculator", {"expression": str(i)}) for i in range(3)]
+    for key in keys[:2]:
+        results.put_result(key, {"toolUseId": "1", "status": "success", "content": []}, None)
+    results.get(keys[0])
+    results.put_result(keys[2], {"toolUseId": "1", "status": "success", "content": []}, None)
+
+    assert results.get(keys[1]) is None
+    assert results.get(keys[0]) is not None and results.get(keys[2]) is not None
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} tool cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
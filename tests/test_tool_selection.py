@@ -0,0 +1,210 @@
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from loguru import logger
+from strands import Agent
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+
+from agentcore_agents.agent import StrandsAgentWrapper
+from agentcore_agents.config import settings
+from agentcore_agents.observability.metrics import metrics
+from agentcore_agents.observability.tracing import StageTracer
+from agentcore_agents.tools.selection import (
+    GATEWAY_SEARCH_TOOL,
+    GatewayToolSearch,
+    LocalToolIndex,
+    ToolSelector,
+    build_tool_selector,
+)
+from agentcore_agents.tools.truncation import CONTINUATION_TOOL, continuation_tools
+from agentcore_agents.tools.wrappers import make_tool_result
+
+CATALOG = {
+    "calculator": ("Evaluates a mathematical expression", {"expression": "Expression to evaluate"}),
+    "get_current_time": ("Returns the current date and time", {"timezone": "IANA time zone"}),
+    "read_s3_document": ("Reads a document from an S3 bucket", {"bucket": "", "key": "Object"}),
+    "get_weather": ("Returns the weather forecast for a city", {"city": "City name"}),
+    "send_email": ("Sends an email message to a recipient", {"recipient": "Email address"}),
+}
+
+
+class GatewayTool(AgentTool):
+    def __init__(self, name: str, description: str, parameters: dict[str, str]) -> None:
+        super().__init__()
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+
+    @property
+    def tool_name(self) -> str:
+        return f"AgentTools___{self.name}"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        properties = {
+            name: {"type": "string", "description": d} for name, d in self.parameters.items()
+        }
+        return {
+            "name": self.tool_name,
+            "description": self.description,
+            "inputSchema": {"json": {"type": "object", "properties": properties}},
+        }
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        yield ToolResultEvent(make_tool_result(tool_use, "ok"))
+
+
+class FakeMCPClient:
+    """Answers Gateway search calls with `result`, or raises it if it is an exception."""
+
+    def __init__(self, result: dict[str, Any] | Exception) -> None:
+        self.result = result
+
+    def call_tool_sync(self, tool_use_id: str, name: str, arguments: dict[str, Any]) -> Any:
+        assert name == f"AgentTools___{GATEWAY_SEARCH_TOOL}"
+        assert arguments["query"]
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def catalog() -> list[AgentTool]:
+    return [GatewayTool(name, *spec) for name, spec in CATALOG.items()]
+
+
+def gateway_search(result: dict[str, Any] | Exception) -> GatewayToolSearch:
+    client = FakeMCPClient(result)
+    return GatewayToolSearch(lambda: client, f"AgentTools___{GATEWAY_SEARCH_TOOL}")
+
+
+def names(tools: list[AgentTool]) -> list[str]:
+    return [tool.tool_name.removeprefix("AgentTools___") for tool in tools]
+
+
+@contextmanager
+def tool_selection(**overrides: Any) -> Iterator[None]:
+    config = settings.tool_selection
+    saved = {name: getattr(config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def test_local_index_ranks_the_matching_tools_first() -> None:
+    index = LocalToolIndex(catalog())
+    assert len(index) == len(CATALOG)
+
+    ranked = index.search("What will the weather be in Paris tomorrow?", top_k=2)
+    assert len(ranked) == 2
+    assert ranked[0][0] == "AgentTools___get_weather"
+    assert ranked[0][1] > ranked[1][1]
+    # Parameter descriptions are indexed too
+    assert index.search("which IANA zone", top_k=1)[0][0] == "AgentTools___get_current_time"
+
+
+def test_selector_exposes_the_top_k_tools() -> None:
+    selector = ToolSelector(catalog(), LocalToolIndex(catalog()))
+    with tool_selection(top_k=2, fallback_min_score=0.1):
+        selected = selector.select("Evaluate the mathematical expression 6 * 7")
+    assert len(selected) <= 2
+    assert names(selected)[0] == "calculator"
+
+
+def test_selector_falls_back_to_all_tools() -> None:
+    selector = ToolSelector(catalog(), LocalToolIndex(catalog()))
+    metrics.reset()
+    with tool_selection(top_k=2, fallback_min_score=0.1):
+        # Nothing in the catalog matches, so the best score is 0
+        assert names(selector.select("Bonjour !")) == list(CATALOG)
+    assert metrics.counter("tool_selection.fallback") == 1
+
+    # A catalog no bigger than top_k is exposed whole without searching
+    with tool_selection(top_k=len(CATALOG), fallback_min_score=0.1):
+        assert names(selector.select("weather in Paris")) == list(CATALOG)
+    with tool_selection(top_k=2, fallback_min_score=2.0):
+        assert names(selector.select("weather in Paris")) == list(CATALOG)
+    assert metrics.counter("tool_selection.fallback") == 2
+
+
+def test_gateway_search_reads_structured_and_text_results() -> None:
+    structured = {"structuredContent": {"tools": [{"name": "get_weather"}, {"name": "x"}]}}
+    assert gateway_search(structured).search("weather", top_k=3) == [
+        ("get_weather", 1.0),
+        ("x", 0.5),
+    ]
+    text = {"content": [{"text": json.dumps({"tools": [{"name": "calculator"}]})}]}
+    assert gateway_search(text).search("6 * 7", top_k=3) == [("calculator", 1.0)]
+    assert gateway_search({"content": [{"text": "not json"}]}).search("6 * 7", top_k=3) is None
+    assert gateway_search({"status": "error", "content": []}).search("6 * 7", top_k=3) is None
+    assert gateway_search(ConnectionError("reset")).search("6 * 7", top_k=3) is None
+
+
+def test_selector_resolves_gateway_results_and_falls_back_when_search_fails() -> None:
+    # The Gateway returns target-prefixed names, or bare ones
+    structured = {"structuredContent": {"tools": [{"name": "get_weather"}, {"name": "unknown"}]}}
+    with tool_selection(top_k=2, fallback_min_score=0.1):
+        selector = ToolSelector(catalog(), gateway_search(structured))
+        assert names(selector.select("weather in Paris")) == ["get_weather"]
+
+        failing = ToolSelector(catalog(), gateway_search(ConnectionError("reset")))
+        assert names(failing.select("weather in Paris")) == list(CATALOG)
+
+
+def test_build_tool_selector_keeps_the_search_tool_out_of_the_catalog() -> None:
+    tools = [*catalog(), GatewayTool(GATEWAY_SEARCH_TOOL, "Searches the tools", {"query": ""})]
+    with tool_selection(enabled=False):
+        assert build_tool_selector(tools, lambda: None) is None
+    with tool_selection(enabled=True, strategy="gateway"):
+        selector = build_tool_selector(tools, lambda: None)
+        assert selector is not None and isinstance(selector.search, GatewayToolSearch)
+        assert names(list(selector.tools.values())) == list(CATALOG)
+    with tool_selection(enabled=True, strategy="gateway"):
+        selector = build_tool_selector(catalog(), lambda: None)
+        assert selector is not None and isinstance(selector.search, LocalToolIndex)
+
+
+def test_agent_gets_a_registry_of_the_selected_tools() -> None:
+    tools = catalog()
+    wrapper = StrandsAgentWrapper.__new__(StrandsAgentWrapper)
+    wrapper.tracer = StageTracer(enabled=False)
+    wrapper.tool_selector = ToolSelector(tools, LocalToolIndex(tools))
+    wrapper.continuation_tools = continuation_tools()
+    wrapper.agent = Agent(tools=[*tools, *wrapper.continuation_tools], callback_handler=None)
+
+    with tool_selection(top_k=1, fallback_min_score=0.1):
+        wrapper._select_tools("What will the weather be in Paris?")
+        assert wrapper.agent.tool_names == ["AgentTools___get_weather", CONTINUATION_TOOL]
+        assert set(wrapper.agent.tool_registry.get_all_tools_config()) == {
+            "AgentTools___get_weather",
+            CONTINUATION_TOOL,
+        }
+        # The next prompt starts from the whole catalog again
+        wrapper._select_tools("Evaluate the expression 6 * 7")
+        assert wrapper.agent.tool_names == ["AgentTools___calculator", CONTINUATION_TOOL]
+        wrapper._select_tools("Bonjour !")
+        assert len(wrapper.agent.tool_names) == len(CATALOG) + 1
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} tool selection tests passed")
+
+
+if __name__ == "__main__":
+    main()
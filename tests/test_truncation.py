@@ -0,0 +1,156 @@
+import asyncio
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from agentcore_agents.config import settings
+from agentcore_agents.tools.truncation import (
+    CONTINUATION_TOOL,
+    ToolOutputReader,
+    ToolOutputStore,
+    TruncatingTool,
+    token_chars,
+    truncate_text,
+)
+from agentcore_agents.tools.wrappers import make_tool_result, tool_result_text
+
+TOOL_SCHEMA = Path(__file__).parent.parent / "src/agentcore_agents/lambda/tool_schema.json"
+NOTE = re.compile(r'handle "([0-9a-f]{32})" and offset (\d+)')
+LINES = "".join(f"line {i:04d} of the quarterly report\n" for i in range(400))
+
+
+class TextTool(AgentTool):
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self.text = text
+
+    @property
+    def tool_name(self) -> str:
+        return "AgentTools___read_s3_document"
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return {"name": self.tool_name, "description": "", "inputSchema": {"json": {}}}
+
+    @property
+    def tool_type(self) -> str:
+        return "python"
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        yield ToolResultEvent(make_tool_result(tool_use, self.text))
+
+
+def store() -> ToolOutputStore:
+    return ToolOutputStore(max_bytes=1024 * 1024, ttl_seconds=60)
+
+
+def truncated(text: str, max_tokens: int, output_store: ToolOutputStore | None) -> str:
+    tool = TruncatingTool(TextTool(text), max_tokens, output_store)
+    tool_use: ToolUse = {"toolUseId": "1", "name": tool.tool_name, "input": {}}
+    return tool_result_text(asyncio.run(tool.call(tool_use, {})))
+
+
+def read(reader: ToolOutputReader, handle: str, offset: Any) -> ToolResult:
+    tool_use: ToolUse = {
+        "toolUseId": "2",
+        "name": CONTINUATION_TOOL,
+        "input": {"handle": handle, "offset": offset},
+    }
+    return reader.read(tool_use)
+
+
+def test_result_at_the_limit_is_kept_whole() -> None:
+    text = "x" * token_chars(100)
+    assert truncated(text, 100, store()) == text
+    assert truncated(text + "x", 100, store()) != text + "x"
+
+
+def test_truncated_result_keeps_head_and_tail_within_the_limit() -> None:
+    output_store = store()
+    text = truncate_text(LINES, 100, 0.8, output_store)
+    head, _, rest = text.partition("\n...\n")
+    note, _, tail = rest.partition("\n...\n")
+
+    budget = token_chars(100)
+    assert len(head) + len(tail) <= budget
+    assert len(head) <= int(budget * 0.8)
+    # Both cuts fall on line breaks
+    assert LINES.startswith(head) and head.endswith("\n")
+    assert LINES.endswith(tail) and tail.startswith("line ")
+
+    match = NOTE.search(note)
+    assert match is not None
+    handle, offset = match.group(1), int(match.group(2))
+    assert offset == len(head)
+    assert output_store.get(handle) == LINES
+    assert f"{len(LINES) - len(head) - len(tail)} more characters" in note
+
+
+def test_without_a_store_the_note_has_no_handle() -> None:
+    text = truncate_text(LINES, 100, 0.8, None)
+    assert "characters omitted from the middle" in text
+    assert NOTE.search(text) is None
+
+
+def test_reader_returns_chunks_that_rebuild_the_result() -> None:
+    output_store = store()
+    reader = ToolOutputReader(output_store, chunk_tokens=200)
+    text = truncate_text(LINES, 100, 0.8, output_store)
+    head = text.partition("\n...\n")[0]
+    match = NOTE.search(text)
+    assert match is not None
+
+    handle, offset = match.group(1), int(match.group(2))
+    chunks = []
+    while True:
+        result = read(reader, handle, offset)
+        assert result["status"] == "success"
+        chunk = tool_result_text(result)
+        match = NOTE.search(chunk)
+        if match is None:
+            chunks.append(chunk)
+            break
+        body = chunk[: chunk.rindex("\n[")]
+        assert len(body) == token_chars(200)
+        chunks.append(body)
+        offset = int(match.group(2))
+    assert head + "".join(chunks) == LINES
+    assert len(chunks) == -(-(len(LINES) - len(head)) // token_chars(200))
+
+
+def test_reader_rejects_unknown_handles_and_bad_offsets() -> None:
+    output_store = store()
+    reader = ToolOutputReader(output_store, chunk_tokens=200)
+    handle = output_store.put(LINES)
+
+    for bad_handle in ["0" * 32, "../etc/passwd", ""]:
+        result = read(reader, bad_handle, 0)
+        assert result["status"] == "error"
+        assert "no stored tool result" in tool_result_text(result)
+    assert read(reader, handle, "ten")["status"] == "error"
+    # A negative offset reads from the start
+    assert tool_result_text(read(reader, handle, -5)).startswith("line 0000")
+
+
+def test_token_limits_name_gateway_tools() -> None:
+    tools = {tool["name"] for tool in json.loads(TOOL_SCHEMA.read_text())["tools"]}
+    assert set(settings.tool_output.max_tokens) <= tools
+
+
+def main() -> None:
+    tests = [value for name, value in globals().items() if name.startswith("test_")]
+    for test in tests:
+        test()
+        logger.info(f"✓ {test.__name__}")
+    logger.info(f"All {len(tests)} truncation tests passed")
+
+
+if __name__ == "__main__":
+    main()